@@ -0,0 +1,167 @@
+"""
+Benchmark for the ledger verifier on a large generated ledger.
+
+Loads a valid hash chain of N votes into a scratch schema with
+COPY, then runs a full verification in a fresh child process
+and reports rows/s and peak RSS. --fetchall also runs the old
+fetch-everything verifier for comparison.
+
+Usage:
+    DATABASE_URL=... python bench_verify_ledger.py [--fetchall] [votes]
+
+Defaults to 1,000,000 votes. Linux only (ru_maxrss in KiB).
+"""
+
+import sys
+import time
+import resource
+import multiprocessing
+from datetime import datetime, timedelta
+
+from psycopg2 import sql
+
+from hoa_voting_app import (
+    get_conn, ensure_schema_objects, verify_vote_chain,
+    compute_vote_hash, GENESIS_HASH, IterStream
+)
+from scratch_estate import create_scratch_schema, drop_scratch_schema
+
+SCRATCH_SCHEMA = "ledger_bench_scratch"
+
+TOPICS = 10
+
+def vote_lines(votes):
+    """
+    COPY text lines for a valid chain of the given length.
+    """
+    prev_hash = GENESIS_HASH
+    started = datetime(2026, 1, 1)
+
+    for n in range(1, votes + 1):
+        topic_id = n % TOPICS + 1
+        erf = f"E{n // TOPICS + 1}"
+        option_id = topic_id * 2 - n % 2
+        ts = (started + timedelta(microseconds=n * 137)).strftime(
+            "%Y-%m-%dT%H:%M:%S.%f"
+        )
+
+        vote_hash = compute_vote_hash(
+            prev_hash, erf, topic_id, option_id, 1, ts
+        )
+
+        yield (
+            f"{topic_id}\t{erf}\t{option_id}\t1\t"
+            f"{prev_hash}\t{vote_hash}\t{ts}\n"
+        )
+        prev_hash = vote_hash
+
+def load_ledger(conn, votes):
+    create_scratch_schema(conn, SCRATCH_SCHEMA)
+    cur = conn.cursor()
+
+    ensure_schema_objects(cur, SCRATCH_SCHEMA)
+
+    started = time.perf_counter()
+    cur.copy_expert(
+        "COPY votes (topic_id, erf, option_id, weight, "
+        "prev_hash, vote_hash, timestamp) FROM STDIN",
+        IterStream(vote_lines(votes))
+    )
+    cur.execute("ANALYZE votes")
+    conn.commit()
+
+    return time.perf_counter() - started
+
+def fetchall_verifier(cur):
+    """
+    The verifier before streaming: every row as a dict in memory.
+    """
+    cur.execute("SELECT * FROM votes ORDER BY id")
+    votes = cur.fetchall()
+
+    prev_hash = GENESIS_HASH
+
+    for v in votes:
+        ts = v["timestamp"]
+        hash_ts = ts if isinstance(ts, str) else ts.strftime(
+            "%Y-%m-%dT%H:%M:%S.%f"
+        )
+
+        expected = compute_vote_hash(
+            prev_hash, v["erf"], v["topic_id"],
+            v["option_id"], v["weight"], hash_ts
+        )
+        if expected != v["vote_hash"]:
+            return len(votes), v["id"]
+
+        prev_hash = v["vote_hash"]
+
+    return len(votes), None
+
+def run_verifier(name, results):
+    # Fresh process: ru_maxrss starts at the forked RSS
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        sql.SQL("SET search_path TO {}, public").format(
+            sql.Identifier(SCRATCH_SCHEMA)
+        )
+    )
+
+    started = time.perf_counter()
+    if name == "streaming":
+        checked, broken_id = verify_vote_chain(cur, full=True)
+    else:
+        checked, broken_id = fetchall_verifier(cur)
+    elapsed = time.perf_counter() - started
+
+    conn.rollback()
+    conn.close()
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((name, checked, broken_id, elapsed, rss_before, rss_after))
+
+def main():
+    args = sys.argv[1:]
+    verifiers = ["streaming"]
+    if "--fetchall" in args:
+        verifiers.append("fetchall")
+    args = [a for a in args if a != "--fetchall"]
+
+    votes = int(args[0]) if args else 1_000_000
+
+    conn = get_conn()
+
+    try:
+        print(f"Loading {votes} votes...")
+        print(f"Loaded in {load_ledger(conn, votes):.1f}s")
+
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+
+        for name in verifiers:
+            child = ctx.Process(target=run_verifier, args=(name, results))
+            child.start()
+            name, checked, broken_id, elapsed, before, after = results.get()
+            child.join()
+
+            print(
+                f"{name:>9}: {checked} rows in {elapsed:.1f}s "
+                f"({checked / elapsed:.0f} rows/s), "
+                f"peak RSS {after / 1024:.0f} MiB "
+                f"(+{(after - before) / 1024:.0f} MiB)"
+            )
+
+            if broken_id is not None or checked != votes:
+                print(f"FAILED: broken at {broken_id}, checked {checked}")
+                sys.exit(1)
+
+    finally:
+        conn.rollback()
+        drop_scratch_schema(conn, SCRATCH_SCHEMA)
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Parity check: compute_vote_weights() against the legacy per-ERF
+rules, on randomly generated estates in a scratch schema.
+
+Usage:
+    DATABASE_URL=... python check_vote_weights.py [estates] [seed]
+
+Exits non-zero on the first mismatch.
+"""
+
+import sys
+import random
+
+from hoa_voting_app import get_conn, compute_vote_weights
+from scratch_estate import (
+    create_scratch_schema, drop_scratch_schema, generate_estate
+)
+
+SCRATCH_SCHEMA = "weight_parity_scratch"
+
+def legacy_vote_weight(cur, erf):
+    """
+    The original per-ERF implementation, kept verbatim as the
+    reference for the set-based query.
+    """
+    # Developer vote
+    if erf == "DEVELOPER":
+        cur.execute(
+            "SELECT is_active, base_votes, proxy_count FROM developer_settings LIMIT 1"
+        )
+        settings = cur.fetchone()
+        if not settings or not settings["is_active"]:
+            return 0
+
+        cur.execute(
+            "SELECT COUNT(*) AS c FROM developer_proxies"
+        )
+        proxy_count = cur.fetchone()["c"]
+
+        return (
+            settings["base_votes"]
+            + proxy_count
+        )
+
+    # Developer proxies cannot vote
+    cur.execute(
+        "SELECT 1 FROM developer_proxies WHERE erf=%s",
+        (erf,)
+    )
+    if cur.fetchone():
+        return 0
+
+    # Owner proxies cannot vote
+    cur.execute(
+        "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
+        (erf,)
+    )
+    if cur.fetchone():
+        return 0
+
+    weight = 1
+
+    cur.execute(
+        "SELECT proxies FROM registrations WHERE erf=%s",
+        (erf,)
+    )
+    reg = cur.fetchone()
+
+    if reg:
+        weight += reg["proxies"]
+
+    return weight
+
+def check_estate(conn, rng):
+    create_scratch_schema(conn, SCRATCH_SCHEMA)
+    erfs = generate_estate(conn, rng, owners=rng.randint(1, 400))
+
+    cur = conn.cursor()
+
+    # All registrations (erfs=None)
+    cur.execute("SELECT erf FROM registrations")
+    registered = [r["erf"] for r in cur.fetchall()]
+
+    bulk = compute_vote_weights(cur)
+    legacy = {e: legacy_vote_weight(cur, e) for e in registered}
+
+    if bulk != legacy:
+        return bulk, legacy
+
+    # Explicit list, including unregistered and unknown ERFs
+    sample = rng.sample(erfs, min(len(erfs), 50))
+    sample += ["DEVELOPER", "NO-SUCH-ERF"]
+
+    bulk = compute_vote_weights(cur, sample)
+    legacy = {e: legacy_vote_weight(cur, e) for e in sample}
+
+    if bulk != legacy:
+        return bulk, legacy
+
+    return None
+
+def main():
+    estates = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else random.randrange(1 << 30)
+
+    rng = random.Random(seed)
+    conn = get_conn()
+
+    print(f"Checking {estates} estates (seed {seed})...")
+
+    try:
+        for n in range(1, estates + 1):
+            mismatch = check_estate(conn, rng)
+
+            if mismatch:
+                bulk, legacy = mismatch
+                diff = {
+                    e: (bulk.get(e), legacy.get(e))
+                    for e in set(bulk) | set(legacy)
+                    if bulk.get(e) != legacy.get(e)
+                }
+                print(f"MISMATCH in estate {n}: {{erf: (bulk, legacy)}}")
+                print(diff)
+                sys.exit(1)
+
+        print(f"All {estates} estates match.")
+
+    finally:
+        conn.rollback()
+        drop_scratch_schema(conn, SCRATCH_SCHEMA)
+        conn.close()
+
+if __name__ == "__main__":
+    main()
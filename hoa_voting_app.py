@@ -1,18 +1,41 @@
 import os
 import csv
+import hmac
+import time
 import random
+import select
 import string
+import json
 import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, date
-from io import StringIO, BytesIO
+from io import StringIO, BytesIO, TextIOWrapper
+from itertools import chain
+from queue import Queue, Empty, Full
+from contextlib import contextmanager, closing
+from concurrent.futures import ThreadPoolExecutor
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.extensions import connection as PgConnection
+from psycopg2.extensions import cursor as TupleCursor
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.pool import ThreadedConnectionPool
 from flask import (
     Flask, request, redirect, url_for,
-    render_template_string, send_file,
-    flash, session, abort
+    render_template, send_file,
+    flash, session, abort, g, jsonify,
+    has_app_context, Response, stream_with_context
 )
+from werkzeug.security import generate_password_hash, check_password_hash
+
+try:
+    import qrcode
+    from qrcode.image.pure import PyPNGImage
+except ImportError:
+    qrcode = None
 
 # ======================================================
 # Configuration (Render + Supabase)
@@ -21,21 +44,487 @@ from flask import (
 DATABASE_URL = os.environ["DATABASE_URL"]
 SECRET_KEY = os.environ.get("SECRET_KEY", "change-this-secret")
 
+# Connection pool sizing (per worker process)
+DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))
+
+# Seconds a request may wait for a free connection before 503
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "10"))
+
+# Idle seconds after which a pooled connection is pinged on checkout
+DB_POOL_PING_AFTER = float(os.environ.get("DB_POOL_PING_AFTER", "30"))
+
+# Admin emails (comma-separated) of the platform operators who
+# may read /admin/stats; process-wide figures span every HOA
+STATS_OPERATORS = {
+    e.strip()
+    for e in os.environ.get("STATS_OPERATORS", "").split(",")
+    if e.strip()
+}
+
+# Seconds the in-memory HOA registry is trusted before reloading
+TENANT_CACHE_TTL = float(os.environ.get("TENANT_CACHE_TTL", "60"))
+
+# CSV exports: rows fetched per server-side cursor round trip,
+# and characters buffered before a chunk is sent
+EXPORT_ITERSIZE = int(os.environ.get("EXPORT_ITERSIZE", "2000"))
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", "65536"))
+
+# Owners page: rows per page and seconds a total count is reused
+OWNERS_PAGE_SIZE = int(os.environ.get("OWNERS_PAGE_SIZE", "100"))
+OWNER_COUNT_TTL = float(os.environ.get("OWNER_COUNT_TTL", "60"))
+
+# Per-topic ledger mode: seconds between cross-topic anchors and
+# connections used to verify topic chains in parallel
+LEDGER_ANCHOR_INTERVAL = float(os.environ.get("LEDGER_ANCHOR_INTERVAL", "60"))
+LEDGER_VERIFY_WORKERS = int(os.environ.get("LEDGER_VERIFY_WORKERS", "4"))
+
+# Votes fetched per round trip while verifying the ledger
+LEDGER_VERIFY_ITERSIZE = int(os.environ.get("LEDGER_VERIFY_ITERSIZE", "5000"))
+
+# Votes per Merkle block (vote inclusion proofs)
+MERKLE_BLOCK_SIZE = int(os.environ.get("MERKLE_BLOCK_SIZE", "256"))
+
+# Live dashboard (Server-Sent Events): on/off, seconds between
+# keep-alive comments and events buffered per open browser.
+# Off by default: when on, every vote transaction NOTIFYs, and
+# Postgres serializes the commits of notifying transactions
+# database-wide, which caps parallel (per-topic) vote appends.
+LIVE_UPDATES = os.environ.get("LIVE_UPDATES", "0") == "1"
+LIVE_KEEPALIVE = float(os.environ.get("LIVE_KEEPALIVE", "15"))
+LIVE_QUEUE_SIZE = int(os.environ.get("LIVE_QUEUE_SIZE", "1000"))
+
+# Admin passwords: werkzeug hash method and cost, threads that
+# run hash work, and logins allowed to wait for one before 503
+ADMIN_HASH_METHOD = os.environ.get("ADMIN_HASH_METHOD", "scrypt:32768:8:1")
+ADMIN_HASH_WORKERS = int(os.environ.get("ADMIN_HASH_WORKERS", "2"))
+ADMIN_HASH_QUEUE = int(os.environ.get("ADMIN_HASH_QUEUE", "16"))
+
+# Voter login throttling: token bucket per (HOA, ERF, client IP)
+# holding LOGIN_BURST attempts, refilled at LOGIN_RATE per minute.
+# LOGIN_LIMITER is "memory" (per worker process), "postgres"
+# (shared, in an unlogged table) or "off".
+LOGIN_LIMITER = os.environ.get("LOGIN_LIMITER", "memory")
+LOGIN_BURST = int(os.environ.get("LOGIN_BURST", "5"))
+LOGIN_RATE = float(os.environ.get("LOGIN_RATE", "6"))
+LOGIN_LIMITER_SIZE = int(os.environ.get("LOGIN_LIMITER_SIZE", "10000"))
+
+# Seconds a failed credential check is remembered
+LOGIN_FAILURE_TTL = float(os.environ.get("LOGIN_FAILURE_TTL", "30"))
+
+# QR check-in: rendered QR PNGs kept per worker process
+QR_CACHE_SIZE = int(os.environ.get("QR_CACHE_SIZE", "512"))
+
+# Cross-process cache invalidation via Postgres LISTEN/NOTIFY
+CACHE_NOTIFY = os.environ.get("CACHE_NOTIFY", "0") == "1"
+CACHE_NOTIFY_CHANNEL = os.environ.get("CACHE_NOTIFY_CHANNEL", "hoa_cache")
+
 app = Flask(__name__)
 app.secret_key = SECRET_KEY
 
 # ======================================================
-# DB helpers (NO GLOBAL CONNECTIONS)
+# DB helpers (POOLED, ONE CONNECTION PER REQUEST)
+#
+# Each worker process owns a bounded pool. A request checks
+# out a single connection on first use of get_conn() and
+# keeps it in flask.g; teardown_appcontext rolls back any
+# uncommitted work and returns it to the pool.
 # ======================================================
 
+class TenantConnection(PgConnection):
+    """
+    Connection that remembers which HOA schema its session
+    search_path is bound to, so it is only SET when it changes.
+    """
+    hoa_schema = None
+
+_pool = None
+_pool_pid = None
+_pool_slots = None
+_pool_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_last_used = {}
+
+POOL_STATS = {
+    "checkouts": 0,
+    "wait_total_ms": 0.0,
+    "wait_max_ms": 0.0,
+    "timeouts": 0,
+    "discarded": 0,
+}
+
+def get_pool():
+    global _pool, _pool_pid, _pool_slots
+
+    # Gunicorn forks workers: never share sockets across processes
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = ThreadedConnectionPool(
+                    DB_POOL_MIN,
+                    DB_POOL_MAX,
+                    DATABASE_URL,
+                    cursor_factory=RealDictCursor,
+                    connection_factory=TenantConnection
+                )
+                _pool_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+                _pool_pid = os.getpid()
+                _last_used.clear()
+
+    return _pool
+
+def _conn_is_healthy(conn):
+    if conn.closed:
+        return False
+
+    idle = time.monotonic() - _last_used.get(id(conn), 0)
+    if idle < DB_POOL_PING_AFTER:
+        return True
+
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def checkout_conn():
+    """
+    Takes a healthy connection from the pool, waiting at most
+    DB_POOL_TIMEOUT seconds for a free slot.
+    """
+    pool = get_pool()
+
+    started = time.perf_counter()
+    if not _pool_slots.acquire(timeout=DB_POOL_TIMEOUT):
+        with _stats_lock:
+            POOL_STATS["timeouts"] += 1
+        abort(503)
+    waited_ms = (time.perf_counter() - started) * 1000
+
+    try:
+        conn = pool.getconn()
+        while not _conn_is_healthy(conn):
+            _last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+            with _stats_lock:
+                POOL_STATS["discarded"] += 1
+            conn = pool.getconn()
+    except Exception:
+        _pool_slots.release()
+        raise
+
+    with _stats_lock:
+        POOL_STATS["checkouts"] += 1
+        POOL_STATS["wait_total_ms"] += waited_ms
+        POOL_STATS["wait_max_ms"] = max(
+            POOL_STATS["wait_max_ms"],
+            waited_ms
+        )
+
+    return conn
+
+def release_conn(conn):
+    broken = bool(conn.closed)
+
+    if not broken:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            broken = True
+
+    if broken:
+        _last_used.pop(id(conn), None)
+    else:
+        _last_used[id(conn)] = time.monotonic()
+
+    get_pool().putconn(conn, close=broken)
+    _pool_slots.release()
+
+@contextmanager
+def pooled_connection():
+    """
+    A second pooled connection, outside flask.g, for work done
+    in helper threads. Returned to the pool on exit.
+    """
+    conn = checkout_conn()
+    try:
+        yield conn
+    finally:
+        release_conn(conn)
+
 def get_conn():
-    return psycopg2.connect(
-        DATABASE_URL,
-        cursor_factory=RealDictCursor
+    # Scripts and CLI tools run outside Flask: plain connection
+    if not has_app_context():
+        return psycopg2.connect(
+            DATABASE_URL,
+            cursor_factory=RealDictCursor,
+            connection_factory=TenantConnection
+        )
+
+    if "db_conn" not in g:
+        g.db_conn = checkout_conn()
+
+    return g.db_conn
+
+@app.teardown_appcontext
+def teardown_conn(exc):
+    conn = g.pop("db_conn", None)
+    if conn is not None:
+        release_conn(conn)
+
+def get_pool_stats():
+    with _stats_lock:
+        stats = dict(POOL_STATS)
+
+    checkouts = stats["checkouts"]
+    stats["wait_avg_ms"] = (
+        round(stats["wait_total_ms"] / checkouts, 3)
+        if checkouts else 0.0
+    )
+    stats["pool_min"] = DB_POOL_MIN
+    stats["pool_max"] = DB_POOL_MAX
+
+    return stats
+
+# ======================================================
+# Tenant sessions
+#
+# Every row of public.hoas (enabled flag, subscription window,
+# branding) is kept in an in-process registry, reloaded with
+# one query once older than TENANT_CACHE_TTL, or right away
+# after invalidate_tenants() (in every worker with
+# CACHE_NOTIFY). The public portal and login page are served
+# from it without touching the database.
+#
+# Schema names come from the session or the URL, so they are
+# checked against the registry before being used as an
+# identifier. A pooled connection keeps its search_path
+# between requests; the SET is skipped when the connection is
+# already bound to the requested schema.
+# ======================================================
+
+TENANTS_SQL = """
+SELECT
+    schema_name,
+    name,
+    enabled,
+    subscription_start,
+    subscription_end,
+    portal_title,
+    brand_color,
+    logo_url
+FROM public.hoas
+"""
+
+_tenants = {}
+_enabled_tenants = []
+_tenant_loaded_at = None
+_tenant_lock = threading.Lock()
+
+# Minimum seconds between reloads triggered by an unknown schema
+TENANT_MISS_RELOAD = 5
+
+def _tenant_entry(row):
+    tenant = dict(row)
+    tenant["branding"] = {
+        key: row[key]
+        for key in ("name", "portal_title", "brand_color", "logo_url")
+    }
+    return tenant
+
+def load_tenants(cur=None, refresh=False):
+    """
+    The registry, {schema_name: tenant}, reloaded when stale.
+    A connection is only taken (cur=None) if it is.
+    """
+    global _tenants, _enabled_tenants, _tenant_loaded_at
+
+    loaded_at = _tenant_loaded_at
+    if (
+        not refresh
+        and loaded_at is not None
+        and time.monotonic() - loaded_at < TENANT_CACHE_TTL
+    ):
+        return _tenants
+
+    if cur is None:
+        cur = get_conn().cursor()
+
+    conn = cur.connection
+    idle = conn.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+    cur.execute(TENANTS_SQL)
+    tenants = {
+        r["schema_name"]: _tenant_entry(r)
+        for r in cur.fetchall()
+    }
+
+    # Leave the connection as we found it (read-only lookup)
+    if idle:
+        conn.commit()
+
+    enabled = sorted(
+        (t for t in tenants.values() if t["enabled"]),
+        key=lambda t: t["name"] or ""
     )
 
+    with _tenant_lock:
+        _tenants = tenants
+        _enabled_tenants = enabled
+        _tenant_loaded_at = time.monotonic()
+
+    return tenants
+
+def get_tenant(schema, cur=None):
+    if not schema:
+        return None
+
+    tenant = load_tenants(cur).get(schema)
+    if tenant is not None:
+        return tenant
+
+    # A newly created HOA may not be in the registry yet
+    loaded_at = _tenant_loaded_at
+    if loaded_at is None or time.monotonic() - loaded_at > TENANT_MISS_RELOAD:
+        return load_tenants(cur, refresh=True).get(schema)
+
+    return None
+
+def enabled_tenants(cur=None):
+    load_tenants(cur)
+    return _enabled_tenants
+
+def public_tenant(hoa):
+    """
+    Tenant for a public voting URL; 403 unless the HOA exists
+    and is enabled.
+    """
+    tenant = get_tenant(hoa)
+
+    if not tenant or not tenant["enabled"]:
+        abort(403)
+
+    return tenant
+
+def invalidate_tenants(cur=None):
+    """
+    Marks the registry stale in this process and, when
+    CACHE_NOTIFY is on and a cursor is given, in every other
+    worker once the caller's transaction commits.
+    """
+    global _tenant_loaded_at
+
+    with _tenant_lock:
+        _tenant_loaded_at = None
+
+    if CACHE_NOTIFY and cur is not None:
+        notify(cur, CACHE_NOTIFY_CHANNEL, "tenants:")
+
+def is_tenant_schema(cur, schema):
+    return get_tenant(schema, cur) is not None
+
 def set_search_path(cur, schema):
-    cur.execute(f"SET search_path TO {schema}, public;")
+    conn = cur.connection
+
+    if getattr(conn, "hoa_schema", None) == schema:
+        return
+
+    if not is_tenant_schema(cur, schema):
+        abort(403)
+
+    idle = conn.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+    cur.execute(
+        sql.SQL("SET search_path TO {}, public").format(
+            sql.Identifier(schema)
+        )
+    )
+
+    # Only a committed SET survives the rollback on release
+    if idle:
+        conn.commit()
+        conn.hoa_schema = schema
+    else:
+        conn.hoa_schema = None
+
+    if schema not in _provisioned_schemas:
+        ensure_schema_objects(cur, schema)
+
+# ======================================================
+# Per-schema objects
+#
+# Tables, indexes and trigger functions the app maintains
+# itself inside each HOA schema. Features register them with
+# schema_object() under a relation or function name; they
+# are created (and populated from existing data) the first
+# time each worker process binds to a schema.
+# ======================================================
+
+SCHEMA_OBJECTS = []
+_provisioned_schemas = set()
+
+def schema_object(name, ddl, populate=None, optional=False):
+    """
+    Registers a per-schema table or index. ddl is SQL or a
+    function taking a cursor. An optional object that cannot be
+    created (e.g. a missing extension) is skipped with a warning.
+    """
+    SCHEMA_OBJECTS.append((name, ddl, populate, optional))
+
+def ensure_schema_objects(cur, schema):
+    conn = cur.connection
+    idle = conn.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+    # Serialise concurrent workers provisioning the same schema
+    cur.execute(
+        "SELECT pg_advisory_xact_lock(hashtext(%s))",
+        (f"provision:{schema}",)
+    )
+
+    cur.execute(
+        """
+        SELECT name
+        FROM unnest(%s::text[]) AS name
+        WHERE to_regclass(name) IS NULL
+        AND to_regproc(name) IS NULL
+        """,
+        ([obj[0] for obj in SCHEMA_OBJECTS],)
+    )
+    missing = {r["name"] for r in cur.fetchall()}
+
+    for name, ddl, populate, optional in SCHEMA_OBJECTS:
+        if name not in missing:
+            continue
+
+        if optional:
+            cur.execute("SAVEPOINT schema_object")
+
+        try:
+            if callable(ddl):
+                ddl(cur)
+            else:
+                cur.execute(ddl)
+
+            if populate:
+                populate(cur)
+
+        except psycopg2.Error as e:
+            if not optional:
+                raise
+
+            cur.execute("ROLLBACK TO SAVEPOINT schema_object")
+            app.logger.warning(
+                "Skipping optional object %s in schema %s: %s",
+                name, schema, str(e).strip().splitlines()[0]
+            )
+
+    # Mid-transaction the objects commit (or roll back) with the
+    # caller's work, so only an idle start is remembered as done
+    if idle:
+        conn.commit()
+        _provisioned_schemas.add(schema)
 
 # ======================================================
 # HOA context enforcement (CRITICAL)
@@ -61,36 +550,328 @@ def compute_vote_hash(prev_hash, erf, topic_id, option_id, weight, ts):
     payload = f"{prev_hash}|{erf}|{topic_id}|{option_id}|{weight}|{ts}"
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-def get_hoa_branding(schema):
+# ======================================================
+# In-process caches
+# ======================================================
 
-    conn = get_conn()
-    cur = conn.cursor()
+_MISSING = object()
 
-    cur.execute(
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries also expire after
+    ttl seconds (ttl=None keeps them until evicted).
+    """
+
+    def __init__(self, maxsize, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+
+            value, expires = item
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires = (
+            time.monotonic() + self.ttl
+            if self.ttl is not None else None
+        )
+
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix):
         """
-        SELECT
-            name,
-            portal_title,
-            brand_color,
-            logo_url
-        FROM public.hoas
-        WHERE schema_name=%s
-        """,
-        (schema,)
+        Drops every tuple key that starts with the given tuple.
+        """
+        with self._lock:
+            for key in [
+                k for k in self._data if k[:len(prefix)] == prefix
+            ]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+# ======================================================
+# Cross-process notifications (LISTEN/NOTIFY)
+#
+# Each worker process keeps one dedicated LISTEN connection
+# (outside the pool) on a daemon thread. Handlers run on that
+# thread and must be quick. After a reconnect every handler
+# is called with payload=None, because notifications sent
+# while disconnected are lost; so is a channel's handler once
+# a late subscription starts listening.
+# ======================================================
+
+NOTIFY_RETRY_SECONDS = 5
+
+class NotifyListener:
+
+    def __init__(self):
+        self.handlers = {}
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pid = None
+
+    def subscribe(self, channel, callback):
+        with self.lock:
+            self.handlers.setdefault(channel, []).append(callback)
+            self.pending.add(channel)
+
+    def unsubscribe(self, channel, callback):
+        with self.lock:
+            callbacks = self.handlers.get(channel, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def is_alive(self):
+        return (
+            self.thread is not None
+            and self.thread.is_alive()
+            and self.pid == os.getpid()
+        )
+
+    def start(self):
+        if self.is_alive():
+            return
+
+        with self.lock:
+            if self.is_alive():
+                return
+
+            self.pid = os.getpid()
+            self.thread = threading.Thread(
+                target=self._run,
+                name="notify-listener",
+                daemon=True
+            )
+            self.thread.start()
+
+    def _dispatch(self, channel, payload):
+        with self.lock:
+            callbacks = list(self.handlers.get(channel, []))
+
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception:
+                app.logger.exception("NOTIFY handler failed")
+
+    def _listen_pending(self, cur):
+        with self.lock:
+            channels, self.pending = self.pending, set()
+
+        for channel in channels:
+            cur.execute(
+                sql.SQL("LISTEN {}").format(sql.Identifier(channel))
+            )
+
+        return channels
+
+    def _run(self):
+        while True:
+            try:
+                conn = psycopg2.connect(DATABASE_URL)
+                conn.autocommit = True
+                cur = conn.cursor()
+
+                with self.lock:
+                    self.pending = set(self.handlers)
+                    channels = list(self.handlers)
+
+                self._listen_pending(cur)
+
+                for channel in channels:
+                    self._dispatch(channel, None)
+
+                while True:
+                    for channel in self._listen_pending(cur):
+                        self._dispatch(channel, None)
+
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+
+                    conn.poll()
+                    while conn.notifies:
+                        n = conn.notifies.pop(0)
+                        self._dispatch(n.channel, n.payload)
+
+            except psycopg2.Error:
+                app.logger.exception("NOTIFY listener lost connection")
+                time.sleep(NOTIFY_RETRY_SECONDS)
+
+notify_listener = NotifyListener()
+
+def notify(cur, channel, payload):
+    """
+    Queues a NOTIFY; Postgres delivers it when the surrounding
+    transaction commits (and drops it on rollback).
+    """
+    cur.execute(
+        "SELECT pg_notify(%s, %s)",
+        (channel, payload)
     )
 
-    branding = cur.fetchone()
-    conn.close()
-    return branding
+@app.before_request
+def start_notify_listener():
+    if CACHE_NOTIFY:
+        notify_listener.start()
+
+# ======================================================
+# HOA branding (from the tenant registry)
+# ======================================================
+
+def get_hoa_branding(schema):
+    tenant = get_tenant(schema)
+    return tenant["branding"] if tenant else None
+
+def _on_cache_notify(payload):
+    # payload=None means the listener reconnected: drop everything
+    if payload is None:
+        invalidate_tenants()
+        OWNER_COUNT_CACHE.clear()
+        FAILED_LOGINS.clear()
+        return
+
+    kind, _, schema = payload.partition(":")
+    if kind == "tenants":
+        invalidate_tenants()
+    elif kind == "owners":
+        OWNER_COUNT_CACHE.invalidate(schema)
+    elif kind == "logins":
+        FAILED_LOGINS.invalidate_prefix((schema,))
+
+notify_listener.subscribe(CACHE_NOTIFY_CHANNEL, _on_cache_notify)
 
 # ======================================================
 # HOA + ADMIN AUTHENTICATION
+#
+# Admin passwords are stored as werkzeug hashes
+# (ADMIN_HASH_METHOD). Legacy plaintext rows still log in and
+# are replaced by a hash on success, as are hashes made with an
+# older method or cost. Hashing runs on a small thread pool
+# (hashlib releases the GIL), so at most ADMIN_HASH_WORKERS
+# cores go to logins and request threads keep serving votes;
+# when ADMIN_HASH_QUEUE logins are already waiting, more are
+# refused with 503 (an upgrade re-hash is skipped instead).
+# Unknown, disabled and expired accounts are checked against a
+# dummy hash so they take as long as a real one. Timings are
+# reported by /admin/stats.
 # ======================================================
 
+_hash_pool = ThreadPoolExecutor(
+    max_workers=ADMIN_HASH_WORKERS,
+    thread_name_prefix="admin-hash"
+)
+_hash_slots = threading.BoundedSemaphore(ADMIN_HASH_QUEUE)
+
+HASH_STATS = {"rejected": 0, "skipped": 0}
+_hash_stats_lock = threading.Lock()
+
+# Made once with the configured method; its "$" prefix is how
+# werkzeug spells the method and cost in every stored hash
+DUMMY_ADMIN_HASH = generate_password_hash("", ADMIN_HASH_METHOD)
+ADMIN_HASH_PREFIX = DUMMY_ADMIN_HASH.split("$", 1)[0]
+
+def run_hash_job(kind, fn, *args, optional=False):
+    """
+    Runs fn(*args) on the hash pool and waits for the result.
+    When the pool is saturated, aborts with 503, or returns None
+    for optional work.
+    """
+    if not _hash_slots.acquire(blocking=False):
+        with _hash_stats_lock:
+            if optional:
+                HASH_STATS["skipped"] += 1
+                return None
+            HASH_STATS["rejected"] += 1
+        abort(503)
+
+    queued = time.perf_counter()
+
+    def job():
+        started = time.perf_counter()
+        try:
+            return fn(*args), started - queued, time.perf_counter() - started
+        finally:
+            _hash_slots.release()
+
+    result, waited, took = _hash_pool.submit(job).result()
+
+    with _hash_stats_lock:
+        stats = HASH_STATS.setdefault(
+            kind,
+            {"count": 0, "total_ms": 0.0, "max_ms": 0.0,
+             "wait_total_ms": 0.0, "wait_max_ms": 0.0}
+        )
+        stats["count"] += 1
+        stats["total_ms"] += took * 1000
+        stats["max_ms"] = max(stats["max_ms"], took * 1000)
+        stats["wait_total_ms"] += waited * 1000
+        stats["wait_max_ms"] = max(stats["wait_max_ms"], waited * 1000)
+
+    return result
+
+def get_hash_stats():
+    with _hash_stats_lock:
+        stats = {
+            kind: dict(s) if isinstance(s, dict) else s
+            for kind, s in HASH_STATS.items()
+        }
+
+    for s in stats.values():
+        if isinstance(s, dict):
+            s["avg_ms"] = round(s["total_ms"] / s["count"], 3)
+            s["wait_avg_ms"] = round(s["wait_total_ms"] / s["count"], 3)
+            for key in ("total_ms", "max_ms", "wait_total_ms", "wait_max_ms"):
+                s[key] = round(s[key], 3)
+
+    stats["method"] = ADMIN_HASH_METHOD
+    stats["workers"] = ADMIN_HASH_WORKERS
+
+    return stats
+
+def is_password_hash(stored):
+    return (
+        stored.startswith(("scrypt:", "pbkdf2:"))
+        and stored.count("$") == 2
+    )
+
+def hash_admin_password(password, optional=False):
+    return run_hash_job(
+        "hash",
+        generate_password_hash,
+        password,
+        ADMIN_HASH_METHOD,
+        optional=optional
+    )
+
 def resolve_admin(email, password):
     """
-    Legacy-compatible admin auth:
-    - Plaintext password comparison
+    Admin auth:
+    - Hashed password check (legacy plaintext rows upgraded)
     - HOA user must be enabled
     - HOA must be enabled
     - HOA subscription must not be expired
@@ -115,23 +896,48 @@ def resolve_admin(email, password):
     )
 
     row = cur.fetchone()
-    conn.close()
 
-    if not row:
+    if (
+        not row
+        or not row["user_enabled"]
+        or not row["hoa_enabled"]
+        or row["subscription_end"] < date.today()
+    ):
+        # Same KDF cost as a real account: timing reveals nothing
+        run_hash_job("verify", check_password_hash, DUMMY_ADMIN_HASH, password)
         return None
 
-    if not row["user_enabled"]:
-        return None
+    stored = row["password"]
 
-    if not row["hoa_enabled"]:
-        return None
+    if is_password_hash(stored):
+        if not run_hash_job("verify", check_password_hash, stored, password):
+            return None
 
-    if row["subscription_end"] < date.today():
-        return None
+        upgrade = stored.split("$", 1)[0] != ADMIN_HASH_PREFIX
 
-    # Legacy behaviour: plaintext comparison
-    if row["password"] != password:
-        return None
+    else:
+        # Legacy plaintext row: compare, then store a hash
+        if not hmac.compare_digest(
+            stored.encode("utf-8"),
+            password.encode("utf-8")
+        ):
+            return None
+
+        upgrade = True
+
+    # Best effort: a busy pool leaves the upgrade to a later login
+    new_hash = hash_admin_password(password, optional=True) if upgrade else None
+
+    if new_hash:
+        cur.execute(
+            """
+            UPDATE public.hoa_users
+            SET password=%s
+            WHERE email=%s AND password=%s
+            """,
+            (new_hash, email, stored)
+        )
+        conn.commit()
 
     return row["schema_name"]
 
@@ -338,6 +1144,59 @@ BASE_TAIL = """
 </html>
 """
 
+# ======================================================
+# PAGE TEMPLATES
+#
+# Every page is registered once at import with register_page()
+# and compiled a single time; routes render it by name with
+# render_page(). Render times are kept per page and reported
+# by /admin/stats.
+# ======================================================
+
+PAGE_LAYOUTS = {
+    "admin": (BASE_HEAD_ADMIN, BASE_TAIL),
+    "public": (BASE_HEAD_PUBLIC, BASE_TAIL),
+    None: ("", "")
+}
+
+PAGES = {}
+RENDER_STATS = {}
+_render_stats_lock = threading.Lock()
+
+def register_page(name, layout, body):
+    if name in PAGES:
+        raise ValueError(f"Page already registered: {name}")
+
+    head, tail = PAGE_LAYOUTS[layout]
+    PAGES[name] = app.jinja_env.from_string(head + body + tail)
+
+def render_page(name, **context):
+    started = time.perf_counter()
+    html = render_template(PAGES[name], **context)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    with _render_stats_lock:
+        stats = RENDER_STATS.setdefault(
+            name,
+            {"renders": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        stats["renders"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    return html
+
+def get_render_stats():
+    with _render_stats_lock:
+        stats = {name: dict(s) for name, s in RENDER_STATS.items()}
+
+    for s in stats.values():
+        s["avg_ms"] = round(s["total_ms"] / s["renders"], 3)
+        s["total_ms"] = round(s["total_ms"], 3)
+        s["max_ms"] = round(s["max_ms"], 3)
+
+    return stats
+
 # ======================================================
 # Session Guards
 # ======================================================
@@ -354,6 +1213,20 @@ def require_voter(hoa):
 # Admin Login / Logout
 # ======================================================
 
+register_page(
+    "admin_login_failed", None,
+    "<h3>Invalid credentials or HOA inactive</h3>"
+)
+
+register_page("admin_login", None, """
+    <h2>Admin Login</h2>
+    <form method="post">
+      <p><input name="email" placeholder="Email"></p>
+      <p><input type="password" name="password" placeholder="Password"></p>
+      <button>Login</button>
+    </form>
+    """)
+
 @app.route("/admin/login", methods=["GET", "POST"])
 def admin_login():
     if request.method == "POST":
@@ -362,24 +1235,16 @@ def admin_login():
 
         schema = resolve_admin(email, password)
         if not schema:
-            return render_template_string(
-                "<h3>Invalid credentials or HOA inactive</h3>"
-            )
+            return render_page("admin_login_failed")
 
         session.clear()
         session["admin_logged_in"] = True
+        session["admin_email"] = email
         session["hoa_schema"] = schema
 
         return redirect("/admin")
 
-    return render_template_string("""
-    <h2>Admin Login</h2>
-    <form method="post">
-      <p><input name="email" placeholder="Email"></p>
-      <p><input type="password" name="password" placeholder="Password"></p>
-      <button>Login</button>
-    </form>
-    """)
+    return render_page("admin_login")
 
 @app.route("/admin/logout")
 def admin_logout():
@@ -387,194 +1252,291 @@ def admin_logout():
     return redirect("/admin/login")
 
 # ======================================================
-# Admin Dashboard
-# ======================================================
-
-@app.route("/admin")
-def admin_dashboard():
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
-
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
-
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
-
-    # Owners
-    cur.execute("SELECT COUNT(*) AS c FROM owners")
-    owners = cur.fetchone()["c"]
-
-    # Registrations
-    cur.execute("SELECT COUNT(*) AS c FROM registrations")
-    registrations = cur.fetchone()["c"]
-
-    # Owner proxies
-    cur.execute("SELECT COUNT(*) AS c FROM owner_proxies")
-    owner_proxies = cur.fetchone()["c"]
+# VOTE WEIGHT COMPUTATION
+#
+# Voting Model
+#
+# Every owner contributes exactly one vote.
+#
+# Owner proxies transfer an owner's vote to another owner.
+# They NEVER create additional votes.
+#
+# Developer base votes create additional votes and therefore
+# increase the total voting entitlement.
+#
+# Developer proxies transfer existing owner votes to the
+# developer and therefore DO NOT increase the total voting
+# entitlement.
+#
+# This function determines ONLY the effective voting weight
+# of a single voter.
+#
+# It does NOT determine the total voting entitlement of the HOA.
+# ======================================================
 
-    # Developer proxies
-    cur.execute("SELECT COUNT(*) AS c FROM developer_proxies")
-    developer_proxies = cur.fetchone()["c"]
+VOTE_WEIGHTS_SQL = """
+WITH dev AS (
+    SELECT is_active, base_votes
+    FROM developer_settings
+    LIMIT 1
+),
+dev_proxy_count AS (
+    SELECT COUNT(*) AS c FROM developer_proxies
+),
+voters AS (
+    {voters}
+)
+SELECT
+    v.erf,
+    CASE
+        -- Developer vote
+        WHEN v.erf = 'DEVELOPER' THEN COALESCE(
+            (SELECT COALESCE(d.base_votes,0) + p.c
+             FROM dev d, dev_proxy_count p
+             WHERE d.is_active),
+            0
+        )
 
-    # Developer settings
-    cur.execute(
-        """
-        SELECT
-            COALESCE(base_votes,0) AS base_votes,
-            COALESCE(proxy_count,0) AS proxy_count
-        FROM developer_settings
-        LIMIT 1
-        """
-    )
+        -- Developer proxies cannot vote
+        WHEN EXISTS (
+            SELECT 1 FROM developer_proxies dp
+            WHERE dp.erf = v.erf
+        ) THEN 0
+
+        -- Owner proxies cannot vote
+        WHEN EXISTS (
+            SELECT 1 FROM owner_proxies op
+            WHERE op.proxy_erf = v.erf
+        ) THEN 0
+
+        -- Numeric proxies (already includes owner proxies)
+        ELSE 1 + COALESCE(r.proxies,0)
+    END AS weight
+FROM voters v
+LEFT JOIN registrations r
+  ON r.erf = v.erf
+"""
 
-    dev = cur.fetchone()
+REGISTERED_VOTERS = "SELECT erf FROM registrations"
+LISTED_VOTERS = "SELECT DISTINCT unnest(%s::text[]) AS erf"
 
-    if dev:
-        developer_base_votes = dev["base_votes"]
-        developer_total_weight = (
-            dev["base_votes"] +
-            dev["proxy_count"]
+def compute_vote_weights(cur, erfs=None):
+    """
+    Computes vote weights for many ERFs in one query according to
+    legacy rules. erfs=None means every registered ERF.
+    Returns {erf: weight}.
+    """
+    if erfs is None:
+        cur.execute(
+            VOTE_WEIGHTS_SQL.format(voters=REGISTERED_VOTERS)
         )
     else:
-        developer_base_votes = 0
-        developer_total_weight = 0
+        cur.execute(
+            VOTE_WEIGHTS_SQL.format(voters=LISTED_VOTERS),
+            (list(erfs),)
+        )
 
-    # Topics
-    cur.execute("SELECT COUNT(*) AS c FROM topics")
-    topics = cur.fetchone()["c"]
+    return {
+        r["erf"]: r["weight"]
+        for r in cur.fetchall()
+    }
 
-    # Open topics
-    cur.execute(
-        """
-        SELECT COUNT(*) AS c
-        FROM topics
-        WHERE is_open=TRUE
-        """
-    )
-    open_topics = cur.fetchone()["c"]
+def compute_vote_weight(cur, erf):
+    """
+    Computes total vote weight for an ERF according to legacy rules.
+    """
+    return compute_vote_weights(cur, [erf]).get(erf, 0)
 
-    cur.execute(
-        """
-        SELECT COUNT(*) AS c
-        FROM topics
-        WHERE is_open=TRUE
-        AND vote_mode='AGM'
-        """
-    )
-    open_agm_topics = cur.fetchone()["c"]
+# ======================================================
+# EFFECTIVE WEIGHTS (MATERIALIZED)
+#
+# effective_weights holds the computed weight of every
+# registered ERF. Weight only changes when registrations,
+# owner proxies or developer settings/proxies change, so those
+# admin routes call refresh_effective_weights() for the ERFs
+# they touched, in the same transaction. Voting, the dashboard
+# and exports then read weight with an indexed lookup.
+#
+# rebuild_effective_weights.py checks or rebuilds the table
+# (run it before an AGM).
+#
+# Voting reads the voter's own row in the same query as the
+# topic, so the weight costs no extra round trip.
+# ======================================================
 
-    cur.execute(
-        """
-        SELECT COUNT(*) AS c
-        FROM topics
-        WHERE is_open=TRUE
-          AND vote_mode='GENERAL'
-        """
-    )
-    open_general_topics = cur.fetchone()["c"]
+EFFECTIVE_WEIGHTS_DDL = """
+CREATE TABLE effective_weights (
+    erf TEXT PRIMARY KEY,
+    weight INTEGER NOT NULL
+)
+"""
 
-    # Votes cast
-    cur.execute("SELECT COUNT(*) AS c FROM votes")
-    votes_cast = cur.fetchone()["c"]
+LISTED_REGISTERED_VOTERS = (
+    "SELECT erf FROM registrations WHERE erf = ANY(%s::text[])"
+)
 
-    # Weighted votes cast
-    cur.execute(
-        """
-        SELECT COALESCE(SUM(weight),0) AS total
-        FROM votes
-        """
-    )
-    weighted_votes = cur.fetchone()["total"]
-    
-    # Latest voting activity
+def _store_effective_weights(cur, voters, params=()):
     cur.execute(
         """
-        SELECT
-            v.erf,
-            t.title,
-            v.timestamp
-        FROM votes v
-        JOIN topics t
-          ON t.id = v.topic_id
-        ORDER BY v.timestamp DESC
-        LIMIT 10
-        """
+        INSERT INTO effective_weights (erf, weight)
+        SELECT w.erf, w.weight
+        FROM ({weights}) w
+        ON CONFLICT (erf)
+        DO UPDATE SET weight = EXCLUDED.weight
+        WHERE effective_weights.weight <> EXCLUDED.weight
+        """.format(weights=VOTE_WEIGHTS_SQL.format(voters=voters)),
+        params
     )
 
-    recent_votes = cur.fetchall()
+def refresh_effective_weights(cur, erfs):
+    """
+    Recomputes the stored weight of the given ERFs. Call after
+    any change to registrations, owner proxies or developer
+    settings/proxies, before committing.
+    """
+    erfs = list(set(erfs))
 
     cur.execute(
         """
-        SELECT COALESCE(quorum_threshold, 50) AS quorum_threshold
-        FROM public.hoas
-        WHERE schema_name=%s
+        DELETE FROM effective_weights e
+        WHERE e.erf = ANY(%s::text[])
+        AND NOT EXISTS (
+            SELECT 1 FROM registrations r
+            WHERE r.erf = e.erf
+        )
         """,
-        (schema,)
+        (erfs,)
     )
 
-    row = cur.fetchone()
+    _store_effective_weights(cur, LISTED_REGISTERED_VOTERS, (erfs,))
 
-    quorum_threshold = (
-        row["quorum_threshold"]
-        if row else 50
+def rebuild_effective_weights(cur):
+    """
+    Reconciles effective_weights with every registration.
+    """
+    cur.execute(
+        """
+        DELETE FROM effective_weights e
+        WHERE NOT EXISTS (
+            SELECT 1 FROM registrations r
+            WHERE r.erf = e.erf
+        )
+        """
     )
 
-    conn.close()
-    
-# --------------------------------------------------
-# Quorum calculation based on voting weight
-# --------------------------------------------------
-
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
-
-#
-# Total eligible voting weight
-#
-
-    total_weight = owners
+    _store_effective_weights(cur, REGISTERED_VOTERS)
 
+def check_effective_weights(cur):
+    """
+    Returns [(erf, stored, expected)] for every ERF whose stored
+    weight differs from the legacy rules.
+    """
     cur.execute(
         """
         SELECT
-            COALESCE(base_votes,0) AS base_votes,
-            COALESCE(proxy_count,0) AS proxy_count,
-            is_active
-        FROM developer_settings
-        LIMIT 1
-        """
+            COALESCE(e.erf, w.erf) AS erf,
+            e.weight AS stored,
+            w.weight AS expected
+        FROM effective_weights e
+        FULL OUTER JOIN ({weights}) w
+          ON w.erf = e.erf
+        WHERE e.weight IS DISTINCT FROM w.weight
+        ORDER BY 1
+        """.format(
+            weights=VOTE_WEIGHTS_SQL.format(voters=REGISTERED_VOTERS)
+        )
     )
 
-    dev = cur.fetchone()
+    return [
+        (r["erf"], r["stored"], r["expected"])
+        for r in cur.fetchall()
+    ]
 
-    if dev and dev["is_active"]:
-        total_weight += dev["base_votes"]
+schema_object(
+    "effective_weights",
+    EFFECTIVE_WEIGHTS_DDL,
+    rebuild_effective_weights
+)
 
-#
-# Registered voting weight
-#
+def voter_weight(cur, erf, stored_weight):
+    """
+    The voter's AGM weight: their effective_weights row, read by
+    the caller in the same query as the topic.
+    """
+    if stored_weight is None:
+        # Not registered: legacy rules still apply
+        return compute_vote_weight(cur, erf)
 
-    cur.execute(
-        """
-        SELECT erf
-        FROM registrations
-        """
-    )
+    return stored_weight
 
-    registered_weight = 0
+# ======================================================
+# Admin Dashboard
+# ======================================================
+
+DASHBOARD_STATS_SQL = """
+WITH dev AS (
+    SELECT
+        COALESCE(base_votes,0) AS base_votes,
+        COALESCE(proxy_count,0) AS proxy_count,
+        COALESCE(is_active,FALSE) AS is_active
+    FROM developer_settings
+    LIMIT 1
+)
+SELECT
+    (SELECT COUNT(*) FROM owners) AS owners,
+    (SELECT COUNT(*) FROM registrations) AS registrations,
+    (SELECT COUNT(*) FROM owner_proxies) AS owner_proxies,
+    (SELECT COUNT(*) FROM developer_proxies) AS developer_proxies,
+
+    COALESCE((SELECT base_votes FROM dev), 0) AS developer_base_votes,
+    COALESCE((SELECT base_votes + proxy_count FROM dev), 0)
+        AS developer_total_weight,
+    COALESCE((SELECT base_votes FROM dev WHERE is_active), 0)
+        AS developer_eligible_votes,
+
+    (SELECT COUNT(*) FROM topics) AS topics,
+    (SELECT COUNT(*) FROM topics WHERE is_open=TRUE) AS open_topics,
+    (SELECT COUNT(*) FROM topics
+     WHERE is_open=TRUE AND vote_mode='AGM') AS open_agm_topics,
+    (SELECT COUNT(*) FROM topics
+     WHERE is_open=TRUE AND vote_mode='GENERAL') AS open_general_topics,
+
+    (SELECT COUNT(*) FROM votes) AS votes_cast,
+    (SELECT COALESCE(SUM(weight),0) FROM votes) AS weighted_votes,
+
+    (SELECT COALESCE(SUM(weight),0)::bigint FROM effective_weights)
+        AS registered_weight,
+
+    COALESCE(
+        (SELECT quorum_threshold FROM public.hoas WHERE schema_name=%s),
+        50
+    ) AS quorum_threshold
+"""
 
-    for r in cur.fetchall():
-        registered_weight += compute_vote_weight(
-            cur,
-            r["erf"]
+def get_dashboard_stats(cur, schema):
+    """
+    All dashboard counters and the quorum figures in one round
+    trip, independent of the number of registrations.
+    """
+    cur.execute(DASHBOARD_STATS_SQL, (schema,))
+    stats = dict(cur.fetchone())
+
+    # Developer base votes add to the entitlement; developer
+    # proxies only move existing owner votes.
+    total_weight = stats["owners"] + stats.pop("developer_eligible_votes")
+    registered_weight = stats.pop("registered_weight")
+
+    stats.update(
+        quorum_figures(
+            registered_weight,
+            total_weight,
+            stats["quorum_threshold"]
         )
+    )
 
-    conn.close()
+    return stats
 
+def quorum_figures(registered_weight, total_weight, threshold):
     registration_rate = 0
 
     if total_weight > 0:
@@ -583,18 +1545,20 @@ def admin_dashboard():
             1
         )
 
-    quorum_registered = registered_weight
-    quorum_total = total_weight
-
-    if registration_rate >= quorum_threshold:
+    if registration_rate >= threshold:
         quorum_status = "YES"
     else:
         quorum_status = "NO"
 
-    branding = get_hoa_branding(schema)
+    return {
+        "registration_rate": registration_rate,
+        "quorum_registered": registered_weight,
+        "quorum_total": total_weight,
+        "quorum_threshold": threshold,
+        "quorum_status": quorum_status
+    }
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
+register_page("admin_dashboard", "admin", """
 <div class="card">
 
 <h2>{{ branding.portal_title or branding.name }} — Dashboard</h2>
@@ -690,28 +1654,40 @@ Public voting link:
 
 <tr>
   <td>Total Eligible Voting Weight</td>
-  <td>{{ quorum_total }}</td>
+  <td id="quorum-total">{{ quorum_total }}</td>
 </tr>
 
 <tr>
   <td>Registered Voting Weight</td>
-  <td>{{ quorum_registered }}</td>
+  <td id="quorum-registered">{{ quorum_registered }}</td>
 </tr>
 
 <tr>
   <td>Registration Percentage</td>
-  <td>{{ registration_rate }}%</td>
+  <td><span id="quorum-rate">{{ registration_rate }}</span>%</td>
 </tr>
 
 <tr>
-  <td>{{ quorum_threshold }}% Threshold Reached</td>
-  <td>{{ quorum_status }}</td>
+  <td><span id="quorum-threshold">{{ quorum_threshold }}</span>% Threshold Reached</td>
+  <td id="quorum-status">{{ quorum_status }}</td>
 </tr>
 
 </table>
 
 </div>
 
+{% if live_updates %}
+<div class="card">
+
+<h3>Live Results</h3>
+
+<div id="live-topics">
+<p>Connecting…</p>
+</div>
+
+</div>
+{% endif %}
+
 <div class="card">
 
 <h3>Latest Voting Activity</h3>
@@ -736,34 +1712,85 @@ Public voting link:
 
 </div>
 
-""" + BASE_TAIL,
-        branding=branding,
-        owners=owners,
-        registrations=registrations,
-        owner_proxies=owner_proxies,
-        developer_proxies=developer_proxies,
-        developer_base_votes=developer_base_votes,
-        developer_total_weight=developer_total_weight,
-        topics=topics,
-        open_topics=open_topics,
-        open_agm_topics=open_agm_topics,
-        open_general_topics=open_general_topics,
-        votes_cast=votes_cast,
-        weighted_votes=weighted_votes,
-        registration_rate=registration_rate,
-        quorum_registered=quorum_registered,
-        quorum_total=quorum_total,
-        quorum_status=quorum_status,
-        quorum_threshold=quorum_threshold,
-        recent_votes=recent_votes
-    )
-    
-# ======================================================
-# OWNERS (CSV UPLOAD / VIEW)
-# ======================================================
+{% if live_updates %}
+<script>
+(function () {
+  if (!window.EventSource) return;
+
+  function cell(tag, text, id) {
+    var el = document.createElement(tag);
+    el.textContent = text;
+    if (id) el.id = id;
+    return el;
+  }
+
+  function setText(id, text) {
+    var el = document.getElementById(id);
+    if (el) el.textContent = text;
+  }
+
+  function showQuorum(q) {
+    setText("quorum-total", q.quorum_total);
+    setText("quorum-registered", q.quorum_registered);
+    setText("quorum-rate", q.registration_rate);
+    setText("quorum-threshold", q.quorum_threshold);
+    setText("quorum-status", q.quorum_status);
+  }
+
+  function showTopics(topics) {
+    var box = document.getElementById("live-topics");
+    box.textContent = "";
+
+    if (!topics.length) {
+      box.appendChild(cell("p", "No open topics."));
+      return;
+    }
+
+    topics.forEach(function (t) {
+      box.appendChild(cell("h4", t.title));
+
+      var table = document.createElement("table");
+      var head = document.createElement("tr");
+      ["Option", "Votes", "Weight"].forEach(function (h) {
+        head.appendChild(cell("th", h));
+      });
+      table.appendChild(head);
+
+      t.options.forEach(function (o) {
+        var row = document.createElement("tr");
+        row.appendChild(cell("td", o.label));
+        row.appendChild(cell("td", o.votes, "tally-" + o.id + "-votes"));
+        row.appendChild(cell("td", o.weight, "tally-" + o.id + "-weight"));
+        table.appendChild(row);
+      });
+
+      box.appendChild(table);
+    });
+  }
+
+  var source = new EventSource("{{ url_for('admin_live') }}");
+
+  source.onmessage = function (e) {
+    var m = JSON.parse(e.data);
+
+    if (m.type === "snapshot") {
+      showTopics(m.topics);
+      showQuorum(m.quorum);
+    } else if (m.type === "tally") {
+      setText("tally-" + m.option_id + "-votes", m.votes);
+      setText("tally-" + m.option_id + "-weight", m.weight);
+    } else if (m.type === "quorum") {
+      showQuorum(m);
+    }
+  };
+})();
+</script>
+{% endif %}
 
-@app.route("/admin/owners", methods=["GET", "POST"])
-def admin_owners():
+""")
+
+@app.route("/admin")
+def admin_dashboard():
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -775,133 +1802,440 @@ def admin_owners():
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    if request.method == "POST":
-        file = request.files.get("file")
+    stats = get_dashboard_stats(cur, schema)
 
-        if file:
+    # Latest voting activity
+    cur.execute(
+        """
+        SELECT
+            v.erf,
+            t.title,
+            v.timestamp
+        FROM votes v
+        JOIN topics t
+          ON t.id = v.topic_id
+        ORDER BY v.timestamp DESC
+        LIMIT 10
+        """
+    )
 
-            replace_all = request.form.get("replace_all") == "on"
+    recent_votes = cur.fetchall()
 
-            if replace_all:
-                cur.execute("DELETE FROM owners")
+    branding = get_hoa_branding(schema)
 
-            content = file.read().decode("utf-8")
-            
-            try:
-                dialect = csv.Sniffer().sniff(
-                    content[:2048],
-                    delimiters=",;"
-                )
-                delimiter = dialect.delimiter
-            except:
-                delimiter = ","
+    return render_page(
+        "admin_dashboard",
+        branding=branding,
+        recent_votes=recent_votes,
+        live_updates=LIVE_UPDATES,
+        **stats
+    )
+    
+# ======================================================
+# STREAMING CSV EXPORTS
+#
+# Exports read through a named (server-side) cursor,
+# EXPORT_ITERSIZE rows per round trip, and are sent as a
+# streamed response in EXPORT_CHUNK_SIZE pieces. Memory stays
+# flat and the first bytes leave before the last row is read.
+#
+# The body is generated after teardown_conn has already put
+# the request's connection back in the pool, so the cursor
+# runs on its own checkout held for the length of the stream.
+# ======================================================
 
-            reader = csv.reader(
-                StringIO(content),
-                delimiter=delimiter
-            )
+def iter_rows(conn, query, params=None, name="csv_export",
+              itersize=EXPORT_ITERSIZE):
+    """
+    Yields result rows as tuples from a server-side cursor.
+    """
+    cur = conn.cursor(
+        name=name,
+        cursor_factory=TupleCursor
+    )
+    cur.itersize = itersize
 
-            for row in reader:
+    try:
+        cur.execute(query, params)
+        yield from cur
+    finally:
+        cur.close()
 
-                if not row:
-                    continue
+def export_rows(schema, query, params=None):
+    """
+    iter_rows on a dedicated pooled connection bound to the
+    schema, released when the stream ends or is dropped.
+    """
+    with pooled_connection() as conn:
+        set_search_path(conn.cursor(), schema)
+        yield from iter_rows(conn, query, params)
 
-                if row[0].strip().lower() == "erf":
-                    continue
+def csv_response(filename, rows):
+    """
+    Streams rows (an iterable of lists, consumed lazily) as a
+    ';'-delimited CSV download.
+    """
+    def generate():
+        out = StringIO()
+        writer = csv.writer(out, delimiter=';')
 
-                erf = row[0].strip().upper()
-                name = row[1].strip() if len(row) > 1 else None
-                id_number = row[2].strip() if len(row) > 2 else None
+        for row in rows:
+            writer.writerow(row)
 
-                cur.execute(
-                    """
-                    INSERT INTO owners (erf, name, id_number)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (erf)
-                    DO UPDATE SET
-                        name = EXCLUDED.name,
-                        id_number = EXCLUDED.id_number
-                    """,
-                    (erf, name, id_number)
-                )
+            if out.tell() >= EXPORT_CHUNK_SIZE:
+                yield out.getvalue()
+                out.seek(0)
+                out.truncate()
 
-            conn.commit()
+        yield out.getvalue()
 
-    search = request.args.get("search", "").strip()
+    response = Response(
+        stream_with_context(generate()),
+        mimetype="text/csv"
+    )
+    response.headers.set(
+        "Content-Disposition",
+        "attachment",
+        filename=filename
+    )
 
-    if search:
+    return response
 
-        cur.execute(
-            """
-            SELECT *
-            FROM owners
-            WHERE
-                erf ILIKE %s
-                OR name ILIKE %s
-                OR id_number ILIKE %s
-            ORDER BY erf
-            """,
-            (
-                f"%{search}%",
-                f"%{search}%",
-                f"%{search}%"
-            )
-        )
+# ======================================================
+# OWNER REGISTER IMPORT (COPY)
+#
+# The uploaded CSV is parsed as it streams in and fed to
+# COPY FROM STDIN into a temporary staging table, then merged
+# into owners with a single INSERT ... SELECT ... ON CONFLICT.
+# The caller commits, so an import either lands completely or
+# not at all.
+# ======================================================
 
-    else:
+class IterStream:
+    """
+    Read-only file-like object over an iterator of str chunks,
+    for cursor.copy_expert(). psycopg2 reports an exception
+    raised while reading as a cancelled COPY; the original is
+    kept in .error.
+    """
 
-        cur.execute(
-            "SELECT * FROM owners ORDER BY erf"
-        )
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buf = ""
+        self.error = None
 
-    owners = cur.fetchall()
-    owner_count = len(owners)
+    def read(self, size=-1):
+        while size < 0 or len(self._buf) < size:
+            try:
+                self._buf += next(self._chunks)
+            except StopIteration:
+                break
+            except Exception as e:
+                self.error = e
+                raise
+
+        if size < 0:
+            data, self._buf = self._buf, ""
+        else:
+            data, self._buf = self._buf[:size], self._buf[size:]
 
-    conn.close()
+        return data
 
-    branding = get_hoa_branding(schema)
+def _copy_csv_line(values):
+    # COPY csv: unquoted empty is NULL, quoted empty is ''
+    return ",".join(
+        "" if v is None else '"' + v.replace('"', '""') + '"'
+        for v in values
+    ) + "\n"
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card">
-<h2>Owners ({{ owner_count }})</h2>
-<form method="get">
+def _csv_reader(stream):
+    """
+    csv.reader over an uploaded file, with the delimiter
+    (comma or semicolon) sniffed from the first rows.
+    """
+    text = TextIOWrapper(stream, encoding="utf-8", newline="")
 
-  <input
-      name="search"
-      placeholder="Search ERF, Name or ID Number"
-      value="{{ request.args.get('search','') }}"
-  >
+    head = text.read(2048)
+    try:
+        dialect = csv.Sniffer().sniff(
+            head,
+            delimiters=",;"
+        )
+        delimiter = dialect.delimiter
+    except csv.Error:
+        delimiter = ","
 
-  <button type="submit">
-      Search
-  </button>
+    # Finish the partial line so the sample ends on a row boundary
+    head += text.readline()
 
-  <a href="/admin/owners" class="btn">
-      Clear
-  </a>
+    return csv.reader(
+        chain(StringIO(head), text),
+        delimiter=delimiter
+    )
 
-</form>
+def _owner_rows(stream, report):
+    """
+    Yields COPY lines for each owner row of an uploaded CSV,
+    applying the legacy column rules. Rows without an ERF are
+    counted as malformed.
+    """
+    reader = _csv_reader(stream)
 
-<br>
+    for line_no, row in enumerate(reader, start=1):
 
-<p>
-  <a href="/admin/owners/add" class="btn">
-    Add Owner
-  </a>
+        if not row:
+            continue
 
-  <a href="/admin/owners/export" class="btn">
-    Export Owners CSV
-  </a>
-</p>
+        if row[0].strip().lower() == "erf":
+            continue
 
-<form method="post" enctype="multipart/form-data">
-  <input type="file" name="file"><br><br>
+        erf = row[0].strip().upper()
+        name = row[1].strip() if len(row) > 1 else None
+        id_number = row[2].strip() if len(row) > 2 else None
 
-  <label>
-    <input type="checkbox" name="replace_all">
-    Replace entire owner register
-  </label><br><br>
+        if not erf:
+            report["malformed"] += 1
+            continue
+
+        yield _copy_csv_line((str(line_no), erf, name, id_number))
+
+def import_owners_csv(cur, stream, replace_all=False):
+    """
+    Imports an owner register CSV. Later rows win when an ERF
+    repeats; rows identical to the stored owner are left alone.
+    Returns {inserted, updated, skipped, malformed}.
+    """
+    report = {
+        "inserted": 0,
+        "updated": 0,
+        "skipped": 0,
+        "malformed": 0,
+    }
+
+    cur.execute(
+        """
+        CREATE TEMP TABLE owners_import (
+            line_no INTEGER,
+            erf TEXT,
+            name TEXT,
+            id_number TEXT
+        ) ON COMMIT DROP
+        """
+    )
+
+    source = IterStream(_owner_rows(stream, report))
+
+    try:
+        cur.copy_expert(
+            "COPY owners_import (line_no, erf, name, id_number) "
+            "FROM STDIN WITH (FORMAT csv)",
+            source
+        )
+    except psycopg2.errors.QueryCanceled:
+        if source.error is not None:
+            raise source.error
+        raise
+
+    if replace_all:
+        cur.execute("DELETE FROM owners")
+
+    cur.execute(
+        """
+        WITH latest AS (
+            SELECT DISTINCT ON (erf)
+                erf, name, id_number
+            FROM owners_import
+            ORDER BY erf, line_no DESC
+        ),
+        merged AS (
+            INSERT INTO owners (erf, name, id_number)
+            SELECT erf, name, id_number
+            FROM latest
+            ON CONFLICT (erf)
+            DO UPDATE SET
+                name = EXCLUDED.name,
+                id_number = EXCLUDED.id_number
+            WHERE (owners.name, owners.id_number)
+                IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.id_number)
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT
+            (SELECT COUNT(*) FROM owners_import) AS staged,
+            COUNT(*) FILTER (WHERE inserted) AS inserted,
+            COUNT(*) FILTER (WHERE NOT inserted) AS updated
+        FROM merged
+        """
+    )
+    row = cur.fetchone()
+
+    report["inserted"] = row["inserted"]
+    report["updated"] = row["updated"]
+
+    # Repeated ERFs and rows that match the register change nothing
+    report["skipped"] = row["staged"] - row["inserted"] - row["updated"]
+
+    return report
+
+# ======================================================
+# OWNER LISTING (KEYSET PAGES + TRIGRAM SEARCH)
+#
+# The owners page shows OWNERS_PAGE_SIZE rows at a time,
+# paging on erf (primary key) with ?after=<last erf>. Search
+# keeps the legacy substring match on ERF, name and ID number;
+# a pg_trgm GIN index lets Postgres answer it without a
+# sequential scan. The index is provisioned per schema and
+# skipped where pg_trgm is unavailable.
+# ======================================================
+
+OWNER_COUNT_CACHE = TTLCache(maxsize=1024, ttl=OWNER_COUNT_TTL)
+
+def create_owner_search_index(cur):
+    cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public")
+
+    # The operator class lives wherever the extension was installed
+    cur.execute(
+        """
+        SELECT n.nspname
+        FROM pg_opclass c
+        JOIN pg_namespace n ON n.oid = c.opcnamespace
+        JOIN pg_am a ON a.oid = c.opcmethod
+        WHERE c.opcname = 'gin_trgm_ops'
+        AND a.amname = 'gin'
+        LIMIT 1
+        """
+    )
+    ops = sql.SQL("{}.gin_trgm_ops").format(
+        sql.Identifier(cur.fetchone()["nspname"])
+    )
+
+    cur.execute(
+        sql.SQL(
+            """
+            CREATE INDEX owners_search_trgm
+            ON owners
+            USING gin (erf {ops}, name {ops}, id_number {ops})
+            """
+        ).format(ops=ops)
+    )
+
+schema_object(
+    "owners_search_trgm",
+    create_owner_search_index,
+    optional=True
+)
+
+def get_owner_count(cur, schema):
+    count = OWNER_COUNT_CACHE.get(schema)
+
+    if count is _MISSING:
+        cur.execute("SELECT COUNT(*) AS c FROM owners")
+        count = cur.fetchone()["c"]
+        OWNER_COUNT_CACHE.set(schema, count)
+
+    return count
+
+def invalidate_owner_count(schema, cur=None):
+    OWNER_COUNT_CACHE.invalidate(schema)
+
+    if CACHE_NOTIFY and cur is not None:
+        notify(cur, CACHE_NOTIFY_CHANNEL, f"owners:{schema}")
+
+def list_owners(cur, search="", after=None, limit=OWNERS_PAGE_SIZE):
+    """
+    One page of owners ordered by erf, starting after the given
+    ERF. Returns (rows, next_after); next_after is None on the
+    last page.
+    """
+    where = []
+    params = []
+
+    if search:
+        where.append(
+            "(erf ILIKE %s OR name ILIKE %s OR id_number ILIKE %s)"
+        )
+        params += [f"%{search}%"] * 3
+
+    if after:
+        where.append("erf > %s")
+        params.append(after)
+
+    cur.execute(
+        """
+        SELECT *
+        FROM owners
+        {where}
+        ORDER BY erf
+        LIMIT %s
+        """.format(
+            where="WHERE " + " AND ".join(where) if where else ""
+        ),
+        params + [limit + 1]
+    )
+    rows = cur.fetchall()
+
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1]["erf"]
+
+    return rows, None
+
+# ======================================================
+# OWNERS (CSV UPLOAD / VIEW)
+# ======================================================
+
+register_page("admin_owners", "admin", """
+<div class="card">
+<h2>Owners ({{ owner_count }})</h2>
+
+{% if import_report %}
+<p class="ok">
+Imported: {{ import_report.inserted }} new,
+{{ import_report.updated }} updated,
+{{ import_report.skipped }} skipped,
+{{ import_report.malformed }} malformed
+</p>
+{% endif %}
+
+{% if import_error %}
+<p class="bad">{{ import_error }}</p>
+{% endif %}
+
+<form method="get">
+
+  <input
+      name="search"
+      placeholder="Search ERF, Name or ID Number"
+      value="{{ request.args.get('search','') }}"
+  >
+
+  <button type="submit">
+      Search
+  </button>
+
+  <a href="/admin/owners" class="btn">
+      Clear
+  </a>
+
+</form>
+
+<br>
+
+<p>
+  <a href="/admin/owners/add" class="btn">
+    Add Owner
+  </a>
+
+  <a href="/admin/owners/export" class="btn">
+    Export Owners CSV
+  </a>
+</p>
+
+<form method="post" enctype="multipart/form-data">
+  <input type="file" name="file"><br><br>
+
+  <label>
+    <input type="checkbox" name="replace_all">
+    Replace entire owner register
+  </label><br><br>
 
   <button>Upload CSV</button>
 </form>
@@ -931,15 +2265,25 @@ def admin_owners():
 {% endfor %}
 
 </table>
+
+<p>
+{% if request.args.get('after') %}
+  <a href="{{ url_for('admin_owners', search=request.args.get('search') or None) }}" class="btn">
+    First Page
+  </a>
+{% endif %}
+
+{% if next_after %}
+  <a href="{{ url_for('admin_owners', search=request.args.get('search') or None, after=next_after) }}" class="btn">
+    Next Page
+  </a>
+{% endif %}
+</p>
 </div>
-""" + BASE_TAIL,
-        owners=owners,
-        owner_count=owner_count,
-        branding=branding
-    )
-    
-@app.route("/admin/owners/add", methods=["GET", "POST"])
-def admin_add_owner():
+""")
+
+@app.route("/admin/owners", methods=["GET", "POST"])
+def admin_owners():
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -951,39 +2295,48 @@ def admin_add_owner():
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    error = None
+    import_report = None
+    import_error = None
 
     if request.method == "POST":
+        file = request.files.get("file")
 
-        erf = request.form.get("erf", "").strip().upper()
-        name = request.form.get("name", "").strip()
-        id_number = request.form.get("id_number", "").strip()
+        if file:
 
-        if not erf:
-            error = "ERF is required"
-        else:
+            replace_all = request.form.get("replace_all") == "on"
 
-            cur.execute(
-                """
-                INSERT INTO owners (erf, name, id_number)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (erf)
-                DO NOTHING
-                """,
-                (erf, name, id_number)
-            )
+            try:
+                import_report = import_owners_csv(
+                    cur,
+                    file.stream,
+                    replace_all
+                )
+                invalidate_owner_count(schema, cur)
+                conn.commit()
 
-            conn.commit()
-            conn.close()
+            except (UnicodeDecodeError, csv.Error) as e:
+                conn.rollback()
+                import_error = f"Upload rejected, nothing imported: {e}"
 
-            return redirect("/admin/owners")
+    search = request.args.get("search", "").strip()
+    after = request.args.get("after", "").strip() or None
 
-    branding = get_hoa_branding(schema)
+    owners, next_after = list_owners(cur, search, after)
+    owner_count = get_owner_count(cur, schema)
 
-    conn.close()
+    branding = get_hoa_branding(schema)
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
+    return render_page(
+        "admin_owners",
+        owners=owners,
+        owner_count=owner_count,
+        next_after=next_after,
+        import_report=import_report,
+        import_error=import_error,
+        branding=branding
+    )
+    
+register_page("admin_add_owner", "admin", """
 <div class="card">
 <h2>Add Owner</h2>
 
@@ -1014,13 +2367,10 @@ def admin_add_owner():
 <a href="/admin/owners" class="btn">Back</a>
 
 </div>
-""" + BASE_TAIL,
-        error=error,
-        branding=branding
-    )
-    
-@app.route("/admin/owners/edit/<erf>", methods=["GET", "POST"])
-def admin_edit_owner(erf):
+""")
+
+@app.route("/admin/owners/add", methods=["GET", "POST"])
+def admin_add_owner():
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -1032,42 +2382,43 @@ def admin_edit_owner(erf):
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    cur.execute(
-        "SELECT * FROM owners WHERE erf=%s",
-        (erf,)
-    )
-    owner = cur.fetchone()
-
-    if not owner:
-        conn.close()
-        abort(404)
+    error = None
 
     if request.method == "POST":
 
+        erf = request.form.get("erf", "").strip().upper()
         name = request.form.get("name", "").strip()
         id_number = request.form.get("id_number", "").strip()
 
-        cur.execute(
-            """
-            UPDATE owners
-            SET name=%s,
-                id_number=%s
-            WHERE erf=%s
-            """,
-            (name, id_number, erf)
-        )
+        if not erf:
+            error = "ERF is required"
+        else:
 
-        conn.commit()
-        conn.close()
+            cur.execute(
+                """
+                INSERT INTO owners (erf, name, id_number)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (erf)
+                DO NOTHING
+                """,
+                (erf, name, id_number)
+            )
 
-        return redirect("/admin/owners")
+            invalidate_owner_count(schema, cur)
 
-    branding = get_hoa_branding(schema)
+            conn.commit()
+
+            return redirect("/admin/owners")
 
-    conn.close()
+    branding = get_hoa_branding(schema)
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
+    return render_page(
+        "admin_add_owner",
+        error=error,
+        branding=branding
+    )
+    
+register_page("admin_edit_owner", "admin", """
 <div class="card">
 
 <h2>Edit Owner</h2>
@@ -1098,13 +2449,10 @@ ID Number<br>
 <a href="/admin/owners" class="btn">Back</a>
 
 </div>
-""" + BASE_TAIL,
-    owner=owner,
-    branding=branding
-    )
+""")
 
-@app.route("/admin/owners/delete/<erf>")
-def admin_delete_owner(erf):
+@app.route("/admin/owners/edit/<erf>", methods=["GET", "POST"])
+def admin_edit_owner(erf):
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -1116,57 +2464,96 @@ def admin_delete_owner(erf):
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    # Cannot delete if registered
     cur.execute(
-        "SELECT 1 FROM registrations WHERE erf=%s",
+        "SELECT * FROM owners WHERE erf=%s",
         (erf,)
     )
-    if cur.fetchone():
-        conn.close()
-        return render_template_string(
-            BASE_HEAD_ADMIN + """
-<div class="card bad">
-Owner cannot be deleted because the ERF is registered for voting.
-<br><br>
-<a href="/admin/owners" class="btn">Back</a>
-</div>
-""" + BASE_TAIL,
-            branding=get_hoa_branding(schema)
-        )
+    owner = cur.fetchone()
 
-    # Cannot delete if primary proxy
-    cur.execute(
-        "SELECT 1 FROM owner_proxies WHERE primary_erf=%s",
-        (erf,)
-    )
-    if cur.fetchone():
-        conn.close()
-        return render_template_string(
-            BASE_HEAD_ADMIN + """
-<div class="card bad">
-Owner cannot be deleted because proxy records exist.
-<br><br>
-<a href="/admin/owners" class="btn">Back</a>
-</div>
-""" + BASE_TAIL,
-            branding=get_hoa_branding(schema)
-        )
+    if not owner:
+        abort(404)
 
-    # Cannot delete if proxy holder
-    cur.execute(
-        "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
-        (erf,)
-    )
-    if cur.fetchone():
-        conn.close()
-        return render_template_string(
-            BASE_HEAD_ADMIN + """
-<div class="card bad">
-Owner cannot be deleted because proxy records exist.
+    if request.method == "POST":
+
+        name = request.form.get("name", "").strip()
+        id_number = request.form.get("id_number", "").strip()
+
+        cur.execute(
+            """
+            UPDATE owners
+            SET name=%s,
+                id_number=%s
+            WHERE erf=%s
+            """,
+            (name, id_number, erf)
+        )
+
+        conn.commit()
+
+        return redirect("/admin/owners")
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "admin_edit_owner",
+    owner=owner,
+    branding=branding
+    )
+
+register_page("admin_delete_owner_blocked", "admin", """
+<div class="card bad">
+Owner cannot be deleted because {{ reason }}.
 <br><br>
 <a href="/admin/owners" class="btn">Back</a>
 </div>
-""" + BASE_TAIL,
+""")
+
+@app.route("/admin/owners/delete/<erf>")
+def admin_delete_owner(erf):
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    # Cannot delete if registered
+    cur.execute(
+        "SELECT 1 FROM registrations WHERE erf=%s",
+        (erf,)
+    )
+    if cur.fetchone():
+        return render_page(
+            "admin_delete_owner_blocked",
+            reason="the ERF is registered for voting",
+            branding=get_hoa_branding(schema)
+        )
+
+    # Cannot delete if primary proxy
+    cur.execute(
+        "SELECT 1 FROM owner_proxies WHERE primary_erf=%s",
+        (erf,)
+    )
+    if cur.fetchone():
+        return render_page(
+            "admin_delete_owner_blocked",
+            reason="proxy records exist",
+            branding=get_hoa_branding(schema)
+        )
+
+    # Cannot delete if proxy holder
+    cur.execute(
+        "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
+        (erf,)
+    )
+    if cur.fetchone():
+        return render_page(
+            "admin_delete_owner_blocked",
+            reason="proxy records exist",
             branding=get_hoa_branding(schema)
         )
 
@@ -1176,15 +2563,9 @@ Owner cannot be deleted because proxy records exist.
         (erf,)
     )
     if cur.fetchone():
-        conn.close()
-        return render_template_string(
-            BASE_HEAD_ADMIN + """
-<div class="card bad">
-Owner cannot be deleted because developer proxy records exist.
-<br><br>
-<a href="/admin/owners" class="btn">Back</a>
-</div>
-""" + BASE_TAIL,
+        return render_page(
+            "admin_delete_owner_blocked",
+            reason="developer proxy records exist",
             branding=get_hoa_branding(schema)
         )
 
@@ -1194,15 +2575,9 @@ Owner cannot be deleted because developer proxy records exist.
         (erf,)
     )
     if cur.fetchone():
-        conn.close()
-        return render_template_string(
-            BASE_HEAD_ADMIN + """
-<div class="card bad">
-Owner cannot be deleted because voting records exist.
-<br><br>
-<a href="/admin/owners" class="btn">Back</a>
-</div>
-""" + BASE_TAIL,
+        return render_page(
+            "admin_delete_owner_blocked",
+            reason="voting records exist",
             branding=get_hoa_branding(schema)
         )
 
@@ -1211,8 +2586,9 @@ Owner cannot be deleted because voting records exist.
         (erf,)
     )
 
+    invalidate_owner_count(schema, cur)
+
     conn.commit()
-    conn.close()
 
     return redirect("/admin/owners")
 
@@ -1230,157 +2606,156 @@ def export_owners():
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    cur.execute(
-        """
-        SELECT
-            erf,
-            name,
-            id_number
-        FROM owners
-        ORDER BY erf
-        """
-    )
+    def rows():
+        yield [
+            "ERF",
+            "NAME",
+            "ID_NUMBER"
+        ]
 
-    owners = cur.fetchall()
+        yield from export_rows(
+            schema,
+            """
+            SELECT
+                erf,
+                name,
+                id_number
+            FROM owners
+            ORDER BY erf
+            """
+        )
 
-    conn.close()
+    return csv_response("owners.csv", rows())
+    
+# ======================================================
+# REGISTRATIONS & OTP (NEGATIVE-GUARD FIXED)
+#
+# register_erfs() validates and registers any number of ERFs
+# in one statement; the registration desk, the bulk page and
+# the CSV upload all go through it.
+# ======================================================
 
-    out = StringIO()
+REGISTER_ERFS_SQL = """
+WITH requested AS (
+    SELECT erf, otp, ord
+    FROM unnest(%s::text[], %s::text[])
+        WITH ORDINALITY AS r(erf, otp, ord)
+),
+checked AS (
+    SELECT
+        r.erf,
+        r.otp,
+        r.ord,
+
+        -- ERF must exist in owners, except DEVELOPER; an ERF
+        -- that gave its proxy (owner or developer) is blocked
+        CASE
+            WHEN r.erf <> 'DEVELOPER'
+                 AND NOT EXISTS (
+                     SELECT 1 FROM owners o WHERE o.erf = r.erf
+                 )
+                THEN 'unknown'
+            WHEN EXISTS (
+                     SELECT 1 FROM owner_proxies p
+                     WHERE p.proxy_erf = r.erf
+                 )
+                 OR EXISTS (
+                     SELECT 1 FROM developer_proxies d
+                     WHERE d.erf = r.erf
+                 )
+                THEN 'proxy_given'
+        END AS rejected,
+
+        (
+            SELECT COUNT(*) FROM owner_proxies p
+            WHERE p.primary_erf = r.erf
+        ) AS proxies
+    FROM requested r
+),
+registered AS (
+    INSERT INTO registrations (erf, proxies, otp)
+    SELECT erf, proxies, otp
+    FROM checked
+    WHERE rejected IS NULL
+    ON CONFLICT (erf)
+    DO UPDATE SET
+        proxies = EXCLUDED.proxies,
+        otp = EXCLUDED.otp
+    RETURNING erf, proxies, otp
+)
+SELECT c.erf, r.proxies, r.otp, c.rejected
+FROM checked c
+LEFT JOIN registered r ON r.erf = c.erf
+ORDER BY c.ord
+"""
 
-    writer = csv.writer(
-        out,
-        delimiter=';'
-    )
+REGISTRATION_REJECTIONS = {
+    "unknown": "ERF not found in owners list",
+    "proxy_given": "ERF has given its proxy"
+}
 
-    writer.writerow([
-        "ERF",
-        "NAME",
-        "ID_NUMBER"
-    ])
+def register_erfs(cur, schema, erfs):
+    """
+    Registers the given ERFs with fresh OTPs (re-registering an
+    ERF issues a new one), refreshes their effective weights and
+    forgets their cached failed logins. Returns (registered,
+    rejected): rows of {erf, proxies, otp} and of {erf, rejected}
+    in input order.
+    """
+    erfs = list(dict.fromkeys(e.strip().upper() for e in erfs))
+    otps = [generate_otp() for _ in erfs]
 
-    for o in owners:
-        writer.writerow([
-            o["erf"],
-            o["name"],
-            o["id_number"]
-        ])
+    cur.execute(REGISTER_ERFS_SQL, (erfs, otps))
+    rows = cur.fetchall()
 
-    return send_file(
-        BytesIO(out.getvalue().encode()),
-        mimetype="text/csv",
-        as_attachment=True,
-        download_name="owners.csv"
-    )
-    
-# ======================================================
-# REGISTRATIONS & OTP (NEGATIVE-GUARD FIXED)
-# ======================================================
+    registered = [r for r in rows if r["rejected"] is None]
+    rejected = [r for r in rows if r["rejected"] is not None]
 
-@app.route("/admin/registrations", methods=["GET", "POST"])
-def admin_registrations():
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+    if registered:
+        refresh_effective_weights(cur, [r["erf"] for r in registered])
+        forget_failed_logins(schema, [r["erf"] for r in registered], cur)
 
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+    return registered, rejected
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
+def _registration_csv_erfs(stream):
+    """
+    ERFs from the first column of an uploaded CSV.
+    """
+    for row in _csv_reader(stream):
+        if not row or not row[0].strip():
+            continue
 
-    message = None
+        if row[0].strip().lower() == "erf":
+            continue
 
-    if request.method == "POST":
-        erf = request.form.get("erf", "").strip().upper()
+        yield row[0]
 
-        # ERF must exist in owners, except DEVELOPER
-        if erf != "DEVELOPER":
-            cur.execute(
-                "SELECT 1 FROM owners WHERE erf=%s",
-                (erf,)
-            )
-            owner = cur.fetchone()
-            if not owner:
-                conn.close()
-                return render_template_string(
-                    BASE_HEAD_ADMIN + """
+register_page("admin_registration_unknown", "admin", """
 <div class="card bad">
 ERF not found in owners list.
 </div>
-""" + BASE_TAIL
-                )
-
-        # BLOCK if ERF has given proxy to someone else
-        cur.execute(
-            "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
-            (erf,)
-        )
-        proxy_given = cur.fetchone()
-
-        # BLOCK if ERF is a developer proxy
-        cur.execute(
-            "SELECT 1 FROM developer_proxies WHERE erf=%s",
-            (erf,)
-        )
-        dev_proxy = cur.fetchone()
+""")
 
-        if proxy_given or dev_proxy:
-            conn.close()
-            return render_template_string(
-                BASE_HEAD_ADMIN + """
+register_page("admin_registration_proxy_given", "admin", """
 <div class="card bad">
 This ERF has given its proxy and cannot register.
 </div>
-""" + BASE_TAIL
-            )
-
-        # Count owner proxies automatically
-        cur.execute(
-            "SELECT COUNT(*) AS proxy_count FROM owner_proxies WHERE primary_erf=%s",
-            (erf,)
-        )
-        proxy_row = cur.fetchone()
-        proxy_count = proxy_row["proxy_count"] if proxy_row else 0
-
-        otp = generate_otp()
-
-        cur.execute(
-            """
-            INSERT INTO registrations (erf, proxies, otp)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (erf)
-            DO UPDATE SET
-                proxies = EXCLUDED.proxies,
-                otp = EXCLUDED.otp
-            """,
-            (erf, proxy_count, otp)
-        )
-
-        conn.commit()
-        message = f"OTP for {erf}: {otp}"
-
-    cur.execute(
-        "SELECT * FROM registrations ORDER BY erf"
-    )
-    rows = cur.fetchall()
-
-    conn.close()
-
-    branding = get_hoa_branding(schema)
+""")
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
+register_page("admin_registrations", "admin", """
 <div class="card">
 <h2>Registrations</h2>
-{% if message %}
-<p class="ok">{{ message }}</p>
-{% endif %}
-<form method="post">
-  <input name="erf" placeholder="ERF">
+<p id="registration-message" class="ok">{{ message or "" }}</p>
+<form method="post" id="registration-form">
+  <input name="erf" placeholder="ERF" autofocus>
   <button>Register</button>
 </form>
-<table>
+<p>
+  <a href="/admin/registrations/bulk" class="btn">Bulk Registration</a>
+  <a href="/admin/scan_register" class="btn">Scan Check-in</a>
+  <a href="/admin/registrations/slips" class="btn" target="_blank">Print All OTP Slips</a>
+</p>
+<table id="registrations">
 <tr>
   <th>ERF</th>
   <th>Numeric Proxies</th>
@@ -1388,7 +2763,7 @@ This ERF has given its proxy and cannot register.
   <th>Action</th>
 </tr>
 {% for r in rows %}
-<tr>
+<tr id="reg-{{ r.erf }}">
   <td>{{ r.erf }}</td>
   <td>{{ r.proxies }}</td>
   <td>{{ r.otp }}</td>
@@ -1396,6 +2771,7 @@ This ERF has given its proxy and cannot register.
   <td>
     <form method="post"
           action="/admin/registrations/{{ r.erf }}/delete"
+          data-erf="{{ r.erf }}"
           style="display:inline"
           onsubmit="return confirm('Delete this registration?');">
 
@@ -1409,15 +2785,110 @@ This ERF has given its proxy and cannot register.
 {% endfor %}
 </table>
 </div>
-""" + BASE_TAIL,
-        rows=rows,
-        message=message,
-        branding=branding
-    )
 
-@app.route("/admin/registrations/<erf>/delete", methods=["POST"])
-def admin_delete_registration(erf):
+<script>
+// Registration desk: register and delete through the JSON API
+// and patch the table in place instead of reloading the page.
+(function () {
+  if (!window.fetch) return;
+
+  var api = "{{ url_for('api_register') }}";
+  var form = document.getElementById("registration-form");
+  var table = document.getElementById("registrations");
+  var message = document.getElementById("registration-message");
+
+  function show(text, ok) {
+    message.textContent = text;
+    message.className = ok ? "ok" : "bad";
+  }
+
+  function call(method, url, body) {
+    return fetch(url, {
+      method: method,
+      credentials: "same-origin",
+      headers: {"Content-Type": "application/json"},
+      body: body ? JSON.stringify(body) : null
+    }).then(function (res) {
+      return res.json().then(function (data) {
+        return {ok: res.ok, data: data};
+      });
+    });
+  }
+
+  function cell(tr, text) {
+    var td = document.createElement("td");
+    td.textContent = text;
+    tr.appendChild(td);
+    return td;
+  }
+
+  function addRow(r) {
+    var old = document.getElementById("reg-" + r.erf);
+    if (old) old.parentNode.removeChild(old);
+
+    var tr = document.createElement("tr");
+    tr.id = "reg-" + r.erf;
+    cell(tr, r.erf);
+    cell(tr, r.proxies);
+    cell(tr, r.otp);
+
+    var del = document.createElement("form");
+    del.method = "post";
+    del.action = "/admin/registrations/" + encodeURIComponent(r.erf) + "/delete";
+    del.style.display = "inline";
+    del.setAttribute("data-erf", r.erf);
+    del.onsubmit = function () {
+      return confirm("Delete this registration?");
+    };
+    var button = document.createElement("button");
+    button.textContent = "Delete";
+    del.appendChild(button);
+    cell(tr, "").appendChild(del);
+
+    var header = table.rows[0];
+    header.parentNode.insertBefore(tr, header.nextSibling);
+  }
+
+  form.addEventListener("submit", function (e) {
+    e.preventDefault();
+    var input = form.elements.erf;
+
+    call("POST", api, {erf: input.value}).then(function (res) {
+      if (res.data.registered && res.data.registered.length) {
+        var r = res.data.registered[0];
+        addRow(r);
+        show("OTP for " + r.erf + ": " + r.otp, true);
+        input.value = "";
+      } else if (res.data.rejected && res.data.rejected.length) {
+        show(res.data.rejected[0].reason, false);
+      } else {
+        show(res.data.error || "Registration failed", false);
+      }
+      input.focus();
+    });
+  });
+
+  table.addEventListener("submit", function (e) {
+    var erf = e.target.getAttribute("data-erf");
+    if (!erf || e.defaultPrevented) return;
+    e.preventDefault();
+
+    call("DELETE", api + "/" + encodeURIComponent(erf)).then(function (res) {
+      if (res.ok) {
+        var tr = document.getElementById("reg-" + erf);
+        if (tr) tr.parentNode.removeChild(tr);
+        show("Registration for " + erf + " deleted", true);
+      } else {
+        show(res.data.error, false);
+      }
+    });
+  });
+})();
+</script>
+""")
 
+@app.route("/admin/registrations", methods=["GET", "POST"])
+def admin_registrations():
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -1429,249 +2900,270 @@ def admin_delete_registration(erf):
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    # Protect audit trail
-    cur.execute(
-        """
-        SELECT 1
-        FROM votes
-        WHERE erf=%s
-        LIMIT 1
-        """,
-        (erf,)
-    )
-
-    if cur.fetchone():
-
-        conn.close()
-
-        return render_template_string(
-            BASE_HEAD_ADMIN + """
-<div class="card bad">
+    message = None
 
-<h2>Cannot Delete Registration</h2>
+    if request.method == "POST":
+        erf = request.form.get("erf", "")
 
-<p>
-This ERF has already voted and the registration
-cannot be removed.
-</p>
+        registered, rejected = register_erfs(cur, schema, [erf])
 
-<a href="/admin/registrations" class="btn">
-Back
-</a>
+        if rejected:
+            conn.rollback()
+            return render_page(
+                "admin_registration_" + rejected[0]["rejected"]
+            )
 
-</div>
-""" + BASE_TAIL,
-            branding=get_hoa_branding(schema)
-        )
+        conn.commit()
+        message = f"OTP for {registered[0]['erf']}: {registered[0]['otp']}"
 
-    # Delete registration
     cur.execute(
-        """
-        DELETE FROM registrations
-        WHERE erf=%s
-        """,
-        (erf,)
+        "SELECT * FROM registrations ORDER BY erf"
     )
+    rows = cur.fetchall()
 
-    conn.commit()
-    conn.close()
-
-    return redirect("/admin/registrations")
+    branding = get_hoa_branding(schema)
 
-# ======================================================
-# PUBLIC VOTING — LOGIN / LOGOUT (UNIFIED)
-# ======================================================
+    return render_page(
+        "admin_registrations",
+        rows=rows,
+        message=message,
+        branding=branding
+    )
 
-@app.route("/vote/<hoa>/login", methods=["GET", "POST"])
-def vote_login(hoa):
+register_page("admin_registrations_bulk", "admin", """
+<div class="card">
+<h2>Bulk Registration</h2>
 
-    conn = get_conn()
-    cur = conn.cursor()
+<p>
+Enter ERFs separated by spaces, commas or new lines, or upload
+a CSV with the ERF in the first column. All valid ERFs are
+registered together; registering an ERF again issues a new OTP.
+</p>
 
-    cur.execute(
-        """
-        SELECT schema_name
-        FROM public.hoas
-        WHERE schema_name = %s
-        AND enabled = TRUE
-        """,
-        (hoa,)
-    )
+{% if error %}
+<p class="bad">{{ error }}</p>
+{% endif %}
 
-    row = cur.fetchone()
-    conn.close()
+<form method="post" enctype="multipart/form-data">
+  <p>
+    <textarea name="erfs" rows="8" cols="40" placeholder="ERFs"></textarea>
+  </p>
+  <p>
+    <input type="file" name="file">
+  </p>
+  <button>Register All</button>
+</form>
 
-    if not row:
-        abort(403)
+{% if registered or rejected %}
 
-    schema = row["schema_name"]
-    session["hoa_schema"] = schema
+<h3>Registered: {{ registered|length }}</h3>
 
-    if request.method == "POST":
+{% if registered %}
+<form method="get" action="/admin/registrations/slips" target="_blank">
+  {% for r in registered %}
+  <input type="hidden" name="erf" value="{{ r.erf }}">
+  {% endfor %}
+  <button>Print OTP Slips</button>
+</form>
 
-        erf = request.form.get("erf", "").strip().upper()
-        password = request.form.get("password", "").strip()
-        vote_mode = request.form.get("vote_mode", "AGM").strip().upper()
-
-        conn = get_conn()
-        cur = conn.cursor()
-        set_search_path(cur, schema)
+<table>
+<tr>
+  <th>ERF</th>
+  <th>Numeric Proxies</th>
+  <th>OTP</th>
+</tr>
+{% for r in registered %}
+<tr>
+  <td>{{ r.erf }}</td>
+  <td>{{ r.proxies }}</td>
+  <td>{{ r.otp }}</td>
+</tr>
+{% endfor %}
+</table>
+{% endif %}
 
-        valid = False
+{% if rejected %}
+<h3 class="bad">Rejected: {{ rejected|length }}</h3>
+<table>
+<tr>
+  <th>ERF</th>
+  <th>Reason</th>
+</tr>
+{% for r in rejected %}
+<tr>
+  <td>{{ r.erf }}</td>
+  <td>{{ reasons[r.rejected] }}</td>
+</tr>
+{% endfor %}
+</table>
+{% endif %}
 
-        if vote_mode == "AGM":
+{% endif %}
 
-            cur.execute(
-                """
-                SELECT 1
-                FROM registrations
-                WHERE erf=%s AND otp=%s
-                """,
-                (erf, password)
-            )
+<br>
+<a href="/admin/registrations" class="btn">Back</a>
+</div>
+""")
 
-            valid = cur.fetchone() is not None
+@app.route("/admin/registrations/bulk", methods=["GET", "POST"])
+def admin_registrations_bulk():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
 
-        elif vote_mode == "GENERAL":
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
 
-            cur.execute(
-                """
-                SELECT 1
-                FROM owners
-                WHERE erf=%s AND id_number=%s
-                """,
-                (erf, password)
-            )
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
 
-            valid = cur.fetchone() is not None
+    registered, rejected = [], []
+    error = None
 
-        conn.close()
+    if request.method == "POST":
+        erfs = (
+            request.form.get("erfs", "")
+            .replace(",", " ")
+            .replace(";", " ")
+            .split()
+        )
 
-        if not valid:
-            branding = get_hoa_branding(schema)
+        try:
+            file = request.files.get("file")
+            if file:
+                erfs += _registration_csv_erfs(file.stream)
 
-            return render_template_string(
-                BASE_HEAD_PUBLIC + """
-<div class="card bad">
-Invalid login credentials
-</div>
-""" + BASE_TAIL,
-                branding=branding
-            )
+        except (UnicodeDecodeError, csv.Error) as e:
+            error = f"Upload rejected, nothing registered: {e}"
 
-        session["voter_erf"] = erf
-        session["hoa_schema"] = schema
-        session["vote_mode"] = vote_mode
+        if erfs and not error:
+            registered, rejected = register_erfs(cur, schema, erfs)
+            conn.commit()
 
-        return redirect(f"/vote/{hoa}")
+    return render_page(
+        "admin_registrations_bulk",
+        registered=registered,
+        rejected=rejected,
+        reasons=REGISTRATION_REJECTIONS,
+        error=error,
+        branding=get_hoa_branding(schema)
+    )
 
-    branding = get_hoa_branding(schema)
+register_page("admin_registration_slips", None, """
+<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>OTP Slips</title>
+<style>
 
-    return render_template_string(
-        BASE_HEAD_PUBLIC + """
-<div class="card">
-<h2>Voting Login</h2>
+body {
+    font-family: Arial, sans-serif;
+    margin: 10mm;
+}
 
-<form method="post">
+.slip {
+    display: inline-block;
+    width: 85mm;
+    margin: 0 4mm 4mm 0;
+    padding: 4mm;
+    border: 1px dashed #64748b;
+    break-inside: avoid;
+    vertical-align: top;
+}
 
-  <p>
-    Voting Type<br>
-    <select name="vote_mode">
-      <option value="AGM">AGM</option>
-      <option value="GENERAL">GENERAL</option>
-    </select>
-  </p>
+.otp {
+    font-family: monospace;
+    font-size: 22px;
+    letter-spacing: 3px;
+}
 
-  <p>
-    <input name="erf" placeholder="ERF">
-  </p>
+@media print {
+    .noprint { display: none; }
+}
 
-  <p>
-    <input name="password" placeholder="OTP or ID Number">
-  </p>
+</style>
+</head>
+<body>
 
-  <button>Login</button>
+<p class="noprint">
+  <button onclick="window.print()">Print</button>
+  {{ slips|length }} slips
+</p>
 
-</form>
+{% for s in slips %}
+<div class="slip">
+  <strong>{{ branding.portal_title or branding.name }}</strong><br>
+  ERF: <strong>{{ s.erf }}</strong>
+  {% if s.proxies %}(+{{ s.proxies }} proxies){% endif %}<br>
+  OTP: <span class="otp">{{ s.otp }}</span><br>
+  <small>{{ login_url }}</small>
 </div>
-""" + BASE_TAIL,
-        branding=branding
-    )
-
+{% endfor %}
 
-@app.route("/vote/<hoa>/logout")
-def vote_logout(hoa):
-    session.pop("voter_erf", None)
-    session.pop("vote_mode", None)
-    return redirect(f"/vote/{hoa}/login")
+</body>
+</html>
+""")
 
-# ======================================================
-# PUBLIC VOTING — HOA SELECTION PORTAL
-# ======================================================
+@app.route("/admin/registrations/slips")
+def admin_registration_slips():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
 
-@app.route("/vote")
-def vote_portal():
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
 
     conn = get_conn()
     cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    # Selected ERFs (a bulk batch) or every registration
+    erfs = request.args.getlist("erf")
 
     cur.execute(
         """
-        SELECT name, schema_name
-        FROM public.hoas
-        WHERE enabled = TRUE
-        ORDER BY name
-        """
+        SELECT erf, proxies, otp
+        FROM registrations
+        WHERE %s OR erf = ANY(%s)
+        ORDER BY erf
+        """,
+        (not erfs, erfs)
     )
+    slips = cur.fetchall()
 
-    hoas = cur.fetchall()
-    conn.close()
+    return render_page(
+        "admin_registration_slips",
+        slips=slips,
+        login_url=url_for("vote_login", hoa=schema, _external=True),
+        branding=get_hoa_branding(schema)
+    )
 
-    if not hoas:
-        abort(404)
+register_page("admin_delete_registration", "admin", """
+<div class="card bad">
 
-    return render_template_string(
-        BASE_HEAD_PUBLIC + """
-<div class="card">
-<h2>Select Your HOA</h2>
+<h2>Cannot Delete Registration</h2>
 
-<table>
-<tr>
-  <th>HOA Name</th>
-  <th>Voting Portal</th>
-</tr>
+<p>
+This ERF has already voted and the registration
+cannot be removed.
+</p>
 
-{% for h in hoas %}
-<tr>
-  <td>{{ h.name }}</td>
-  <td>
-    <a href="/vote/{{ h.schema_name }}/login">
-      Enter Voting Portal
-    </a>
-  </td>
-</tr>
-{% endfor %}
+<a href="/admin/registrations" class="btn">
+Back
+</a>
 
-</table>
 </div>
-""" + BASE_TAIL,
-        hoas=hoas,
-        branding=None
-    )
-    
-# ======================================================
-# PUBLIC VOTING — TOPIC LIST
-# ======================================================
+""")
 
-@app.route("/vote/<hoa>")
-def vote_index(hoa):
-    if not session.get("voter_erf"):
-        return redirect(f"/vote/{hoa}/login")
+@app.route("/admin/registrations/<erf>/delete", methods=["POST"])
+def admin_delete_registration(erf):
 
-    schema = session.get("hoa_schema")
-    if schema != hoa:
-        return redirect(f"/vote/{hoa}/login")
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
 
+    schema = session.get("hoa_schema")
     if not schema:
         abort(403)
 
@@ -1679,177 +3171,1576 @@ def vote_index(hoa):
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    vote_mode = session.get("vote_mode", "AGM")
+    if not delete_registration(cur, erf):
+
+        return render_page(
+            "admin_delete_registration",
+            branding=get_hoa_branding(schema)
+        )
+
+    conn.commit()
+
+    return redirect("/admin/registrations")
+
+def delete_registration(cur, erf):
+    """
+    Removes a registration unless the ERF has voted. Returns
+    False (and changes nothing) when it has.
+    """
 
+    # Protect audit trail
     cur.execute(
         """
-        SELECT * FROM topics
-        WHERE is_open = TRUE
-        AND vote_mode = %s
-        ORDER BY id
+        SELECT 1
+        FROM votes
+        WHERE erf=%s
+        LIMIT 1
         """,
-        (vote_mode,)
+        (erf,)
     )
-    topics = cur.fetchall()
 
-    conn.close()
-
-    branding = get_hoa_branding(schema)
+    if cur.fetchone():
+        return False
 
-    return render_template_string(
-        BASE_HEAD_PUBLIC + """
-    <div class="card">
-    <h2>Open Voting Topics</h2>
-<ul>
-{% for t in topics %}
-  <li>
-    <a href="/vote/{{ hoa }}/{{ t.id }}">{{ t.title }}</a>
-  </li>
-{% endfor %}
-</ul>
-</div>
-""" + BASE_TAIL,
-        topics=topics,
-        hoa=hoa,
-        branding=branding
+    # Delete registration
+    cur.execute(
+        """
+        DELETE FROM registrations
+        WHERE erf=%s
+        """,
+        (erf,)
     )
 
+    refresh_effective_weights(cur, [erf])
+
+    return True
+
 # ======================================================
-# OWNER PROXY SYSTEM (ADD / DELETE)
+# REGISTRATION DESK JSON API
+#
+# Each call answers with the outcome of that action only, so
+# the desk page can patch its table without a reload; response
+# size does not grow with the number of registrations. Bodies
+# must be JSON, which a cross-site form cannot send.
 # ======================================================
 
-@app.route("/admin/owner_proxies", methods=["GET", "POST"])
-def admin_owner_proxies():
+def api_error(status, message, **fields):
+    response = jsonify(error=message, **fields)
+    response.status_code = status
+    return response
+
+def _api_admin_cursor():
+    """
+    Cursor bound to the logged-in admin's schema; aborts with a
+    JSON 401/403 instead of the login redirect.
+    """
     if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+        abort(api_error(401, "Not logged in"))
 
     schema = session.get("hoa_schema")
     if not schema:
-        abort(403)
+        abort(api_error(403, "No HOA selected"))
 
-    conn = get_conn()
-    cur = conn.cursor()
+    cur = get_conn().cursor()
     set_search_path(cur, schema)
 
-    error = None
+    return cur
 
-    if request.method == "POST":
-        primary = request.form.get("primary_erf", "").strip().upper()
-        proxy = request.form.get("proxy_erf", "").strip().upper()
+@app.route("/api/admin/registrations", methods=["POST"])
+def api_register():
+    """
+    Registers {"erf": ...} or {"erfs": [...]}; answers with the
+    registered rows (with OTPs) and the rejected ERFs.
+    """
+    cur = _api_admin_cursor()
 
-        if not primary or not proxy:
-            error = "Both ERFs are required"
-        elif primary == proxy:
-            error = "Cannot proxy an ERF to itself"
-        else:
-            # Both must exist as owners
-            cur.execute(
-                "SELECT 1 FROM owners WHERE erf=%s",
-                (proxy,)
-            )
-            p_owner = cur.fetchone()
-            cur.execute(
-                "SELECT 1 FROM owners WHERE erf=%s",
-                (primary,)
-            )
-            x_owner = cur.fetchone()
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return api_error(400, "Expected a JSON object")
 
-            if not p_owner or not x_owner:
-                error = "Both ERFs must exist in owners"
-            else:
-                # Proxy ERF must not already be an owner proxy
-                cur.execute(
-                    "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
-                     (proxy,)
+    erfs = data.get("erfs", [data.get("erf")])
+    if not isinstance(erfs, list) or not all(
+        isinstance(e, str) for e in erfs
+    ):
+        return api_error(400, "erf must be a string, erfs a list of strings")
+
+    registered, rejected = register_erfs(
+        cur, session["hoa_schema"], erfs
+    )
+    cur.connection.commit()
+
+    return jsonify(
+        registered=[
+            {"erf": r["erf"], "proxies": r["proxies"], "otp": r["otp"]}
+            for r in registered
+        ],
+        rejected=[
+            {
+                "erf": r["erf"],
+                "code": r["rejected"],
+                "reason": REGISTRATION_REJECTIONS[r["rejected"]]
+            }
+            for r in rejected
+        ]
+    )
+
+@app.route("/api/admin/registrations/<erf>", methods=["DELETE"])
+def api_delete_registration(erf):
+    cur = _api_admin_cursor()
+
+    if not delete_registration(cur, erf):
+        cur.connection.rollback()
+        return api_error(
+            409,
+            "This ERF has already voted and the registration cannot be removed.",
+            erf=erf
+        )
+
+    cur.connection.commit()
+
+    return jsonify(erf=erf, deleted=True)
+
+# ======================================================
+# LOGIN THROTTLING & FAILED-LOGIN CACHE
+#
+# Every voter login attempt takes a token from the bucket for
+# (HOA, ERF, client IP) before anything else; an empty bucket
+# is answered 429 without touching the HOA schema. A failed
+# credential check is remembered for LOGIN_FAILURE_TTL, so an
+# identical retry is refused without a query.
+#
+# The in-memory buckets are per worker process; with several
+# workers or instances use LOGIN_LIMITER=postgres, which keeps
+# them in an unlogged table in public (one upsert per attempt).
+# Behind a proxy, make sure request.remote_addr is the client
+# (e.g. werkzeug's ProxyFix).
+# ======================================================
+
+class TokenBuckets:
+    """
+    In-process token buckets: each key holds up to burst
+    tokens, refilled at rate per second.
+    """
+
+    def __init__(self, burst, rate, maxsize):
+        self.burst = burst
+        self.rate = rate
+        # A bucket left alone this long is full again: forget it
+        self.buckets = TTLCache(maxsize, ttl=burst / rate)
+        self.lock = threading.Lock()
+
+    def allow(self, key):
+        now = time.monotonic()
+
+        with self.lock:
+            tokens, updated = self.buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+
+            self.buckets.set(key, (tokens, now))
+
+        return allowed
+
+LOGIN_BUCKETS_DDL = """
+CREATE UNLOGGED TABLE IF NOT EXISTS public.login_buckets (
+    key TEXT PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    allowed BOOLEAN NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+)
+"""
+
+# Refill since the last attempt, then take a token if there is one
+LOGIN_TAKE_TOKEN_SQL = """
+INSERT INTO public.login_buckets AS b (key, tokens, allowed)
+VALUES (%(key)s, %(burst)s - 1, TRUE)
+ON CONFLICT (key) DO UPDATE SET
+    allowed = {refilled} >= 1,
+    tokens = {refilled} - CASE WHEN {refilled} >= 1 THEN 1 ELSE 0 END,
+    updated_at = now()
+RETURNING allowed
+""".format(
+    refilled=(
+        "LEAST(%(burst)s, b.tokens + %(rate)s * "
+        "GREATEST(EXTRACT(EPOCH FROM now() - b.updated_at), 0))"
+    )
+)
+
+class PostgresTokenBuckets:
+    """
+    Token buckets shared by every worker, in
+    public.login_buckets. Uses the request's connection; the
+    first call in each worker creates the table under an
+    advisory lock, so workers starting together do not race.
+    """
+
+    def __init__(self, burst, rate):
+        self.burst = burst
+        self.rate = rate
+        self.ready = False
+
+    def allow(self, key):
+        conn = get_conn()
+        cur = conn.cursor()
+
+        if not self.ready:
+            cur.execute(
+                "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                ("provision:login_buckets",)
+            )
+            cur.execute(LOGIN_BUCKETS_DDL)
+            conn.commit()
+            self.ready = True
+
+        cur.execute(
+            LOGIN_TAKE_TOKEN_SQL,
+            {"key": key, "burst": self.burst, "rate": self.rate}
+        )
+        allowed = cur.fetchone()["allowed"]
+
+        # Now and then drop buckets that have refilled
+        if random.random() < 0.01:
+            cur.execute(
+                """
+                DELETE FROM public.login_buckets
+                WHERE updated_at < now() - make_interval(secs => %s)
+                """,
+                (self.burst / self.rate,)
+            )
+
+        conn.commit()
+        return allowed
+
+class NoLimit:
+
+    def allow(self, key):
+        return True
+
+if LOGIN_LIMITER == "postgres":
+    login_limiter = PostgresTokenBuckets(LOGIN_BURST, LOGIN_RATE / 60)
+elif LOGIN_LIMITER == "off":
+    login_limiter = NoLimit()
+else:
+    login_limiter = TokenBuckets(
+        LOGIN_BURST,
+        LOGIN_RATE / 60,
+        LOGIN_LIMITER_SIZE
+    )
+
+FAILED_LOGINS = TTLCache(LOGIN_LIMITER_SIZE, ttl=LOGIN_FAILURE_TTL)
+
+def forget_failed_logins(schema, erfs, cur=None):
+    """
+    Drops cached failures for ERFs whose registration or OTP
+    changed, here and (with CACHE_NOTIFY and a cursor) in every
+    other worker, which drops the whole schema's.
+    """
+    for erf in erfs:
+        FAILED_LOGINS.invalidate_prefix((schema, erf))
+
+    if CACHE_NOTIFY and cur is not None:
+        notify(cur, CACHE_NOTIFY_CHANNEL, f"logins:{schema}")
+
+def attempt_voter_login(schema, erf, password, vote_mode):
+    """
+    Throttled, cached check_voter_login(). Returns "ok",
+    "failed" or "throttled".
+    """
+    if not login_limiter.allow(f"{schema}|{erf}|{request.remote_addr}"):
+        return "throttled"
+
+    failure_key = (
+        schema,
+        erf,
+        vote_mode,
+        hashlib.sha256(password.encode("utf-8")).hexdigest()
+    )
+    if FAILED_LOGINS.get(failure_key) is not _MISSING:
+        return "failed"
+
+    cur = get_conn().cursor()
+    set_search_path(cur, schema)
+
+    if not check_voter_login(cur, erf, password, vote_mode):
+        FAILED_LOGINS.set(failure_key, True)
+        return "failed"
+
+    return "ok"
+
+register_page("vote_login_throttled", "public", """
+<div class="card bad">
+Too many login attempts. Please wait a minute and try again.
+</div>
+""")
+
+def login_refused(schema, result):
+    branding = get_hoa_branding(schema)
+
+    if result == "throttled":
+        return render_page(
+            "vote_login_throttled",
+            branding=branding
+        ), 429
+
+    return render_page(
+        "vote_login_failed",
+        branding=branding
+    )
+
+# ======================================================
+# PUBLIC VOTING — LOGIN / LOGOUT (UNIFIED)
+# ======================================================
+
+register_page("vote_login_failed", "public", """
+<div class="card bad">
+Invalid login credentials
+</div>
+""")
+
+register_page("vote_login", "public", """
+<div class="card">
+<h2>Voting Login</h2>
+
+<form method="post">
+
+  <p>
+    Voting Type<br>
+    <select name="vote_mode">
+      <option value="AGM">AGM</option>
+      <option value="GENERAL">GENERAL</option>
+    </select>
+  </p>
+
+  <p>
+    <input name="erf" placeholder="ERF">
+  </p>
+
+  <p>
+    <input name="password" placeholder="OTP or ID Number">
+  </p>
+
+  <button>Login</button>
+
+</form>
+</div>
+""")
+
+def check_voter_login(cur, erf, password, vote_mode):
+    """
+    AGM voters log in with their registration OTP, GENERAL
+    voters with their ID number.
+    """
+    if vote_mode == "AGM":
+
+        cur.execute(
+            """
+            SELECT 1
+            FROM registrations
+            WHERE erf=%s AND otp=%s
+            """,
+            (erf, password)
+        )
+
+        return cur.fetchone() is not None
+
+    if vote_mode == "GENERAL":
+
+        cur.execute(
+            """
+            SELECT 1
+            FROM owners
+            WHERE erf=%s AND id_number=%s
+            """,
+            (erf, password)
+        )
+
+        return cur.fetchone() is not None
+
+    return False
+
+@app.route("/vote/<hoa>/login", methods=["GET", "POST"])
+def vote_login(hoa):
+
+    tenant = public_tenant(hoa)
+
+    schema = tenant["schema_name"]
+    session["hoa_schema"] = schema
+
+    if request.method == "POST":
+
+        erf = request.form.get("erf", "").strip().upper()
+        password = request.form.get("password", "").strip()
+        vote_mode = request.form.get("vote_mode", "AGM").strip().upper()
+
+        result = attempt_voter_login(
+            schema, erf, password, vote_mode
+        )
+
+        if result != "ok":
+            return login_refused(schema, result)
+
+        session["voter_erf"] = erf
+        session["hoa_schema"] = schema
+        session["vote_mode"] = vote_mode
+
+        return redirect(f"/vote/{hoa}")
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "vote_login",
+        branding=branding
+    )
+
+
+@app.route("/vote/<hoa>/logout")
+def vote_logout(hoa):
+    session.pop("voter_erf", None)
+    session.pop("vote_mode", None)
+    return redirect(f"/vote/{hoa}/login")
+
+# ======================================================
+# QR CHECK-IN & QUICK LOGIN
+#
+# The desk scans (or types) an ERF at /admin/scan_register,
+# which registers it and shows a QR code of the owner's quick
+# login link; the owner scans it with their phone and lands
+# logged in (AGM mode). QR PNGs are encoded once per link,
+# i.e. per (HOA, ERF, OTP), and kept in a bounded LRU; the
+# link's hash is the ETag, so a repeat request for an
+# unchanged OTP is answered 304 without touching the cache.
+# Needs the optional qrcode package (pure-PNG backend); without
+# it the desk still shows the OTP and the link.
+# ======================================================
+
+QR_CACHE = TTLCache(QR_CACHE_SIZE)
+
+def quick_login_url(schema, erf, otp):
+    return url_for(
+        "vote_quick",
+        hoa=schema,
+        erf=erf,
+        otp=otp,
+        _external=True
+    )
+
+def render_qr_png(data):
+    out = BytesIO()
+    qrcode.make(data, image_factory=PyPNGImage).save(out)
+    return out.getvalue()
+
+register_page("admin_scan_register", "admin", """
+<div class="card">
+<h2>Scan Check-in</h2>
+
+<p>
+Scan the owner's ERF (most scanners send Enter after the code)
+or type it and press Enter.
+</p>
+
+<form method="post">
+  <input name="scanned" id="scanned" placeholder="ERF"
+         autofocus autocomplete="off">
+  <button>Register</button>
+</form>
+
+{% if error %}
+<p class="bad">{{ error }}</p>
+{% endif %}
+
+{% if registration %}
+<h3>Registered: {{ registration.erf }}</h3>
+
+<p>
+One-time PIN: <strong><code>{{ registration.otp }}</code></strong>
+{% if registration.proxies %}
+({{ registration.proxies }} proxies)
+{% endif %}
+</p>
+
+{% if qr_enabled %}
+<p>Have the owner scan this code to open the voting portal:</p>
+<p>
+  <img src="{{ url_for('qr_image', erf=registration.erf) }}"
+       alt="QR code for {{ registration.erf }}">
+</p>
+{% endif %}
+
+<p>
+Or open this link on the phone:<br>
+<a href="{{ quick_url }}">{{ quick_url }}</a>
+</p>
+{% endif %}
+
+<br>
+<a href="/admin/registrations" class="btn">Back to Registrations</a>
+</div>
+
+<script>
+// Keep the scanner input focused between scans
+(function () {
+  var input = document.getElementById("scanned");
+  input.addEventListener("blur", function () {
+    setTimeout(function () { input.focus(); }, 50);
+  });
+})();
+</script>
+""")
+
+@app.route("/admin/scan_register", methods=["GET", "POST"])
+def admin_scan_register():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    registration = None
+    quick_url = None
+    error = None
+
+    if request.method == "POST":
+        scanned = request.form.get("scanned", "")
+
+        if not scanned.strip():
+            error = "No ERF scanned."
+
+        else:
+            registered, rejected = register_erfs(cur, schema, [scanned])
+
+            if rejected:
+                conn.rollback()
+                error = (
+                    f"{rejected[0]['erf']}: "
+                    f"{REGISTRATION_REJECTIONS[rejected[0]['rejected']]}"
                 )
-                already_proxy = cur.fetchone()
 
-                # Proxy ERF must not be a developer proxy
-                cur.execute(
-                    "SELECT 1 FROM developer_proxies WHERE erf=%s",
-                    (proxy,)
+            else:
+                conn.commit()
+                registration = registered[0]
+                quick_url = quick_login_url(
+                    schema,
+                    registration["erf"],
+                    registration["otp"]
                 )
-                dev_proxy = cur.fetchone()
 
+    return render_page(
+        "admin_scan_register",
+        registration=registration,
+        quick_url=quick_url,
+        error=error,
+        qr_enabled=qrcode is not None,
+        branding=get_hoa_branding(schema)
+    )
+
+@app.route("/admin/registrations/<erf>/qr")
+def qr_image(erf):
+    """
+    PNG QR code of the ERF's quick login link (current OTP).
+    """
+    if not session.get("admin_logged_in"):
+        abort(403)
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    if qrcode is None:
+        abort(404)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    cur.execute(
+        "SELECT otp FROM registrations WHERE erf=%s",
+        (erf,)
+    )
+    reg = cur.fetchone()
+
+    if not reg or not reg["otp"]:
+        abort(404)
+
+    link = quick_login_url(schema, erf, reg["otp"])
+    etag = hashlib.sha256(link.encode("utf-8")).hexdigest()[:32]
+
+    # The OTP changes on re-registration: always revalidate,
+    # and never let a shared cache keep the code
+    headers = {"Cache-Control": "private, no-cache"}
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304, headers=headers)
+        response.set_etag(etag)
+        return response
+
+    png = QR_CACHE.get(link)
+    if png is _MISSING:
+        png = render_qr_png(link)
+        QR_CACHE.set(link, png)
+
+    response = Response(png, mimetype="image/png", headers=headers)
+    response.set_etag(etag)
+    return response
+
+@app.route("/vote/<hoa>/quick")
+def vote_quick(hoa):
+    """
+    Quick login from a check-in QR code: ?erf=...&otp=...
+    logs the owner in for AGM voting.
+    """
+    tenant = public_tenant(hoa)
+
+    schema = tenant["schema_name"]
+
+    erf = request.args.get("erf", "").strip().upper()
+    otp = request.args.get("otp", "").strip().upper()
+
+    result = attempt_voter_login(schema, erf, otp, "AGM")
+
+    if result != "ok":
+        return login_refused(schema, result)
+
+    session["voter_erf"] = erf
+    session["hoa_schema"] = schema
+    session["vote_mode"] = "AGM"
+
+    return redirect(f"/vote/{hoa}")
+
+# ======================================================
+# PUBLIC VOTING — HOA SELECTION PORTAL
+# ======================================================
+
+register_page("vote_portal", "public", """
+<div class="card">
+<h2>Select Your HOA</h2>
+
+<table>
+<tr>
+  <th>HOA Name</th>
+  <th>Voting Portal</th>
+</tr>
+
+{% for h in hoas %}
+<tr>
+  <td>{{ h.name }}</td>
+  <td>
+    <a href="/vote/{{ h.schema_name }}/login">
+      Enter Voting Portal
+    </a>
+  </td>
+</tr>
+{% endfor %}
+
+</table>
+</div>
+""")
+
+@app.route("/vote")
+def vote_portal():
+
+    hoas = enabled_tenants()
+
+    if not hoas:
+        abort(404)
+
+    return render_page(
+        "vote_portal",
+        hoas=hoas,
+        branding=None
+    )
+    
+# ======================================================
+# PUBLIC VOTING — TOPIC LIST
+# ======================================================
+
+register_page("vote_index", "public", """
+    <div class="card">
+    <h2>Open Voting Topics</h2>
+<ul>
+{% for t in topics %}
+  <li>
+    <a href="/vote/{{ hoa }}/{{ t.id }}">{{ t.title }}</a>
+  </li>
+{% endfor %}
+</ul>
+<p><a href="/vote/{{ hoa }}/ballot">Vote on all topics on one page</a></p>
+<p><a href="/vote/{{ hoa }}/receipts">My vote receipts</a></p>
+</div>
+""")
+
+@app.route("/vote/<hoa>")
+def vote_index(hoa):
+    if not session.get("voter_erf"):
+        return redirect(f"/vote/{hoa}/login")
+
+    schema = session.get("hoa_schema")
+    if schema != hoa:
+        return redirect(f"/vote/{hoa}/login")
+
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    vote_mode = session.get("vote_mode", "AGM")
+
+    cur.execute(
+        """
+        SELECT * FROM topics
+        WHERE is_open = TRUE
+        AND vote_mode = %s
+        ORDER BY id
+        """,
+        (vote_mode,)
+    )
+    topics = cur.fetchall()
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "vote_index",
+        topics=topics,
+        hoa=hoa,
+        branding=branding
+    )
+
+# ======================================================
+# OWNER PROXY SYSTEM (ADD / DELETE)
+# ======================================================
+
+register_page("admin_owner_proxies", "admin", """
+<div class="card">
+<h2>Owner Proxies</h2>
+{% if error %}
+<p class="bad">{{ error }}</p>
+{% endif %}
+<form method="post">
+  <input name="primary_erf" placeholder="Primary ERF">
+  <input name="proxy_erf" placeholder="Proxy ERF">
+  <button>Add Proxy</button>
+</form>
+
+<table>
+<tr><th>Primary ERF</th><th>Proxy ERF</th><th>Action</th></tr>
+{% for p in proxies %}
+<tr>
+  <td>{{ p.primary_erf }}</td>
+  <td>{{ p.proxy_erf }}</td>
+  <td>
+    <form method="post" action="/admin/owner_proxies/delete" style="display:inline">
+      <input type="hidden" name="primary" value="{{ p.primary_erf }}">
+      <input type="hidden" name="proxy" value="{{ p.proxy_erf }}">
+      <button>Delete</button>
+    </form>
+  </td>
+</tr>
+{% endfor %}
+</table>
+</div>
+""")
+
+@app.route("/admin/owner_proxies", methods=["GET", "POST"])
+def admin_owner_proxies():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    error = None
+
+    if request.method == "POST":
+        primary = request.form.get("primary_erf", "").strip().upper()
+        proxy = request.form.get("proxy_erf", "").strip().upper()
+
+        if not primary or not proxy:
+            error = "Both ERFs are required"
+        elif primary == proxy:
+            error = "Cannot proxy an ERF to itself"
+        else:
+            # Both must exist as owners
+            cur.execute(
+                "SELECT 1 FROM owners WHERE erf=%s",
+                (proxy,)
+            )
+            p_owner = cur.fetchone()
+            cur.execute(
+                "SELECT 1 FROM owners WHERE erf=%s",
+                (primary,)
+            )
+            x_owner = cur.fetchone()
+
+            if not p_owner or not x_owner:
+                error = "Both ERFs must exist in owners"
+            else:
+                # Proxy ERF must not already be an owner proxy
+                cur.execute(
+                    "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
+                     (proxy,)
+                )
+                already_proxy = cur.fetchone()
+
+                # Proxy ERF must not be a developer proxy
+                cur.execute(
+                    "SELECT 1 FROM developer_proxies WHERE erf=%s",
+                    (proxy,)
+                )
+                dev_proxy = cur.fetchone()
+
+
+                # Proxy ERF must not have voted
+                cur.execute(
+                    "SELECT 1 FROM votes WHERE erf=%s",
+                    (proxy,)
+                )
+                voted = cur.fetchone()
+
+                if already_proxy or dev_proxy or voted:
+                    error = "Proxy ERF is not eligible"
+                else:
+                    # STEP 1 — Insert proxy relationship
+                    cur.execute(
+                        """
+                        INSERT INTO owner_proxies (primary_erf, proxy_erf)
+                        VALUES (%s, %s)
+                        """,
+                        (primary, proxy)
+                    )
+
+
+                    # STEP 2 — Remove registration of proxy ERF if exists
+                    cur.execute(
+                        """
+                        DELETE FROM registrations
+                        WHERE erf=%s
+                        """,
+                        (proxy,)
+                    )
+
+                    refresh_effective_weights(cur, [primary, proxy])
+
+                    conn.commit()
+
+    cur.execute(
+        "SELECT * FROM owner_proxies ORDER BY primary_erf"
+    )
+    proxies = cur.fetchall()
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "admin_owner_proxies",
+        proxies=proxies,
+        error=error,
+        branding=branding
+    )
+
+@app.route("/admin/owner_proxies/delete", methods=["POST"])
+def admin_delete_owner_proxy():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    primary = request.form.get("primary")
+    proxy = request.form.get("proxy")
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    cur.execute(
+        """
+        DELETE FROM owner_proxies
+        WHERE primary_erf=%s AND proxy_erf=%s
+        """,
+        (primary, proxy)
+    )
+
+    cur.execute(
+        """
+        UPDATE registrations
+        SET proxies = (
+            SELECT COUNT(*)
+            FROM owner_proxies
+            WHERE primary_erf=%s
+        )
+        WHERE erf=%s
+        """,
+        (primary, primary)
+    )
+
+    refresh_effective_weights(cur, [primary, proxy])
+
+    conn.commit()
+
+    return redirect("/admin/owner_proxies")
+
+# ======================================================
+# DEVELOPER SYSTEM (SETTINGS + PROXIES)
+# ======================================================
+
+register_page("admin_developer", "admin", """
+<div class="card">
+<h2>Developer Settings</h2>
+{% if message %}
+<p class="ok">{{ message }}</p>
+{% endif %}
+{% if error %}
+<p class="bad">{{ error }}</p>
+{% endif %}
+<form method="post">
+  <label>
+    <input type="checkbox" name="is_active"
+      {% if settings.is_active %}checked{% endif %}>
+    Enable Developer Voting
+  </label><br><br>
+
+  Base Votes:
+  <input type="number" name="base_votes" value="{{ settings.base_votes }}"><br>
+
+  Proxy Count:
+  <input type="number" value="{{ settings.proxy_count }}" readonly><br>
+
+  Comment:<br>
+  <textarea name="comment">{{ settings.comment }}</textarea><br>
+
+  <button>Save</button>
+</form>
+</div>
+
+<div class="card">
+<h3>Developer Proxies</h3>
+<form method="post" action="/admin/developer/add-proxy">
+  <input name="erf" placeholder="ERF">
+  <button>Add Developer Proxy</button>
+</form>
+
+<table>
+<tr>
+  <th>ERF</th>
+  <th>Action</th>
+</tr>
+
+{% for p in dev_proxies %}
+<tr>
+  <td>{{ p.erf }}</td>
+  <td>
+    <form method="post"
+          action="/admin/developer/delete-proxy"
+          style="display:inline"
+          onsubmit="return confirm('Delete this developer proxy?');">
+
+      <input type="hidden"
+             name="erf"
+             value="{{ p.erf }}">
+
+      <button type="submit">
+        Delete
+      </button>
+
+    </form>
+  </td>
+</tr>
+{% endfor %}
+</table>
+</div>
+""")
+
+@app.route("/admin/developer", methods=["GET", "POST"])
+def admin_developer():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    # Ensure settings row exists
+    cur.execute(
+        "SELECT * FROM developer_settings WHERE id=1"
+    )
+    settings = cur.fetchone()
+
+    if not settings:
+        cur.execute(
+            """
+            INSERT INTO developer_settings
+            (id, is_active, base_votes, proxy_count, comment)
+            VALUES (1, FALSE, 0, 0, NULL)
+            """
+        )
+        conn.commit()
+
+        cur.execute(
+            "SELECT * FROM developer_settings WHERE id=1"
+        )
+        settings = cur.fetchone()
+
+    message = None
+    error = None
+
+    if request.method == "POST":
+        is_active = request.form.get("is_active") == "on"
+        base_votes = int(request.form.get("base_votes", "0") or 0)
+        comment = request.form.get("comment")
+
+        # Count proxies first
+        cur.execute(
+            "SELECT COUNT(*) AS proxy_count FROM developer_proxies"
+        )
+        proxy_row = cur.fetchone()
+        proxy_count = proxy_row["proxy_count"] if proxy_row else 0
+
+        # Update settings
+        cur.execute(
+            """
+            UPDATE developer_settings
+            SET is_active=%s,
+                base_votes=%s,
+                proxy_count=%s,
+                comment=%s
+            WHERE id=1
+            """,
+            (is_active, base_votes, proxy_count, comment)
+        )
+
+        if is_active:
+            otp = generate_otp()
+
+            cur.execute(
+                """
+                INSERT INTO registrations (erf, proxies, otp)
+                VALUES ('DEVELOPER', %s, %s)
+                ON CONFLICT (erf)
+                DO UPDATE SET
+                    proxies = EXCLUDED.proxies,
+                    otp = EXCLUDED.otp
+                """,
+                (proxy_count, otp)
+            )
+
+            forget_failed_logins(schema, ["DEVELOPER"], cur)
+
+            message = f"Developer OTP: {otp}"
+
+        else:
+            cur.execute(
+                "DELETE FROM registrations WHERE erf='DEVELOPER'"
+            )
+
+        refresh_effective_weights(cur, ["DEVELOPER"])
+
+        conn.commit()
+
+        cur.execute(
+            "SELECT * FROM developer_settings WHERE id=1"
+        )
+        settings = cur.fetchone()
+
+    cur.execute(
+        "SELECT * FROM developer_proxies ORDER BY erf"
+    )
+    dev_proxies = cur.fetchall()
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "admin_developer",
+        settings=settings,
+        dev_proxies=dev_proxies,
+        message=message,
+        error=error,
+        branding=branding
+    )
+    
+@app.route("/admin/developer/add-proxy", methods=["GET", "POST"])
+def admin_add_developer_proxy():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    if request.method == "GET":
+        return redirect("/admin/developer")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    erf = request.form.get("erf", "").strip().upper()
+    if not erf:
+        return redirect("/admin/developer")
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    # Must exist as owner
+    cur.execute(
+        "SELECT 1 FROM owners WHERE erf=%s",
+        (erf,)
+    )
+    owner = cur.fetchone()
+
+    if not owner:
+        return redirect("/admin/developer")
+
+    # Must not be owner proxy
+    cur.execute(
+        "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
+        (erf,)
+    )
+    op = cur.fetchone()
+    if op:
+        return redirect("/admin/developer")
+
+    # Must not have voted
+    cur.execute(
+        "SELECT 1 FROM votes WHERE erf=%s",
+        (erf,)
+    )
+    voted = cur.fetchone()
+    if voted:
+        return redirect("/admin/developer")
+
+    cur.execute(
+        """
+        INSERT INTO developer_proxies (erf)
+        VALUES (%s)
+        ON CONFLICT DO NOTHING
+        """,
+        (erf,)
+    )
+
+    # Count proxies
+    cur.execute(
+        "SELECT COUNT(*) AS proxy_count FROM developer_proxies"
+    )
+    proxy_row = cur.fetchone()
+    proxy_count = proxy_row["proxy_count"] if proxy_row else 0
+
+    # Update developer settings
+    cur.execute(
+        """
+        UPDATE developer_settings
+        SET proxy_count=%s
+        WHERE id=1
+        """,
+        (proxy_count,)
+    )
+
+    # Update DEVELOPER registration if exists
+    cur.execute(
+        """
+        UPDATE registrations
+        SET proxies=%s
+        WHERE erf='DEVELOPER'
+        """,
+        (proxy_count,)
+    )
+
+    refresh_effective_weights(cur, ["DEVELOPER", erf])
+
+    conn.commit()
+
+    return redirect("/admin/developer")
+
+@app.route("/admin/developer/delete-proxy", methods=["POST"])
+def admin_delete_developer_proxy():
+
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    erf = request.form.get("erf", "").strip().upper()
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    # Delete proxy
+    cur.execute(
+        """
+        DELETE FROM developer_proxies
+        WHERE erf=%s
+        """,
+        (erf,)
+    )
+
+    # Recalculate count
+    cur.execute(
+        """
+        SELECT COUNT(*) AS proxy_count
+        FROM developer_proxies
+        """
+    )
+
+    row = cur.fetchone()
+    proxy_count = row["proxy_count"] if row else 0
+
+    # Update settings
+    cur.execute(
+        """
+        UPDATE developer_settings
+        SET proxy_count=%s
+        WHERE id=1
+        """,
+        (proxy_count,)
+    )
+
+    # Update developer registration
+    cur.execute(
+        """
+        UPDATE registrations
+        SET proxies=%s
+        WHERE erf='DEVELOPER'
+        """,
+        (proxy_count,)
+    )
+
+    refresh_effective_weights(cur, ["DEVELOPER", erf])
+
+    conn.commit()
+
+    return redirect("/admin/developer")
+    
+# ======================================================
+# TOPICS & OPTIONS (ADMIN)
+# ======================================================
+
+register_page("admin_topics", "admin", """
+<div class="card">
+<h2>Topics</h2>
+<form method="post">
+  <p><input name="title" placeholder="Topic title"></p>
+  <p><textarea name="description" placeholder="Description"></textarea></p>
+
+  <p>
+    Vote Mode<br>
+    <select name="vote_mode">
+      <option value="AGM">AGM</option>
+      <option value="GENERAL">GENERAL</option>
+    </select>
+  </p>
+
+  <button>Create Topic</button>
+</form>
+
+<table>
+<tr><th>Title</th><th>Mode</th><th>Status</th><th>Actions</th></tr>
+{% for t in topics %}
+<tr>
+  <td>{{ t.title }}</td>
+  <td>{{ t.vote_mode }}</td>
+  <td>{{ "OPEN" if t.is_open else "CLOSED" }}</td>
+  <td>
+<a href="/admin/topics/{{ t.id }}/options">Options</a> |
+
+<a href="/admin/topics/{{ t.id }}/export">
+  Export Results
+</a> |
+
+<a href="/admin/topics/{{ t.id }}/toggle">
+      {{ "Close" if t.is_open else "Open" }}
+    </a>
+
+    {% if not t.is_open %}
+    |
+    <form method="post"
+          action="/admin/topics/{{ t.id }}/delete"
+          style="display:inline"
+          onsubmit="return confirm('Delete this topic and all votes?');">
+      <button type="submit">Delete</button>
+    </form>
+    {% endif %}
+  </td>
+</tr>
+{% endfor %}
+</table>
+</div>
+""")
+
+@app.route("/admin/topics", methods=["GET", "POST"])
+def admin_topics():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    if request.method == "POST":
+        title = request.form.get("title", "").strip()
+        description = request.form.get("description", "").strip()
+        vote_mode = request.form.get("vote_mode", "AGM").strip().upper()
+
+        if vote_mode not in ["AGM", "GENERAL"]:
+            vote_mode = "AGM"
+
+        if title:
+            cur.execute(
+                """
+                INSERT INTO topics (title, description, is_open, vote_mode)
+                VALUES (%s, %s, FALSE, %s)
+                """,
+                (title, description, vote_mode)
+            )
+            conn.commit()
+
+    cur.execute(
+        "SELECT * FROM topics ORDER BY id DESC"
+    )
+    topics = cur.fetchall()
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "admin_topics",
+        topics=topics,
+        branding=branding,
+    )
+@app.route("/admin/topics/<int:topic_id>/toggle")
+def admin_toggle_topic(topic_id):
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    cur.execute(
+        "UPDATE topics SET is_open = NOT is_open WHERE id=%s",
+        (topic_id,)
+    )
+
+    notify_live(cur, schema, LIVE_RESYNC)
+
+    conn.commit()
+
+    return redirect("/admin/topics")
+
+
+register_page("admin_topic_options", "admin", """
+<div class="card">
+<h2>Options for: {{ topic.title }}</h2>
+
+{% if allow_add %}
+<form method="post">
+  <input name="label" placeholder="Option label">
+  <button>Add Option</button>
+</form>
+{% else %}
+<p class="bad">Voting is open. Options are locked.</p>
+{% endif %}
+
+<table>
+<tr><th>Option</th></tr>
+{% for o in options %}
+<tr>
+  <td>{{ o.label }}</td>
+</tr>
+{% endfor %}
+</table>
+
+<br>
+<a href="/admin/topics" class="btn">Back</a>
+</div>
+""")
+
+@app.route("/admin/topics/<int:topic_id>/options", methods=["GET", "POST"])
+def admin_topic_options(topic_id):
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    cur.execute(
+        "SELECT * FROM topics WHERE id=%s",
+        (topic_id,)
+    )
+    topic = cur.fetchone()
+
+    if not topic:
+        abort(404)
+
+    allow_add = not topic["is_open"]
+
+    if request.method == "POST" and allow_add:
+        label = request.form.get("label", "").strip()
+
+        if label:
+            cur.execute(
+                """
+                INSERT INTO options (topic_id, label)
+                VALUES (%s, %s)
+                """,
+                (topic_id, label)
+            )
+            conn.commit()
+
+    cur.execute(
+        "SELECT * FROM options WHERE topic_id=%s ORDER BY id",
+        (topic_id,)
+    )
+    options = cur.fetchall()
+
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "admin_topic_options",
+        topic=topic,
+        options=options,
+        allow_add=allow_add,
+        branding=branding
+    )
+
+@app.route("/admin/topics/<int:topic_id>/delete", methods=["POST"])
+def admin_delete_topic(topic_id):
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    if not schema:
+        abort(403)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    cur.execute(
+        "SELECT * FROM topics WHERE id=%s",
+        (topic_id,)
+    )
+    topic = cur.fetchone()
+
+    if not topic:
+        abort(404)
+
+    # Safety: only closed topics may be deleted
+    if topic["is_open"]:
+        return redirect("/admin/topics")
+
+    # Blocks holding these votes are resealed from what remains
+    cur.execute(
+        """
+        DELETE FROM merkle_blocks
+        WHERE block_no IN (
+            SELECT DISTINCT (id - 1) / block_size
+            FROM votes
+            WHERE topic_id=%s
+        )
+        """,
+        (topic_id,)
+    )
+
+    # Hold the global head so no append lands between the
+    # delete and moving the head back below
+    cur.execute(
+        "SELECT last_hash FROM vote_chain_head WHERE id=1 FOR UPDATE"
+    )
 
-                # Proxy ERF must not have voted
-                cur.execute(
-                    "SELECT 1 FROM votes WHERE erf=%s",
-                    (proxy,)
-                )
-                voted = cur.fetchone()
+    # A global checkpoint at or past these votes is stale
+    cur.execute(
+        """
+        DELETE FROM ledger_checkpoints
+        WHERE chain_key=%s
+        AND last_id >= (
+            SELECT min(id) FROM votes WHERE topic_id=%s
+        )
+        """,
+        (_chain_key(None), topic_id)
+    )
 
-                if already_proxy or dev_proxy or voted:
-                    error = "Proxy ERF is not eligible"
-                else:
-                    # STEP 1 — Insert proxy relationship
-                    cur.execute(
-                        """
-                        INSERT INTO owner_proxies (primary_erf, proxy_erf)
-                        VALUES (%s, %s)
-                        """,
-                        (primary, proxy)
-                    )
+    # Delete votes first
+    cur.execute(
+        "DELETE FROM votes WHERE topic_id=%s",
+        (topic_id,)
+    )
 
+    # The global ledger continues from the newest remaining vote
+    cur.execute(
+        """
+        UPDATE vote_chain_head
+        SET last_hash = COALESCE(
+            (SELECT vote_hash FROM votes ORDER BY id DESC LIMIT 1),
+            %s
+        )
+        WHERE id=1
+        """,
+        (GENESIS_HASH,)
+    )
 
-                    # STEP 2 — Remove registration of proxy ERF if exists
-                    cur.execute(
-                        """
-                        DELETE FROM registrations
-                        WHERE erf=%s
-                        """,
-                        (proxy,)
-                    )
+    cur.execute(
+        "DELETE FROM vote_topic_heads WHERE topic_id=%s",
+        (topic_id,)
+    )
 
-                    conn.commit()
+    cur.execute(
+        "DELETE FROM ledger_checkpoints WHERE chain_key=%s",
+        (_chain_key(topic_id),)
+    )
 
     cur.execute(
-        "SELECT * FROM owner_proxies ORDER BY primary_erf"
+        "DELETE FROM topic_tallies WHERE topic_id=%s",
+        (topic_id,)
     )
-    proxies = cur.fetchall()
 
-    conn.close()
+    # Delete options
+    cur.execute(
+        "DELETE FROM options WHERE topic_id=%s",
+        (topic_id,)
+    )
 
-    branding = get_hoa_branding(schema)
+    # Delete topic
+    cur.execute(
+        "DELETE FROM topics WHERE id=%s",
+        (topic_id,)
+    )
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card">
-<h2>Owner Proxies</h2>
-{% if error %}
-<p class="bad">{{ error }}</p>
-{% endif %}
-<form method="post">
-  <input name="primary_erf" placeholder="Primary ERF">
-  <input name="proxy_erf" placeholder="Proxy ERF">
-  <button>Add Proxy</button>
-</form>
+    conn.commit()
 
-<table>
-<tr><th>Primary ERF</th><th>Proxy ERF</th><th>Action</th></tr>
-{% for p in proxies %}
-<tr>
-  <td>{{ p.primary_erf }}</td>
-  <td>{{ p.proxy_erf }}</td>
-  <td>
-    <form method="post" action="/admin/owner_proxies/delete" style="display:inline">
-      <input type="hidden" name="primary" value="{{ p.primary_erf }}">
-      <input type="hidden" name="proxy" value="{{ p.proxy_erf }}">
-      <button>Delete</button>
-    </form>
-  </td>
-</tr>
-{% endfor %}
-</table>
-</div>
-""" + BASE_TAIL,
-        proxies=proxies,
-        error=error,
-        branding=branding
-    )
+    return redirect("/admin/topics")
+
+@app.route("/admin/topics/<int:topic_id>/export")
+def export_topic_results(topic_id):
 
-@app.route("/admin/owner_proxies/delete", methods=["POST"])
-def admin_delete_owner_proxy():
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -1857,549 +4748,1097 @@ def admin_delete_owner_proxy():
     if not schema:
         abort(403)
 
-    primary = request.form.get("primary")
-    proxy = request.form.get("proxy")
-
     conn = get_conn()
     cur = conn.cursor()
     set_search_path(cur, schema)
 
     cur.execute(
         """
-        DELETE FROM owner_proxies
-        WHERE primary_erf=%s AND proxy_erf=%s
+        SELECT title
+        FROM topics
+        WHERE id=%s
         """,
-        (primary, proxy)
+        (topic_id,)
+    )
+
+    topic = cur.fetchone()
+
+    if not topic:
+        abort(404)
+
+    filename = (
+        topic["title"]
+        .replace(" ", "_")
+        .replace("/", "_")
+    )
+
+    def rows():
+        yield ["Topic"]
+        yield [topic["title"]]
+        yield []
+
+        yield [
+            "Option",
+            "Votes"
+        ]
+
+        yield from export_rows(
+            schema,
+            """
+            SELECT
+                o.label,
+                COALESCE(SUM(tt.weight),0) AS total_votes
+            FROM options o
+            LEFT JOIN topic_tallies tt
+                ON tt.option_id = o.id
+            WHERE o.topic_id=%s
+            GROUP BY o.id, o.label
+            ORDER BY o.id
+            """,
+            (topic_id,)
+        )
+
+    return csv_response(f"{filename}.csv", rows())
+    
+# ======================================================
+# VOTE LEDGER (HASH CHAIN APPENDS)
+#
+# Each vote hashes the previous vote's hash. The chain head is
+# a locked row, so concurrent votes queue on that row only and
+# chain in id order. The lock is held until the caller
+# commits: append last, then commit straight away.
+#
+# Ledger modes (per schema, fixed once voting has started):
+#   global - one chain over all votes (vote_chain_head)
+#   topic  - one chain per topic (vote_topic_heads), so votes
+#            on different topics do not wait for each other.
+#            Cross-topic anchors (ledger_anchors) hash all
+#            topic heads together every LEDGER_ANCHOR_INTERVAL
+#            seconds and on each verification.
+# ======================================================
+
+LEDGER_MODES = ("global", "topic")
+
+LEDGER_SETTINGS_DDL = """
+CREATE TABLE ledger_settings (
+    id INTEGER PRIMARY KEY CHECK (id=1),
+    mode TEXT NOT NULL DEFAULT 'global'
+        CHECK (mode IN ('global', 'topic'))
+);
+INSERT INTO ledger_settings (id) VALUES (1)
+"""
+
+VOTE_TOPIC_HEADS_DDL = """
+CREATE TABLE vote_topic_heads (
+    topic_id INTEGER PRIMARY KEY,
+    last_hash TEXT NOT NULL
+)
+"""
+
+LEDGER_ANCHORS_DDL = """
+CREATE TABLE ledger_anchors (
+    id SERIAL PRIMARY KEY,
+    anchored_at TIMESTAMP NOT NULL DEFAULT now(),
+    heads TEXT NOT NULL,
+    prev_anchor TEXT NOT NULL,
+    anchor_hash TEXT NOT NULL
+)
+"""
+
+# Last verified vote per chain ("global" or "topic:<id>"), so
+# verification only rehashes votes added since
+LEDGER_CHECKPOINTS_DDL = """
+CREATE TABLE ledger_checkpoints (
+    chain_key TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL,
+    last_hash TEXT NOT NULL,
+    verified_at TIMESTAMP NOT NULL
+)
+"""
+
+VOTE_CHAIN_HEAD_DDL = """
+CREATE TABLE vote_chain_head (
+    id INTEGER PRIMARY KEY CHECK (id=1),
+    last_hash TEXT NOT NULL
+)
+"""
+
+def seed_vote_chain_head(cur):
+    # Existing ledgers continue from their latest vote
+    cur.execute(
+        """
+        INSERT INTO vote_chain_head (id, last_hash)
+        SELECT 1, COALESCE(
+            (SELECT vote_hash FROM votes ORDER BY id DESC LIMIT 1),
+            %s
+        )
+        ON CONFLICT (id) DO NOTHING
+        """,
+        (GENESIS_HASH,)
+    )
+
+schema_object("vote_chain_head", VOTE_CHAIN_HEAD_DDL, seed_vote_chain_head)
+
+# Keeps the duplicate check under the head lock an index probe
+schema_object(
+    "votes_topic_erf",
+    "CREATE INDEX votes_topic_erf ON votes (topic_id, erf)"
+)
+
+schema_object("ledger_settings", LEDGER_SETTINGS_DDL)
+schema_object("vote_topic_heads", VOTE_TOPIC_HEADS_DDL)
+schema_object("ledger_anchors", LEDGER_ANCHORS_DDL)
+schema_object("ledger_checkpoints", LEDGER_CHECKPOINTS_DDL)
+
+def reset_vote_chain_head(cur):
+    cur.execute(
+        "UPDATE vote_chain_head SET last_hash=%s WHERE id=1",
+        (GENESIS_HASH,)
     )
 
+def get_ledger_mode(cur):
+    cur.execute("SELECT mode FROM ledger_settings WHERE id=1")
+    return cur.fetchone()["mode"]
+
+def ledger_mode_locked(cur):
+    """
+    The mode can only change before voting starts: no votes
+    and no open topic that could be receiving one.
+    """
     cur.execute(
         """
-        UPDATE registrations
-        SET proxies = (
-            SELECT COUNT(*)
-            FROM owner_proxies
-            WHERE primary_erf=%s
+        SELECT
+            EXISTS (SELECT 1 FROM votes)
+            OR EXISTS (SELECT 1 FROM topics WHERE is_open=TRUE)
+            AS locked
+        """
+    )
+    return cur.fetchone()["locked"]
+
+def set_ledger_mode(cur, mode):
+    """
+    Returns False (and changes nothing) once voting has started.
+    """
+    if mode not in LEDGER_MODES:
+        abort(400)
+
+    if ledger_mode_locked(cur):
+        return False
+
+    cur.execute(
+        "UPDATE ledger_settings SET mode=%s WHERE id=1",
+        (mode,)
+    )
+    return True
+
+def _lock_topic_heads(cur, topic_ids):
+    """
+    Locks the heads of the given (sorted) topics, in topic order
+    so that concurrent ballots cannot deadlock, and returns
+    {topic_id: last_hash}.
+    """
+    cur.execute(
+        """
+        SELECT topic_id, last_hash FROM vote_topic_heads
+        WHERE topic_id = ANY(%s)
+        ORDER BY topic_id
+        FOR UPDATE
+        """,
+        (topic_ids,)
+    )
+    heads = {r["topic_id"]: r["last_hash"] for r in cur.fetchall()}
+
+    missing = [t for t in topic_ids if t not in heads]
+
+    if missing:
+        # First vote on a topic: concurrent inserts wait here
+        cur.execute(
+            """
+            INSERT INTO vote_topic_heads (topic_id, last_hash)
+            SELECT unnest(%s::int[]), %s
+            ON CONFLICT (topic_id) DO NOTHING
+            """,
+            (missing, GENESIS_HASH)
         )
-        WHERE erf=%s
+        return _lock_topic_heads(cur, topic_ids)
+
+    return heads
+
+def compute_anchor_hash(prev_anchor, heads):
+    payload = f"{prev_anchor}|{heads}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def anchor_ledger(cur, wait=True):
+    """
+    Records a cross-topic anchor over the current topic heads.
+    With wait=False it gives up if another transaction is
+    anchoring. Returns the new anchor id, or None if nothing
+    was recorded (no change since the last anchor).
+    """
+    lock = "pg_advisory_xact_lock" if wait else "pg_try_advisory_xact_lock"
+    cur.execute(
+        f"SELECT {lock}(hashtext('anchor:' || current_schema())) AS locked"
+    )
+    if cur.fetchone()["locked"] is False:
+        return None
+
+    cur.execute(
+        """
+        SELECT COALESCE(
+            string_agg(topic_id || ':' || last_hash, ',' ORDER BY topic_id),
+            ''
+        ) AS heads
+        FROM vote_topic_heads
+        """
+    )
+    heads = cur.fetchone()["heads"]
+
+    cur.execute(
+        """
+        SELECT heads, anchor_hash
+        FROM ledger_anchors
+        ORDER BY id DESC
+        LIMIT 1
+        """
+    )
+    last = cur.fetchone()
+
+    if last and last["heads"] == heads:
+        return None
+
+    prev_anchor = last["anchor_hash"] if last else GENESIS_HASH
+
+    cur.execute(
+        """
+        INSERT INTO ledger_anchors (heads, prev_anchor, anchor_hash)
+        VALUES (%s, %s, %s)
+        RETURNING id
         """,
-        (primary, primary)
+        (heads, prev_anchor, compute_anchor_hash(prev_anchor, heads))
     )
+    return cur.fetchone()["id"]
 
-    conn.commit()
-    conn.close()
+def append_vote(cur, topic_id, erf, option_id, weight):
+    """
+    Appends one vote to the ledger and returns its id, or None
+    if the ERF has already voted on the topic.
+    """
+    vote_ids = append_votes(cur, erf, [(topic_id, option_id, weight)])
+    return vote_ids.get(topic_id)
 
-    return redirect("/admin/owner_proxies")
+def append_votes(cur, erf, ballot):
+    """
+    Appends one voter's ballot, [(topic_id, option_id, weight)]
+    with one entry per topic, to the ledger with a single
+    multi-row insert. Topics the ERF has already voted on are
+    skipped. Returns {topic_id: vote_id} for the votes added.
+    """
+    per_topic = get_ledger_mode(cur) == "topic"
+    topic_ids = sorted(topic_id for topic_id, _, _ in ballot)
 
-# ======================================================
-# DEVELOPER SYSTEM (SETTINGS + PROXIES)
-# ======================================================
+    if per_topic:
+        heads = _lock_topic_heads(cur, topic_ids)
+    else:
+        cur.execute(
+            "SELECT last_hash FROM vote_chain_head WHERE id=1 FOR UPDATE"
+        )
+        prev_hash = cur.fetchone()["last_hash"]
 
-@app.route("/admin/developer", methods=["GET", "POST"])
-def admin_developer():
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+    # Checked again under the lock: the caller's check can race
+    cur.execute(
+        "SELECT topic_id FROM votes WHERE erf=%s AND topic_id = ANY(%s)",
+        (erf, topic_ids)
+    )
+    voted = {r["topic_id"] for r in cur.fetchall()}
 
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+    ballot = [v for v in ballot if v[0] not in voted]
+    if not ballot:
+        return {}
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
+    ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+    rows = []
+    for topic_id, option_id, weight in ballot:
+        if per_topic:
+            prev_hash = heads[topic_id]
+
+        vote_hash = compute_vote_hash(
+            prev_hash,
+            erf,
+            topic_id,
+            option_id,
+            weight,
+            ts
+        )
+        rows.append(
+            (topic_id, erf, option_id, weight, prev_hash, vote_hash, ts)
+        )
+
+        if per_topic:
+            heads[topic_id] = vote_hash
+        else:
+            prev_hash = vote_hash
 
-    # Ensure settings row exists
-    cur.execute(
-        "SELECT * FROM developer_settings WHERE id=1"
+    # VALUES rows take ids in order, so ids follow the chain
+    inserted = execute_values(
+        cur,
+        """
+        INSERT INTO votes
+            (topic_id, erf, option_id,
+             weight, prev_hash, vote_hash, timestamp)
+        VALUES %s
+        RETURNING id, topic_id
+        """,
+        rows,
+        page_size=len(rows),
+        fetch=True
     )
-    settings = cur.fetchone()
+    vote_ids = {r["topic_id"]: r["id"] for r in inserted}
 
-    if not settings:
+    record_tallies(cur, ballot)
+
+    if per_topic:
+        # Also reports whether the last anchor is older than
+        # LEDGER_ANCHOR_INTERVAL, saving a round trip per vote
         cur.execute(
             """
-            INSERT INTO developer_settings
-            (id, is_active, base_votes, proxy_count, comment)
-            VALUES (1, FALSE, 0, 0, NULL)
-            """
+            UPDATE vote_topic_heads h
+            SET last_hash=v.last_hash
+            FROM unnest(%s::int[], %s::text[]) AS v(topic_id, last_hash)
+            WHERE h.topic_id=v.topic_id
+            RETURNING NOT EXISTS (
+                SELECT 1 FROM ledger_anchors
+                WHERE id = (SELECT max(id) FROM ledger_anchors)
+                AND anchored_at > now() - make_interval(secs => %s)
+            ) AS anchor_due
+            """,
+            (
+                list(vote_ids),
+                [heads[topic_id] for topic_id in vote_ids],
+                LEDGER_ANCHOR_INTERVAL
+            )
         )
-        conn.commit()
 
+        # Whoever finds an anchor due takes it; others skip
+        if any(r["anchor_due"] for r in cur.fetchall()):
+            anchor_ledger(cur, wait=False)
+    else:
         cur.execute(
-            "SELECT * FROM developer_settings WHERE id=1"
+            "UPDATE vote_chain_head SET last_hash=%s WHERE id=1",
+            (prev_hash,)
         )
-        settings = cur.fetchone()
 
-    message = None
-    error = None
+    return vote_ids
 
-    if request.method == "POST":
-        is_active = request.form.get("is_active") == "on"
-        base_votes = int(request.form.get("base_votes", "0") or 0)
-        comment = request.form.get("comment")
+def _chain_key(topic_id):
+    return "global" if topic_id is None else f"topic:{topic_id}"
 
-        # Count proxies first
-        cur.execute(
-            "SELECT COUNT(*) AS proxy_count FROM developer_proxies"
-        )
-        proxy_row = cur.fetchone()
-        proxy_count = proxy_row["proxy_count"] if proxy_row else 0
+def save_ledger_checkpoint(cur, topic_id, last_id, last_hash):
+    cur.execute(
+        """
+        INSERT INTO ledger_checkpoints
+            (chain_key, last_id, last_hash, verified_at)
+        VALUES (%s, %s, %s, now())
+        ON CONFLICT (chain_key)
+        DO UPDATE SET
+            last_id = EXCLUDED.last_id,
+            last_hash = EXCLUDED.last_hash,
+            verified_at = EXCLUDED.verified_at
+        """,
+        (_chain_key(topic_id), last_id, last_hash)
+    )
 
-        # Update settings
+def verify_vote_chain(cur, topic_id=None, full=False):
+    """
+    Rehashes the ledger (or one topic's chain) from its last
+    checkpoint, or from GENESIS when full=True or none exists,
+    and advances the checkpoint to the last intact vote; the
+    caller commits. Returns (rows_checked, first_broken_id);
+    first_broken_id is None if the chain is intact.
+    """
+    topic_filter = "" if topic_id is None else "AND topic_id=%(topic_id)s"
+    last_id, prev_hash = 0, GENESIS_HASH
+
+    if not full:
         cur.execute(
-            """
-            UPDATE developer_settings
-            SET is_active=%s,
-                base_votes=%s,
-                proxy_count=%s,
-                comment=%s
-            WHERE id=1
-            """,
-            (is_active, base_votes, proxy_count, comment)
+            "SELECT last_id, last_hash FROM ledger_checkpoints WHERE chain_key=%s",
+            (_chain_key(topic_id),)
         )
+        checkpoint = cur.fetchone()
 
-        if is_active:
-            otp = generate_otp()
-
+        if checkpoint:
+            # The checkpointed vote itself must still be there
             cur.execute(
-                """
-                INSERT INTO registrations (erf, proxies, otp)
-                VALUES ('DEVELOPER', %s, %s)
-                ON CONFLICT (erf)
-                DO UPDATE SET
-                    proxies = EXCLUDED.proxies,
-                    otp = EXCLUDED.otp
+                f"""
+                SELECT vote_hash FROM votes
+                WHERE id=%(id)s {topic_filter}
                 """,
-                (proxy_count, otp)
-            )
-
-            message = f"Developer OTP: {otp}"
-
-        else:
-            cur.execute(
-                "DELETE FROM registrations WHERE erf='DEVELOPER'"
+                {"id": checkpoint["last_id"], "topic_id": topic_id}
             )
+            row = cur.fetchone()
 
-        conn.commit()
+            if not row or row["vote_hash"] != checkpoint["last_hash"]:
+                return 1, checkpoint["last_id"]
 
-        cur.execute(
-            "SELECT * FROM developer_settings WHERE id=1"
-        )
-        settings = cur.fetchone()
+            last_id, prev_hash = checkpoint["last_id"], checkpoint["last_hash"]
 
-    cur.execute(
-        "SELECT * FROM developer_proxies ORDER BY erf"
+    # Hashed columns only, as tuples, LEDGER_VERIFY_ITERSIZE
+    # rows per round trip: memory stays flat on any ledger size
+    votes = iter_rows(
+        cur.connection,
+        f"""
+        SELECT id, erf, topic_id, option_id, weight, timestamp, vote_hash
+        FROM votes
+        WHERE id > %(after)s {topic_filter}
+        ORDER BY id
+        """,
+        {"after": last_id, "topic_id": topic_id},
+        name="ledger_verify",
+        itersize=LEDGER_VERIFY_ITERSIZE
     )
-    dev_proxies = cur.fetchall()
-
-    conn.close()
 
-    branding = get_hoa_branding(schema)
+    start_id = last_id
+    checked = 0
+    broken_id = None
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card">
-<h2>Developer Settings</h2>
-{% if message %}
-<p class="ok">{{ message }}</p>
-{% endif %}
-{% if error %}
-<p class="bad">{{ error }}</p>
-{% endif %}
-<form method="post">
-  <label>
-    <input type="checkbox" name="is_active"
-      {% if settings.is_active %}checked{% endif %}>
-    Enable Developer Voting
-  </label><br><br>
+    with closing(votes):
+        for vote_id, erf, v_topic, option_id, weight, ts, vote_hash in votes:
+            if isinstance(ts, str):
+                hash_ts = ts
+            else:
+                hash_ts = ts.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+            expected = compute_vote_hash(
+                prev_hash,
+                erf,
+                v_topic,
+                option_id,
+                weight,
+                hash_ts
+            )
+            checked += 1
 
-  Base Votes:
-  <input type="number" name="base_votes" value="{{ settings.base_votes }}"><br>
+            if expected != vote_hash:
+                broken_id = vote_id
+                break
 
-  Proxy Count:
-  <input type="number" value="{{ settings.proxy_count }}" readonly><br>
+            last_id, prev_hash = vote_id, vote_hash
 
-  Comment:<br>
-  <textarea name="comment">{{ settings.comment }}</textarea><br>
+    if last_id and (last_id != start_id or full):
+        save_ledger_checkpoint(cur, topic_id, last_id, prev_hash)
 
-  <button>Save</button>
-</form>
-</div>
+    return checked, broken_id
 
-<div class="card">
-<h3>Developer Proxies</h3>
-<form method="post" action="/admin/developer/add-proxy">
-  <input name="erf" placeholder="ERF">
-  <button>Add Developer Proxy</button>
-</form>
+def verify_topic_chains(schema, topic_ids, full=False):
+    """
+    Verifies each topic's chain on its own pooled connection,
+    LEDGER_VERIFY_WORKERS at a time. Returns
+    {topic_id: (rows_checked, first_broken_id)}.
+    """
+    def verify(topic_id):
+        with pooled_connection() as conn:
+            cur = conn.cursor()
+            set_search_path(cur, schema)
+            result = verify_vote_chain(cur, topic_id, full)
+            conn.commit()
+            return topic_id, result
 
-<table>
-<tr>
-  <th>ERF</th>
-  <th>Action</th>
-</tr>
+    if not topic_ids:
+        return {}
 
-{% for p in dev_proxies %}
-<tr>
-  <td>{{ p.erf }}</td>
-  <td>
-    <form method="post"
-          action="/admin/developer/delete-proxy"
-          style="display:inline"
-          onsubmit="return confirm('Delete this developer proxy?');">
+    workers = max(1, min(LEDGER_VERIFY_WORKERS, len(topic_ids)))
 
-      <input type="hidden"
-             name="erf"
-             value="{{ p.erf }}">
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(verify, topic_ids))
 
-      <button type="submit">
-        Delete
-      </button>
+def verify_ledger_anchors(cur):
+    """
+    Checks the anchor chain and that every anchored topic head
+    is still a vote in that topic (or GENESIS). Returns
+    (anchors_checked, first_broken_anchor_id).
+    """
+    cur.execute(
+        "SELECT * FROM ledger_anchors ORDER BY id"
+    )
+    anchors = cur.fetchall()
 
-    </form>
-  </td>
-</tr>
-{% endfor %}
-</table>
-</div>
-""" + BASE_TAIL,
-        settings=settings,
-        dev_proxies=dev_proxies,
-        message=message,
-        error=error,
-        branding=branding
+    cur.execute(
+        """
+        SELECT topic_id, vote_hash
+        FROM votes
+        WHERE vote_hash = ANY(%s::text[])
+        """,
+        ([
+            h.partition(":")[2]
+            for a in anchors if a["heads"]
+            for h in a["heads"].split(",")
+        ],)
     )
-    
-@app.route("/admin/developer/add-proxy", methods=["GET", "POST"])
-def admin_add_developer_proxy():
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+    present = {(str(r["topic_id"]), r["vote_hash"]) for r in cur.fetchall()}
 
-    if request.method == "GET":
-        return redirect("/admin/developer")
+    prev_anchor = GENESIS_HASH
+    checked = 0
 
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+    for a in anchors:
+        checked += 1
 
-    erf = request.form.get("erf", "").strip().upper()
-    if not erf:
-        return redirect("/admin/developer")
+        if (
+            a["prev_anchor"] != prev_anchor
+            or a["anchor_hash"] != compute_anchor_hash(prev_anchor, a["heads"])
+        ):
+            return checked, a["id"]
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
+        for head in filter(None, a["heads"].split(",")):
+            topic_id, _, last_hash = head.partition(":")
+            if last_hash != GENESIS_HASH and (topic_id, last_hash) not in present:
+                return checked, a["id"]
 
-    # Must exist as owner
-    cur.execute(
-        "SELECT 1 FROM owners WHERE erf=%s",
-        (erf,)
-    )
-    owner = cur.fetchone()
+        prev_anchor = a["anchor_hash"]
 
-    if not owner:
-        conn.close()
-        return redirect("/admin/developer")
+    return checked, None
 
-    # Must not be owner proxy
-    cur.execute(
-        "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
-        (erf,)
-    )
-    op = cur.fetchone()
-    if op:
-        conn.close()
-        return redirect("/admin/developer")
+# ======================================================
+# MERKLE DIGESTS (VOTE INCLUSION PROOFS)
+#
+# Votes are grouped by id into blocks of MERKLE_BLOCK_SIZE
+# (block n holds ids n*size+1 .. (n+1)*size) and each block's
+# Merkle root over the vote hashes is stored in merkle_blocks.
+# A proof is the sibling path from one vote to its block root,
+# so an owner can check a receipt offline (see
+# verify_merkle_proof.py) without the ledger being rehashed.
+#
+# Blocks are sealed from the admin verification page, and
+# only once votes exist past their end, so a stored root
+# never changes under a receipt already handed out; they are
+# only rewritten when a topic (and its votes) is deleted.
+# Until its block is sealed a vote's proof is "pending". The
+# voter side only reads merkle_blocks and never takes locks.
+# ======================================================
 
-    # Must not have voted
-    cur.execute(
-        "SELECT 1 FROM votes WHERE erf=%s",
-        (erf,)
-    )
-    voted = cur.fetchone()
-    if voted:
-        conn.close()
-        return redirect("/admin/developer")
+MERKLE_BLOCKS_DDL = """
+CREATE TABLE merkle_blocks (
+    block_no INTEGER PRIMARY KEY,
+    block_size INTEGER NOT NULL,
+    first_id INTEGER NOT NULL,
+    last_id INTEGER NOT NULL,
+    leaf_count INTEGER NOT NULL,
+    root TEXT NOT NULL,
+    complete BOOLEAN NOT NULL,
+    sealed_at TIMESTAMP NOT NULL DEFAULT now()
+)
+"""
 
-    cur.execute(
-        """
-        INSERT INTO developer_proxies (erf)
-        VALUES (%s)
-        ON CONFLICT DO NOTHING
-        """,
-        (erf,)
-    )
+schema_object("merkle_blocks", MERKLE_BLOCKS_DDL)
 
-    # Count proxies
-    cur.execute(
-        "SELECT COUNT(*) AS proxy_count FROM developer_proxies"
-    )
-    proxy_row = cur.fetchone()
-    proxy_count = proxy_row["proxy_count"] if proxy_row else 0
+def merkle_leaf(vote_hash):
+    return hashlib.sha256(f"L|{vote_hash}".encode("utf-8")).hexdigest()
 
-    # Update developer settings
-    cur.execute(
-        """
-        UPDATE developer_settings
-        SET proxy_count=%s
-        WHERE id=1
-        """,
-        (proxy_count,)
-    )
+def merkle_node(left, right):
+    return hashlib.sha256(f"N|{left}|{right}".encode("utf-8")).hexdigest()
 
-    # Update DEVELOPER registration if exists
-    cur.execute(
-        """
-        UPDATE registrations
-        SET proxies=%s
-        WHERE erf='DEVELOPER'
-        """,
-        (proxy_count,)
-    )
+def merkle_levels(leaves):
+    """
+    All levels of the tree, leaves first. An unpaired last node
+    is carried up unchanged.
+    """
+    levels = [leaves]
+
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([
+            merkle_node(level[i], level[i + 1]) if i + 1 < len(level)
+            else level[i]
+            for i in range(0, len(level), 2)
+        ])
 
-    conn.commit()
-    conn.close()
+    return levels
 
-    return redirect("/admin/developer")
+def merkle_path(levels, index):
+    """
+    Sibling hashes from leaf `index` up to the root, each with
+    the side it sits on.
+    """
+    path = []
 
-@app.route("/admin/developer/delete-proxy", methods=["POST"])
-def admin_delete_developer_proxy():
+    for level in levels[:-1]:
+        sibling = index ^ 1
 
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+        if sibling < len(level):
+            path.append({
+                "side": "left" if sibling < index else "right",
+                "hash": level[sibling]
+            })
 
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+        index //= 2
 
-    erf = request.form.get("erf", "").strip().upper()
+    return path
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
+def _block_leaves(cur, first_id, last_id):
+    cur.execute(
+        """
+        SELECT id, vote_hash
+        FROM votes
+        WHERE id BETWEEN %s AND %s
+        ORDER BY id
+        """,
+        (first_id, last_id)
+    )
+    return cur.fetchall()
+
+def seal_merkle_blocks(cur):
+    """
+    Stores roots for every complete block not yet sealed and
+    returns how many were added. Briefly blocks new votes so no
+    lower id can commit after a block is sealed; admin path
+    only, the caller commits.
+    """
+    cur.execute("LOCK TABLE votes IN SHARE MODE")
 
-    # Delete proxy
+    # Blocks sealed under another size (or, before sealing was
+    # limited to full blocks, left open) are unusable
     cur.execute(
         """
-        DELETE FROM developer_proxies
-        WHERE erf=%s
+        DELETE FROM merkle_blocks
+        WHERE block_size <> %s OR NOT complete
         """,
-        (erf,)
+        (MERKLE_BLOCK_SIZE,)
     )
 
-    # Recalculate count
+    cur.execute("SELECT COALESCE(max(id), 0) AS max_id FROM votes")
+    max_id = cur.fetchone()["max_id"]
+
+    # Only blocks the ledger has already grown past
     cur.execute(
         """
-        SELECT COUNT(*) AS proxy_count
-        FROM developer_proxies
-        """
+        SELECT b AS block_no
+        FROM generate_series(0, %s) AS b
+        WHERE NOT EXISTS (
+            SELECT 1 FROM merkle_blocks m
+            WHERE m.block_no = b
+        )
+        ORDER BY b
+        """,
+        (max_id // MERKLE_BLOCK_SIZE - 1,)
     )
 
-    row = cur.fetchone()
-    proxy_count = row["proxy_count"] if row else 0
+    sealed = 0
 
-    # Update settings
+    for block_no in [r["block_no"] for r in cur.fetchall()]:
+        first_id = block_no * MERKLE_BLOCK_SIZE + 1
+        last_id = first_id + MERKLE_BLOCK_SIZE - 1
+
+        leaves = [
+            merkle_leaf(v["vote_hash"])
+            for v in _block_leaves(cur, first_id, last_id)
+        ]
+        if not leaves:
+            continue
+
+        cur.execute(
+            """
+            INSERT INTO merkle_blocks
+                (block_no, block_size, first_id, last_id,
+                 leaf_count, root, complete)
+            VALUES (%s, %s, %s, %s, %s, %s, TRUE)
+            """,
+            (
+                block_no, MERKLE_BLOCK_SIZE, first_id, last_id,
+                len(leaves), merkle_levels(leaves)[-1][0]
+            )
+        )
+        sealed += 1
+
+    return sealed
+
+def count_unsealed_votes(cur):
+    """
+    Votes whose block has no stored root yet.
+    """
     cur.execute(
         """
-        UPDATE developer_settings
-        SET proxy_count=%s
-        WHERE id=1
+        SELECT count(*) AS n
+        FROM votes v
+        WHERE NOT EXISTS (
+            SELECT 1 FROM merkle_blocks m
+            WHERE m.block_no = (v.id - 1) / %s
+              AND m.block_size = %s
+        )
         """,
-        (proxy_count,)
+        (MERKLE_BLOCK_SIZE, MERKLE_BLOCK_SIZE)
     )
+    return cur.fetchone()["n"]
 
-    # Update developer registration
+def _get_merkle_block(cur, block_no):
     cur.execute(
         """
-        UPDATE registrations
-        SET proxies=%s
-        WHERE erf='DEVELOPER'
+        SELECT * FROM merkle_blocks
+        WHERE block_no=%s AND block_size=%s
         """,
-        (proxy_count,)
+        (block_no, MERKLE_BLOCK_SIZE)
     )
+    return cur.fetchone()
 
-    conn.commit()
-    conn.close()
+def merkle_proof(cur, vote):
+    """
+    Inclusion proof for a vote row, or a "pending" status while
+    its block is unsealed. Read-only. The path is built from the
+    current ledger, so it only reaches the stored root if the
+    block is unchanged since sealing.
+    """
+    block_no = (vote["id"] - 1) // MERKLE_BLOCK_SIZE
+    block = _get_merkle_block(cur, block_no)
+
+    if block is None or not block["complete"]:
+        return {
+            "status": "pending",
+            "vote": {"id": vote["id"], "topic_id": vote["topic_id"]},
+            "block": {"block_no": block_no}
+        }
+
+    rows = _block_leaves(cur, block["first_id"], block["last_id"])
+    ids = [r["id"] for r in rows]
+    levels = merkle_levels([merkle_leaf(r["vote_hash"]) for r in rows])
+
+    ts = vote["timestamp"]
+
+    return {
+        "status": "sealed",
+        "vote": {
+            "id": vote["id"],
+            "topic_id": vote["topic_id"],
+            "erf": vote["erf"],
+            "option_id": vote["option_id"],
+            "weight": vote["weight"],
+            "timestamp": ts if isinstance(ts, str)
+                else ts.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+            "prev_hash": vote["prev_hash"],
+            "vote_hash": vote["vote_hash"]
+        },
+        "block": {
+            "block_no": block["block_no"],
+            "first_id": block["first_id"],
+            "last_id": block["last_id"],
+            "leaf_count": block["leaf_count"],
+            "complete": block["complete"],
+            "root": block["root"]
+        },
+        "leaf_index": ids.index(vote["id"]),
+        "path": merkle_path(levels, ids.index(vote["id"]))
+    }
 
-    return redirect("/admin/developer")
-    
 # ======================================================
-# VOTE WEIGHT COMPUTATION
-#
-# Voting Model
-#
-# Every owner contributes exactly one vote.
-#
-# Owner proxies transfer an owner's vote to another owner.
-# They NEVER create additional votes.
-#
-# Developer base votes create additional votes and therefore
-# increase the total voting entitlement.
-#
-# Developer proxies transfer existing owner votes to the
-# developer and therefore DO NOT increase the total voting
-# entitlement.
+# TOPIC TALLIES, QUORUM & LIVE DASHBOARD (SSE)
 #
-# This function determines ONLY the effective voting weight
-# of a single voter.
+# topic_tallies keeps a running count and weight per option,
+# updated by append_votes() in the votes' own transaction, so
+# results never need a SUM over votes. With LIVE_UPDATES (off
+# by default; NOTIFY serializes commits across the database)
+# each tally change is also NOTIFYed on the schema's live channel,
+# and statement triggers send quorum deltas: registered weight
+# (effective_weights, which every registration, proxy and
+# developer change refreshes) and eligible weight (owners,
+# developer_settings). /admin/live streams a snapshot and then
+# these events to dashboards as Server-Sent Events, applying
+# the deltas to its own quorum figures. Every event carries
+# its txid, so ones already in the snapshot are skipped.
 #
-# It does NOT determine the total voting entitlement of the HOA.
+# Each open stream occupies a worker thread: run with
+# threaded workers (e.g. gunicorn gthread).
 # ======================================================
 
-def compute_vote_weight(cur, erf):
-    """
-    Computes total vote weight for an ERF according to legacy rules.
-    """
-    # Developer vote
-    if erf == "DEVELOPER":
-        cur.execute(
-            "SELECT is_active, base_votes, proxy_count FROM developer_settings LIMIT 1"
-        )
-        settings = cur.fetchone()
-        if not settings or not settings["is_active"]:
-            return 0
+TOPIC_TALLIES_DDL = """
+CREATE TABLE topic_tallies (
+    topic_id INTEGER NOT NULL,
+    option_id INTEGER NOT NULL,
+    votes INTEGER NOT NULL,
+    weight BIGINT NOT NULL,
+    PRIMARY KEY (topic_id, option_id)
+)
+"""
 
-        cur.execute(
-            "SELECT COUNT(*) AS c FROM developer_proxies"
-        )
-        proxy_count = cur.fetchone()["c"]
+TALLY_UPSERT_SQL = """
+INSERT INTO topic_tallies (topic_id, option_id, votes, weight)
+SELECT topic_id, option_id, 1, weight
+FROM unnest(%s::int[], %s::int[], %s::int[])
+    AS v(topic_id, option_id, weight)
+ON CONFLICT (topic_id, option_id)
+DO UPDATE SET
+    votes = topic_tallies.votes + 1,
+    weight = topic_tallies.weight + EXCLUDED.weight
+"""
 
-        return (
-            settings["base_votes"]
-            + proxy_count
-        )
+# Sent to a schema's streams when topics or options change
+LIVE_RESYNC = '{"type": "resync"}'
 
-    # Developer proxies cannot vote
+def rebuild_topic_tallies(cur):
+    cur.execute("DELETE FROM topic_tallies")
     cur.execute(
-        "SELECT 1 FROM developer_proxies WHERE erf=%s",
-        (erf,)
+        """
+        INSERT INTO topic_tallies (topic_id, option_id, votes, weight)
+        SELECT topic_id, option_id, COUNT(*), COALESCE(SUM(weight), 0)
+        FROM votes
+        GROUP BY topic_id, option_id
+        """
     )
-    dev_proxy = cur.fetchone()
-    if dev_proxy:
-        return 0
 
-    # Owner proxies cannot vote
-    cur.execute(
-        "SELECT 1 FROM owner_proxies WHERE proxy_erf=%s",
-        (erf,)
-    )
-    owner_proxy = cur.fetchone()
-    if owner_proxy:
-        return 0
+schema_object("topic_tallies", TOPIC_TALLIES_DDL, rebuild_topic_tallies)
+
+QUORUM_TRIGGERS_DDL = """
+CREATE FUNCTION hoa_notify_quorum_delta() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    added BIGINT := 0;
+    removed BIGINT := 0;
+BEGIN
+    IF TG_TABLE_NAME = 'effective_weights' THEN
+        IF TG_OP <> 'DELETE' THEN
+            SELECT COALESCE(SUM(weight), 0) INTO added FROM new_rows;
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            SELECT COALESCE(SUM(weight), 0) INTO removed FROM old_rows;
+        END IF;
+
+    ELSIF TG_TABLE_NAME = 'owners' THEN
+        IF TG_OP = 'INSERT' THEN
+            SELECT COUNT(*) INTO added FROM new_rows;
+        ELSE
+            SELECT COUNT(*) INTO removed FROM old_rows;
+        END IF;
+
+    ELSE
+        -- developer_settings: base votes count while active
+        IF TG_OP <> 'DELETE' THEN
+            SELECT COALESCE(SUM(base_votes) FILTER (WHERE is_active), 0)
+            INTO added FROM new_rows;
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            SELECT COALESCE(SUM(base_votes) FILTER (WHERE is_active), 0)
+            INTO removed FROM old_rows;
+        END IF;
+    END IF;
+
+    IF added <> removed THEN
+        PERFORM pg_notify(
+            'live:' || TG_TABLE_SCHEMA,
+            json_build_object(
+                'type', 'weight',
+                CASE WHEN TG_TABLE_NAME = 'effective_weights'
+                     THEN 'registered_delta'
+                     ELSE 'total_delta'
+                END,
+                added - removed,
+                'txid', txid_current()
+            )::text
+        );
+    END IF;
+
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER quorum_weights_ins AFTER INSERT ON effective_weights
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_weights_upd AFTER UPDATE ON effective_weights
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_weights_del AFTER DELETE ON effective_weights
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_owners_ins AFTER INSERT ON owners
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_owners_del AFTER DELETE ON owners
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_developer_ins AFTER INSERT ON developer_settings
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_developer_upd AFTER UPDATE ON developer_settings
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+
+CREATE TRIGGER quorum_developer_del AFTER DELETE ON developer_settings
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION hoa_notify_quorum_delta();
+"""
+
+if LIVE_UPDATES:
+    schema_object("hoa_notify_quorum_delta", QUORUM_TRIGGERS_DDL)
+
+def live_channel(schema):
+    return f"live:{schema}"
 
-    weight = 1
+def notify_live(cur, schema, payload):
+    if LIVE_UPDATES:
+        notify(cur, live_channel(schema), payload)
 
-       # Numeric proxies (already includes owner proxies)
+def record_tallies(cur, votes):
+    """
+    Adds [(topic_id, option_id, weight)], at most one entry per
+    option, to the running tallies.
+    """
+    params = tuple(list(column) for column in zip(*votes))
+
+    if not LIVE_UPDATES:
+        cur.execute(TALLY_UPSERT_SQL, params)
+        return
+
+    # Same round trip: the new totals go out on commit
     cur.execute(
-        "SELECT proxies FROM registrations WHERE erf=%s",
-        (erf,)
+        """
+        WITH t AS (
+            {upsert}
+            RETURNING topic_id, option_id, votes, weight
+        )
+        SELECT pg_notify(
+            %s || current_schema(),
+            json_build_object(
+                'type', 'tally',
+                'topic_id', topic_id,
+                'option_id', option_id,
+                'votes', votes,
+                'weight', weight,
+                'txid', txid_current()
+            )::text
+        )
+        FROM t
+        """.format(upsert=TALLY_UPSERT_SQL),
+        params + (live_channel(""),)
     )
-    reg = cur.fetchone()
 
-    if reg:
-        weight += reg["proxies"]
+class LiveFeed:
+    """
+    Fans a schema's live events out to the SSE streams open in
+    this process, one bounded queue per stream. A None item
+    tells the stream to resend its snapshot.
+    """
 
-    return weight
+    def __init__(self):
+        self.clients = {}
+        self.lock = threading.Lock()
 
-# ======================================================
-# TOPICS & OPTIONS (ADMIN)
-# ======================================================
+    def join(self, schema):
+        queue = Queue(maxsize=LIVE_QUEUE_SIZE)
 
-@app.route("/admin/topics", methods=["GET", "POST"])
-def admin_topics():
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+        with self.lock:
+            if schema not in self.clients:
+                self.clients[schema] = set()
+                notify_listener.subscribe(
+                    live_channel(schema),
+                    lambda payload: self.publish(schema, payload)
+                )
+            self.clients[schema].add(queue)
 
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+        notify_listener.start()
+        return queue
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
+    def leave(self, schema, queue):
+        with self.lock:
+            self.clients.get(schema, set()).discard(queue)
 
-    if request.method == "POST":
-        title = request.form.get("title", "").strip()
-        description = request.form.get("description", "").strip()
-        vote_mode = request.form.get("vote_mode", "AGM").strip().upper()
+    def publish(self, schema, payload):
+        if payload == LIVE_RESYNC:
+            payload = None
 
-        if vote_mode not in ["AGM", "GENERAL"]:
-            vote_mode = "AGM"
+        with self.lock:
+            queues = list(self.clients.get(schema, ()))
 
-        if title:
-            cur.execute(
-                """
-                INSERT INTO topics (title, description, is_open, vote_mode)
-                VALUES (%s, %s, FALSE, %s)
-                """,
-                (title, description, vote_mode)
-            )
-            conn.commit()
+        for queue in queues:
+            try:
+                queue.put_nowait(payload)
+            except Full:
+                # Stalled browser: drop its backlog and resync
+                with queue.mutex:
+                    queue.queue.clear()
+                queue.put_nowait(None)
 
-    cur.execute(
-        "SELECT * FROM topics ORDER BY id DESC"
-    )
-    topics = cur.fetchall()
+live_feed = LiveFeed()
 
-    conn.close()
+def load_live_snapshot(schema):
+    """
+    Open topics with their tallies plus the quorum figures,
+    read on a short pooled checkout (streams outlive g).
+    """
+    with pooled_connection() as conn:
+        cur = conn.cursor()
+        set_search_path(cur, schema)
 
-    branding = get_hoa_branding(schema)
+        # One snapshot for everything below, and its txid bounds
+        cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        cur.execute("SELECT txid_current_snapshot()::text AS snapshot")
+        txid_snapshot = cur.fetchone()["snapshot"]
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card">
-<h2>Topics</h2>
-<form method="post">
-  <p><input name="title" placeholder="Topic title"></p>
-  <p><textarea name="description" placeholder="Description"></textarea></p>
+        stats = get_dashboard_stats(cur, schema)
 
-  <p>
-    Vote Mode<br>
-    <select name="vote_mode">
-      <option value="AGM">AGM</option>
-      <option value="GENERAL">GENERAL</option>
-    </select>
-  </p>
+        cur.execute(
+            """
+            SELECT
+                t.id AS topic_id,
+                t.title,
+                o.id AS option_id,
+                o.label,
+                COALESCE(tt.votes, 0) AS votes,
+                COALESCE(tt.weight, 0) AS weight
+            FROM topics t
+            JOIN options o ON o.topic_id = t.id
+            LEFT JOIN topic_tallies tt
+                ON tt.topic_id = t.id AND tt.option_id = o.id
+            WHERE t.is_open = TRUE
+            ORDER BY t.id, o.id
+            """
+        )
+        rows = cur.fetchall()
 
-  <button>Create Topic</button>
-</form>
+    topics = {}
+    for r in rows:
+        topic = topics.setdefault(
+            r["topic_id"],
+            {"id": r["topic_id"], "title": r["title"], "options": []}
+        )
+        topic["options"].append({
+            "id": r["option_id"],
+            "label": r["label"],
+            "votes": r["votes"],
+            "weight": r["weight"]
+        })
+
+    return {
+        "type": "snapshot",
+        "topics": list(topics.values()),
+        "quorum": quorum_figures(
+            stats["quorum_registered"],
+            stats["quorum_total"],
+            stats["quorum_threshold"]
+        ),
+        "txid_snapshot": txid_snapshot
+    }
+
+def txid_visible(txid, snapshot):
+    """
+    True if transaction txid had committed as of snapshot
+    (txid_current_snapshot() text form, "xmin:xmax:xip,...").
+    """
+    xmin, xmax, xip = snapshot.split(":")
 
-<table>
-<tr><th>Title</th><th>Mode</th><th>Status</th><th>Actions</th></tr>
-{% for t in topics %}
-<tr>
-  <td>{{ t.title }}</td>
-  <td>{{ t.vote_mode }}</td>
-  <td>{{ "OPEN" if t.is_open else "CLOSED" }}</td>
-  <td>
-<a href="/admin/topics/{{ t.id }}/options">Options</a> |
+    if txid < int(xmin):
+        return True
+    if txid >= int(xmax):
+        return False
 
-<a href="/admin/topics/{{ t.id }}/export">
-  Export Results
-</a> |
+    return str(txid) not in xip.split(",")
 
-<a href="/admin/topics/{{ t.id }}/toggle">
-      {{ "Close" if t.is_open else "Open" }}
-    </a>
+def _sse(data):
+    return f"data: {data}\n\n"
 
-    {% if not t.is_open %}
-    |
-    <form method="post"
-          action="/admin/topics/{{ t.id }}/delete"
-          style="display:inline"
-          onsubmit="return confirm('Delete this topic and all votes?');">
-      <button type="submit">Delete</button>
-    </form>
-    {% endif %}
-  </td>
-</tr>
-{% endfor %}
-</table>
-</div>
-""" + BASE_TAIL,
-        topics=topics,
-        branding=branding,
-    )
-@app.route("/admin/topics/<int:topic_id>/toggle")
-def admin_toggle_topic(topic_id):
+@app.route("/admin/live")
+def admin_live():
     if not session.get("admin_logged_in"):
         return redirect("/admin/login")
 
@@ -2407,108 +5846,101 @@ def admin_toggle_topic(topic_id):
     if not schema:
         abort(403)
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
-
-    cur.execute(
-        "UPDATE topics SET is_open = NOT is_open WHERE id=%s",
-        (topic_id,)
-    )
+    if not LIVE_UPDATES:
+        abort(404)
 
-    conn.commit()
-    conn.close()
+    def events():
+        feed = live_feed.join(schema)
 
-    return redirect("/admin/topics")
+        try:
+            snapshot = load_live_snapshot(schema)
+            quorum = snapshot["quorum"]
+            yield _sse(json.dumps(snapshot))
 
+            while True:
+                try:
+                    payload = feed.get(timeout=LIVE_KEEPALIVE)
+                except Empty:
+                    yield ": keepalive\n\n"
+                    continue
 
-@app.route("/admin/topics/<int:topic_id>/options", methods=["GET", "POST"])
-def admin_topic_options(topic_id):
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+                if payload is None:
+                    snapshot = load_live_snapshot(schema)
+                    quorum = snapshot["quorum"]
+                    yield _sse(json.dumps(snapshot))
+                    continue
 
-    schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+                event = json.loads(payload)
 
-    conn = get_conn()
-    cur = conn.cursor()
-    set_search_path(cur, schema)
+                if txid_visible(event["txid"], snapshot["txid_snapshot"]):
+                    continue
 
-    cur.execute(
-        "SELECT * FROM topics WHERE id=%s",
-        (topic_id,)
-    )
-    topic = cur.fetchone()
+                if event["type"] == "weight":
+                    quorum = quorum_figures(
+                        quorum["quorum_registered"]
+                        + event.get("registered_delta", 0),
+                        quorum["quorum_total"]
+                        + event.get("total_delta", 0),
+                        quorum["quorum_threshold"]
+                    )
+                    payload = json.dumps(dict(quorum, type="quorum"))
 
-    if not topic:
-        conn.close()
-        abort(404)
+                yield _sse(payload)
 
-    allow_add = not topic["is_open"]
+        finally:
+            live_feed.leave(schema, feed)
 
-    if request.method == "POST" and allow_add:
-        label = request.form.get("label", "").strip()
+    response = Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream"
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
 
-        if label:
-            cur.execute(
-                """
-                INSERT INTO options (topic_id, label)
-                VALUES (%s, %s)
-                """,
-                (topic_id, label)
-            )
-            conn.commit()
+    return response
 
-    cur.execute(
-        "SELECT * FROM options WHERE topic_id=%s ORDER BY id",
-        (topic_id,)
-    )
-    options = cur.fetchall()
+# ======================================================
+# PUBLIC VOTING — CAST VOTE
+# ======================================================
 
-    conn.close()
+register_page("vote_topic_already_voted", "public", """
+        <div class="card bad">
+        You have already voted on this topic.
+        </div>
+        """)
 
-    branding = get_hoa_branding(schema)
+register_page("vote_topic_not_eligible", "public", """
+        <div class="card bad">
+        You are not eligible to vote.
+        </div>
+        """)
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
+register_page("vote_topic", "public", """
 <div class="card">
-<h2>Options for: {{ topic.title }}</h2>
-
-{% if allow_add %}
+<h2>{{ topic.title }}</h2>
 <form method="post">
-  <input name="label" placeholder="Option label">
-  <button>Add Option</button>
-</form>
-{% else %}
-<p class="bad">Voting is open. Options are locked.</p>
-{% endif %}
-
-<table>
-<tr><th>Option</th></tr>
 {% for o in options %}
-<tr>
-  <td>{{ o.label }}</td>
-</tr>
+  <p>
+    <label>
+      <input type="radio" name="option" value="{{ o.id }}" required>
+      {{ o.label }}
+    </label>
+  </p>
 {% endfor %}
-</table>
-
-<br>
-<a href="/admin/topics" class="btn">Back</a>
+<button>Submit Vote</button>
+</form>
 </div>
-""" + BASE_TAIL,
-        topic=topic,
-        options=options,
-        allow_add=allow_add,
-        branding=branding
-    )
+""")
 
-@app.route("/admin/topics/<int:topic_id>/delete", methods=["POST"])
-def admin_delete_topic(topic_id):
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+@app.route("/vote/<hoa>/<int:topic_id>", methods=["GET", "POST"])
+def vote_topic(hoa, topic_id):
+    if not session.get("voter_erf"):
+        return redirect(f"/vote/{hoa}/login")
 
     schema = session.get("hoa_schema")
+    if schema != hoa:
+        return redirect(f"/vote/{hoa}/login")
+
     if not schema:
         abort(403)
 
@@ -2516,129 +5948,279 @@ def admin_delete_topic(topic_id):
     cur = conn.cursor()
     set_search_path(cur, schema)
 
+    erf = session["voter_erf"]
+
+    # Topic, the voter's stored weight and (for the form) whether
+    # the ERF has voted, in one round trip. A POST skips the vote
+    # check: append_vote() repeats it under the ledger lock anyway.
     cur.execute(
-        "SELECT * FROM topics WHERE id=%s",
-        (topic_id,)
+        """
+        SELECT
+            t.*,
+            (SELECT weight FROM effective_weights WHERE erf=%s)
+                AS stored_weight,
+            %s AND EXISTS (
+                SELECT 1 FROM votes
+                WHERE topic_id=t.id AND erf=%s
+            ) AS already_voted
+        FROM topics t
+        WHERE t.id=%s AND t.is_open=TRUE
+        """,
+        (erf, request.method == "GET", erf, topic_id)
     )
     topic = cur.fetchone()
 
     if not topic:
-        conn.close()
         abort(404)
 
-    # Safety: only closed topics may be deleted
-    if topic["is_open"]:
-        conn.close()
-        return redirect("/admin/topics")
+    # Duplicate vote prevention (legacy behaviour)
+    if topic["already_voted"]:
+        branding = get_hoa_branding(schema)
 
-    # Delete votes first
-    cur.execute(
-        "DELETE FROM votes WHERE topic_id=%s",
-        (topic_id,)
-    )
+        return render_page(
+            "vote_topic_already_voted",
+            branding=branding
+        )
+
+    if topic["vote_mode"] == "GENERAL":
+        weight = 1
+    else:
+        weight = voter_weight(cur, erf, topic["stored_weight"])
+
+    if weight <= 0:
+        branding = get_hoa_branding(schema)
+
+        return render_page(
+            "vote_topic_not_eligible",
+            branding=branding
+        )
+
+    if request.method == "POST":
+        option_id = request.form.get("option")
+        if not option_id:
+            return redirect(f"/vote/{hoa}/{topic_id}")
+
+        option_id = int(option_id)
+
+        vote_id = append_vote(cur, topic_id, erf, option_id, weight)
+
+        # A concurrent request from the same voter got there first
+        if vote_id is None:
+            conn.rollback()
+
+            return render_page(
+                "vote_topic_already_voted",
+                branding=get_hoa_branding(schema)
+            )
+
+        conn.commit()
+        return redirect(f"/vote/{hoa}")
 
-    # Delete options
     cur.execute(
-        "DELETE FROM options WHERE topic_id=%s",
+        """
+        SELECT * FROM options
+        WHERE topic_id=%s
+        ORDER BY id
+        """,
         (topic_id,)
     )
+    options = cur.fetchall()
 
-    # Delete topic
-    cur.execute(
-        "DELETE FROM topics WHERE id=%s",
-        (topic_id,)
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "vote_topic",
+        topic=topic,
+        options=options,
+        branding=branding
     )
 
-    conn.commit()
-    conn.close()
+# ======================================================
+# PUBLIC VOTING — BALLOT (ALL OPEN TOPICS)
+#
+# One page for every open topic of the voter's mode and one
+# submission: the page is a single query, and the votes go in
+# with append_votes() in one transaction. Topics left blank
+# stay open for the voter.
+# ======================================================
 
-    return redirect("/admin/topics")
+BALLOT_SQL = """
+SELECT
+    t.id,
+    t.title,
+    t.description,
+    (SELECT weight FROM effective_weights WHERE erf=%s)
+        AS stored_weight,
+    EXISTS (
+        SELECT 1 FROM votes v
+        WHERE v.topic_id=t.id AND v.erf=%s
+    ) AS already_voted,
+    COALESCE(
+        json_agg(
+            json_build_object('id', o.id, 'label', o.label)
+            ORDER BY o.id
+        ) FILTER (WHERE o.id IS NOT NULL),
+        '[]'
+    ) AS options
+FROM topics t
+LEFT JOIN options o ON o.topic_id = t.id
+WHERE t.is_open = TRUE
+AND t.vote_mode = %s
+GROUP BY t.id
+ORDER BY t.id
+"""
 
-@app.route("/admin/topics/<int:topic_id>/export")
-def export_topic_results(topic_id):
+register_page("vote_ballot", "public", """
+<div class="card">
+<h2>Ballot</h2>
 
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
+{% if error %}
+<p class="bad">{{ error }}</p>
+{% endif %}
+
+{% if not topics %}
+<p>There are no open topics.</p>
+{% else %}
+<form method="post">
+{% for t in topics %}
+  <h3>{{ t.title }}</h3>
+  {% if t.description %}
+  <p>{{ t.description }}</p>
+  {% endif %}
+
+  {% if t.already_voted %}
+  <p class="ok">You have voted on this topic.</p>
+  {% else %}
+  {% for o in t.options %}
+  <p>
+    <label>
+      <input type="radio" name="topic_{{ t.id }}" value="{{ o.id }}">
+      {{ o.label }}
+    </label>
+  </p>
+  {% endfor %}
+  {% endif %}
+{% endfor %}
+
+{% if topics|rejectattr("already_voted")|list %}
+<p>Topics you leave blank stay open for you to vote on later.</p>
+<button>Submit Ballot</button>
+{% endif %}
+</form>
+{% endif %}
+
+<p><a href="/vote/{{ hoa }}">Back to topics</a></p>
+</div>
+""")
+
+@app.route("/vote/<hoa>/ballot", methods=["GET", "POST"])
+def vote_ballot(hoa):
+    if not session.get("voter_erf"):
+        return redirect(f"/vote/{hoa}/login")
 
     schema = session.get("hoa_schema")
-    if not schema:
-        abort(403)
+    if schema != hoa:
+        return redirect(f"/vote/{hoa}/login")
 
     conn = get_conn()
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    cur.execute(
-        """
-        SELECT title
-        FROM topics
-        WHERE id=%s
-        """,
-        (topic_id,)
-    )
+    erf = session["voter_erf"]
+    vote_mode = session.get("vote_mode", "AGM")
 
-    topic = cur.fetchone()
+    cur.execute(BALLOT_SQL, (erf, erf, vote_mode))
+    topics = cur.fetchall()
 
-    if not topic:
-        conn.close()
-        abort(404)
+    error = None
 
-    cur.execute(
-        """
-        SELECT
-            o.label,
-            COALESCE(SUM(v.weight),0) AS total_votes
-        FROM options o
-        LEFT JOIN votes v
-            ON v.option_id = o.id
-        WHERE o.topic_id=%s
-        GROUP BY o.id, o.label
-        ORDER BY o.id
-        """,
-        (topic_id,)
-    )
+    if request.method == "POST" and topics:
 
-    results = cur.fetchall()
+        if vote_mode == "GENERAL":
+            weight = 1
+        else:
+            weight = voter_weight(cur, erf, topics[0]["stored_weight"])
 
-    conn.close()
+        if weight <= 0:
+            return render_page(
+                "vote_topic_not_eligible",
+                branding=get_hoa_branding(schema)
+            )
 
-    out = StringIO()
-    writer = csv.writer(out, delimiter=';')
+        ballot = []
 
-    writer.writerow(["Topic"])
-    writer.writerow([topic["title"]])
-    writer.writerow([])
+        for t in topics:
+            choice = request.form.get(f"topic_{t['id']}")
+            if not choice or t["already_voted"]:
+                continue
 
-    writer.writerow([
-        "Option",
-        "Votes"
-    ])
+            option_ids = {o["id"] for o in t["options"]}
+            if not choice.isdigit() or int(choice) not in option_ids:
+                abort(400)
 
-    for r in results:
-        writer.writerow([
-            r["label"],
-            r["total_votes"]
-        ])
+            ballot.append((t["id"], int(choice), weight))
 
-    filename = (
-        topic["title"]
-        .replace(" ", "_")
-        .replace("/", "_")
-    )
+        if ballot:
+            append_votes(cur, erf, ballot)
+            conn.commit()
 
-    return send_file(
-        BytesIO(out.getvalue().encode()),
-        mimetype="text/csv",
-        as_attachment=True,
-        download_name=f"{filename}.csv"
+            return redirect(f"/vote/{hoa}/receipts")
+
+        error = "Choose an option on at least one topic."
+
+    return render_page(
+        "vote_ballot",
+        topics=topics,
+        hoa=hoa,
+        error=error,
+        branding=get_hoa_branding(schema)
     )
-    
+
 # ======================================================
-# PUBLIC VOTING — CAST VOTE
+# PUBLIC VOTING — RECEIPTS & INCLUSION PROOFS
 # ======================================================
 
-@app.route("/vote/<hoa>/<int:topic_id>", methods=["GET", "POST"])
-def vote_topic(hoa, topic_id):
+register_page("vote_receipts", "public", """
+<div class="card">
+<h2>My Vote Receipts</h2>
+
+<p>
+Each proof shows that your vote is part of the HOA's sealed
+vote ledger. Keep the file and check it at any time with
+<code>verify_merkle_proof.py</code>. Recent votes show as
+pending until the HOA seals the block they belong to.
+</p>
+
+<table>
+<tr>
+  <th>Topic</th>
+  <th>Your Choice</th>
+  <th>Time</th>
+  <th>Receipt</th>
+</tr>
+{% for v in votes %}
+<tr>
+  <td>{{ v.title }}</td>
+  <td>{{ v.label }}</td>
+  <td>{{ v.timestamp }}</td>
+  <td>
+  {% if v.sealed %}
+    <a href="/vote/{{ hoa }}/proof/{{ v.id }}"
+       download="vote-{{ v.id }}-proof.json">Download proof</a>
+  {% else %}
+    Pending
+  {% endif %}
+  </td>
+</tr>
+{% endfor %}
+</table>
+
+<p><a href="/vote/{{ hoa }}" class="btn">Back</a></p>
+</div>
+""")
+
+@app.route("/vote/<hoa>/receipts")
+def vote_receipts(hoa):
     if not session.get("voter_erf"):
         return redirect(f"/vote/{hoa}/login")
 
@@ -2646,156 +6228,134 @@ def vote_topic(hoa, topic_id):
     if schema != hoa:
         return redirect(f"/vote/{hoa}/login")
 
-    if not schema:
-        abort(403)
-
     conn = get_conn()
     cur = conn.cursor()
     set_search_path(cur, schema)
 
     cur.execute(
         """
-        SELECT * FROM topics
-        WHERE id=%s AND is_open=TRUE
+        SELECT
+            v.id, v.timestamp, t.title, o.label,
+            m.block_no IS NOT NULL AS sealed
+        FROM votes v
+        LEFT JOIN topics t ON t.id = v.topic_id
+        LEFT JOIN options o ON o.id = v.option_id
+        LEFT JOIN merkle_blocks m
+          ON m.block_no = (v.id - 1) / %s
+         AND m.block_size = %s
+         AND m.complete
+        WHERE v.erf=%s
+        ORDER BY v.id
         """,
-        (topic_id,)
+        (MERKLE_BLOCK_SIZE, MERKLE_BLOCK_SIZE, session["voter_erf"])
     )
-    topic = cur.fetchone()
-
-    if not topic:
-        conn.close()
-        abort(404)
-
-    erf = session["voter_erf"]
+    votes = cur.fetchall()
 
-    # Duplicate vote prevention (legacy behaviour)
-    cur.execute(
-        """
-        SELECT 1 FROM votes
-        WHERE topic_id=%s AND erf=%s
-        """,
-        (topic_id, erf)
+    return render_page(
+        "vote_receipts",
+        votes=votes,
+        hoa=hoa,
+        branding=get_hoa_branding(schema)
     )
-    already = cur.fetchone()
-
-    if already:
-        conn.close()
-
-        branding = get_hoa_branding(schema)
-
-        return render_template_string(
-            BASE_HEAD_PUBLIC + """
-        <div class="card bad">
-        You have already voted on this topic.
-        </div>
-        """ + BASE_TAIL,
-            branding=branding
-        )
-
-    if topic["vote_mode"] == "GENERAL":
-        weight = 1
-    else:
-        weight = compute_vote_weight(cur, erf)
 
-    if weight <= 0:
-        conn.close()
+@app.route("/vote/<hoa>/proof/<int:vote_id>")
+def vote_proof(hoa, vote_id):
+    """
+    Inclusion proof for one vote: voters get their own votes,
+    the HOA's admin gets any.
+    """
+    schema = session.get("hoa_schema")
+    if schema != hoa:
+        abort(403)
 
-        branding = get_hoa_branding(schema)
+    is_admin = session.get("admin_logged_in")
+    if not is_admin and not session.get("voter_erf"):
+        abort(403)
 
-        return render_template_string(
-            BASE_HEAD_PUBLIC + """
-        <div class="card bad">
-        You are not eligible to vote.
-        </div>
-        """ + BASE_TAIL,
-            branding=branding
-        )
+    conn = get_conn()
+    cur = conn.cursor()
+    set_search_path(cur, schema)
 
     cur.execute(
-        """
-        SELECT * FROM options
-        WHERE topic_id=%s
-        ORDER BY id
-        """,
-        (topic_id,)
+        "SELECT * FROM votes WHERE id=%s",
+        (vote_id,)
     )
-    options = cur.fetchall()
+    vote = cur.fetchone()
 
-    if request.method == "POST":
-        option_id = request.form.get("option")
-        if not option_id:
-            conn.close()
-            return redirect(f"/vote/{hoa}/{topic_id}")
+    if not vote or (not is_admin and vote["erf"] != session["voter_erf"]):
+        abort(404)
 
-        option_id = int(option_id)
+    proof = merkle_proof(cur, vote)
+    proof["hoa"] = schema
 
-        # Hash chaining (global, deterministic)
-        cur.execute(
-            """
-            SELECT vote_hash
-            FROM votes
-            ORDER BY id DESC
-            LIMIT 1
-            """
-        )
-        last = cur.fetchone()
+    return jsonify(proof)
 
-        prev_hash = last["vote_hash"] if last else GENESIS_HASH
-        ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+# ======================================================
+# VERIFY CRYPTOGRAPHIC VOTE LEDGER (ADMIN)
+# ======================================================
 
-        vote_hash = compute_vote_hash(
-            prev_hash,
-            erf,
-            topic_id,
-            option_id,
-            weight,
-            ts
-        )
+register_page("admin_verify", "admin", """
+<div class="card">
+<h2>Vote Ledger Verification</h2>
+{% if tampered %}
+<p class="bad">TAMPER DETECTED — vote chain is invalid.</p>
+{% elif incremental %}
+<p class="ok">
+OK — votes after the last checkpoint chain on correctly.
+Votes up to the checkpoint were not rehashed by this check.
+</p>
+{% else %}
+<p class="ok">OK — vote chain is intact.</p>
+{% endif %}
 
-        cur.execute(
-            """
-            INSERT INTO votes
-                (topic_id, erf, option_id,
-                 weight, prev_hash, vote_hash, timestamp)
-            VALUES (%s,%s,%s,%s,%s,%s,%s)
-            """,
-            (topic_id, erf, option_id,
-             weight, prev_hash, vote_hash, ts)
-        )
+<p>Ledger mode: <strong>{{ "Per topic" if mode == "topic" else "Global" }}</strong></p>
 
-        conn.commit()
-        conn.close()
-        return redirect(f"/vote/{hoa}")
+<p>
+{{ "Incremental check from the last checkpoint" if incremental else "Full re-verification" }}:
+{{ rows_checked }} rows in {{ elapsed_ms }} ms ({{ rows_per_sec }} rows/s).
+{% if incremental %}
+<a href="/admin/verify?full=1">Re-verify the whole ledger</a>
+{% endif %}
+</p>
 
-    conn.close()
+<table>
+<tr>
+  <th>Chain</th>
+  <th>Checked From</th>
+  <th>Rows Checked</th>
+  <th>Status</th>
+</tr>
+{% for c in chains %}
+<tr>
+  <td>{{ c.label }}</td>
+  <td>{{ "checkpoint at vote %s" % c.checkpoint_id if c.checkpoint_id else "start" }}</td>
+  <td>{{ c.checked }}</td>
+  <td>
+  {% if c.broken_id %}
+    <span class="bad">Broken at vote {{ c.broken_id }}</span>
+  {% else %}
+    OK
+  {% endif %}
+  </td>
+</tr>
+{% endfor %}
+</table>
 
-    branding = get_hoa_branding(schema)
+<p>
+Receipt blocks sealed now: {{ blocks_sealed }}.
+Votes awaiting a full block: {{ votes_unsealed }}.
+</p>
 
-    return render_template_string(
-        BASE_HEAD_PUBLIC + """
-<div class="card">
-<h2>{{ topic.title }}</h2>
-<form method="post">
-{% for o in options %}
-  <p>
-    <label>
-      <input type="radio" name="option" value="{{ o.id }}" required>
-      {{ o.label }}
-    </label>
-  </p>
-{% endfor %}
-<button>Submit Vote</button>
-</form>
+{% if mode == "topic" %}
+<p>
+Cross-topic anchors checked: {{ anchors_checked }}
+{% if anchor_broken_id %}
+<br><span class="bad">Anchor {{ anchor_broken_id }} does not match the ledger.</span>
+{% endif %}
+</p>
+{% endif %}
 </div>
-""" + BASE_TAIL,
-        topic=topic,
-        options=options,
-        branding=branding
-    )
-
-# ======================================================
-# VERIFY CRYPTOGRAPHIC VOTE LEDGER (ADMIN)
-# ======================================================
+""")
 
 @app.route("/admin/verify")
 def admin_verify():
@@ -2810,53 +6370,93 @@ def admin_verify():
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    cur.execute(
-        "SELECT * FROM votes ORDER BY id"
-    )
-    votes = cur.fetchall()
+    full = request.args.get("full") == "1"
+    mode = get_ledger_mode(cur)
+    anchors_checked, anchor_broken_id = 0, None
 
-    prev_hash = GENESIS_HASH
-    tampered = False
+    # Where each chain resumes, read before verifying moves it
+    checkpoints = {}
+    if not full:
+        cur.execute("SELECT chain_key, last_id FROM ledger_checkpoints")
+        checkpoints = {r["chain_key"]: r["last_id"] for r in cur.fetchall()}
 
-    for v in votes:
-        ts = v["timestamp"]
+    started = time.perf_counter()
 
-        if isinstance(ts, str):
-            hash_ts = ts
-        else:
-            hash_ts = ts.strftime("%Y-%m-%dT%H:%M:%S.%f")
+    if mode == "topic":
+        anchor_ledger(cur)
+        conn.commit()
 
-        expected = compute_vote_hash(
-            prev_hash,
-            v["erf"],
-            v["topic_id"],
-            v["option_id"],
-            v["weight"],
-            hash_ts
+        cur.execute(
+            """
+            SELECT v.topic_id, t.title
+            FROM (SELECT DISTINCT topic_id FROM votes) v
+            LEFT JOIN topics t ON t.id = v.topic_id
+            ORDER BY v.topic_id
+            """
+        )
+        topics = cur.fetchall()
+
+        results = verify_topic_chains(
+            schema,
+            [t["topic_id"] for t in topics],
+            full
         )
+        chains = [
+            {
+                "label": t["title"] or f"Topic {t['topic_id']}",
+                "checkpoint_id": checkpoints.get(_chain_key(t["topic_id"])),
+                "checked": results[t["topic_id"]][0],
+                "broken_id": results[t["topic_id"]][1]
+            }
+            for t in topics
+        ]
+
+        anchors_checked, anchor_broken_id = verify_ledger_anchors(cur)
+    else:
+        checked, broken_id = verify_vote_chain(cur, full=full)
+        conn.commit()
 
-        if expected != v["vote_hash"]:
-            tampered = True
-            break
+        chains = [
+            {
+                "label": "All votes",
+                "checkpoint_id": checkpoints.get(_chain_key(None)),
+                "checked": checked,
+                "broken_id": broken_id
+            }
+        ]
+
+    elapsed = time.perf_counter() - started
+    rows_checked = sum(c["checked"] for c in chains)
+    incremental = any(c["checkpoint_id"] for c in chains)
+
+    tampered = (
+        anchor_broken_id is not None
+        or any(c["broken_id"] is not None for c in chains)
+    )
 
-        prev_hash = v["vote_hash"]
+    # Roots for receipts are only published over a verified ledger
+    blocks_sealed = 0
+    if not tampered:
+        blocks_sealed = seal_merkle_blocks(cur)
+        conn.commit()
 
-    conn.close()
+    votes_unsealed = count_unsealed_votes(cur)
 
     branding = get_hoa_branding(schema)
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card">
-<h2>Vote Ledger Verification</h2>
-{% if tampered %}
-<p class="bad">TAMPER DETECTED — vote chain is invalid.</p>
-{% else %}
-<p class="ok">OK — vote chain is intact.</p>
-{% endif %}
-</div>
-""" + BASE_TAIL,
+    return render_page(
+        "admin_verify",
         tampered=tampered,
+        mode=mode,
+        chains=chains,
+        anchors_checked=anchors_checked,
+        anchor_broken_id=anchor_broken_id,
+        incremental=incremental,
+        rows_checked=rows_checked,
+        elapsed_ms=round(elapsed * 1000, 1),
+        rows_per_sec=int(rows_checked / elapsed) if elapsed else 0,
+        blocks_sealed=blocks_sealed,
+        votes_unsealed=votes_unsealed,
         branding=branding
     )
 
@@ -2864,16 +6464,7 @@ def admin_verify():
 # EXPORTS (CSV)
 # ======================================================
 
-@app.route("/admin/export")
-def admin_export():
-    if not session.get("admin_logged_in"):
-        return redirect("/admin/login")
-
-    schema = session.get("hoa_schema")
-    branding = get_hoa_branding(schema)
-
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
+register_page("admin_export", "admin", """
 <div class="card">
 <h2>Exports</h2>
 <ul>
@@ -2882,7 +6473,18 @@ def admin_export():
   <li><a href="/admin/export/registrations">Registrations / Quorum</a></li>
 </ul>
 </div>
-""" + BASE_TAIL,
+""")
+
+@app.route("/admin/export")
+def admin_export():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    schema = session.get("hoa_schema")
+    branding = get_hoa_branding(schema)
+
+    return render_page(
+        "admin_export",
         branding=branding
     )
 
@@ -2899,35 +6501,25 @@ def export_results():
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    cur.execute(
-        """
-        SELECT
-            t.title AS topic,
-            o.label AS option,
-            SUM(v.weight) AS total_votes
-        FROM votes v
-        JOIN topics t ON t.id = v.topic_id
-        JOIN options o ON o.id = v.option_id
-        GROUP BY t.title, o.label
-        ORDER BY t.title
-        """
-    )
-    rows = cur.fetchall()
-
-    conn.close()
+    def rows():
+        yield ["Topic", "Option", "Total Votes"]
 
-    out = StringIO()
-    writer = csv.writer(out, delimiter=';')
-    writer.writerow(["Topic", "Option", "Total Votes"])
-    for r in rows:
-        writer.writerow([r["topic"], r["option"], r["total_votes"]])
+        yield from export_rows(
+            schema,
+            """
+            SELECT
+                t.title AS topic,
+                o.label AS option,
+                SUM(tt.weight) AS total_votes
+            FROM topic_tallies tt
+            JOIN topics t ON t.id = tt.topic_id
+            JOIN options o ON o.id = tt.option_id
+            GROUP BY t.title, o.label
+            ORDER BY t.title
+            """
+        )
 
-    return send_file(
-        BytesIO(out.getvalue().encode()),
-        mimetype="text/csv",
-        as_attachment=True,
-        download_name="voting_results.csv"
-    )
+    return csv_response("voting_results.csv", rows())
 
 @app.route("/admin/export/developer")
 def export_developer():
@@ -2952,8 +6544,6 @@ def export_developer():
     )
     proxies = cur.fetchall()
 
-    conn.close()
-
     proxy_list = ",".join([p["erf"] for p in proxies])
 
     total_weight = (
@@ -3000,55 +6590,102 @@ def export_registrations():
     cur = conn.cursor()
     set_search_path(cur, schema)
 
-    cur.execute(
-        "SELECT erf, proxies FROM registrations ORDER BY erf"
-    )
-    regs = cur.fetchall()
+    def rows():
+        yield [
+            "ERF",
+            "Numeric Proxies",
+            "Eligible",
+            "Effective Weight"
+        ]
 
-    out = StringIO()
-    writer = csv.writer(out, delimiter=';')
+        total_weight = 0
 
-    writer.writerow([
-        "ERF",
-        "Numeric Proxies",
-        "Eligible",
-        "Effective Weight"
-    ])
+        for erf, proxies, weight in export_rows(
+            schema,
+            """
+            SELECT
+                r.erf,
+                r.proxies,
+                COALESCE(e.weight,0) AS weight
+            FROM registrations r
+            LEFT JOIN effective_weights e
+              ON e.erf = r.erf
+            ORDER BY r.erf
+            """
+        ):
+            eligible = "Y" if weight > 0 else "N"
 
-    total_weight = 0
+            total_weight += weight
 
-    for r in regs:
+            yield [
+                erf,
+                proxies or 0,
+                eligible,
+                weight
+            ]
 
-        numeric = r["proxies"] or 0
+        yield []
+        yield ["TOTAL", "", "", total_weight]
 
-        weight = compute_vote_weight(cur, r["erf"])
+    return csv_response("registrations_quorum.csv", rows())
 
-        eligible = "Y" if weight > 0 else "N"
+# ======================================================
+# HOA SETTINGS
+# ======================================================
 
-        total_weight += weight
+register_page("admin_settings", "admin", """
+<div class="card">
 
-        writer.writerow([
-            r["erf"],
-            numeric,
-            eligible,
-            weight
-        ])
+<h2>System Settings</h2>
 
-    writer.writerow([])
-    writer.writerow(["TOTAL", "", "", total_weight])
+<p>
+Configure the voting rules for this HOA.
+</p>
 
-    conn.close()
+<form method="post">
 
-    return send_file(
-        BytesIO(out.getvalue().encode()),
-        mimetype="text/csv",
-        as_attachment=True,
-        download_name="registrations_quorum.csv"
-    )
+<p>
+Quorum Threshold (%)
+<br>
+<input
+    type="number"
+    name="quorum_threshold"
+    min="1"
+    max="100"
+    value="{{ hoa.quorum_threshold or 50 }}">
+</p>
 
-# ======================================================
-# HOA SETTINGS
-# ======================================================
+<p>
+Vote Ledger
+<br>
+<select name="ledger_mode" {% if ledger_locked %}disabled{% endif %}>
+  <option value="global" {% if ledger_mode == "global" %}selected{% endif %}>
+    Global (one chain for all topics)
+  </option>
+  <option value="topic" {% if ledger_mode == "topic" %}selected{% endif %}>
+    Per topic (parallel voting on several topics)
+  </option>
+</select>
+<br>
+<small>
+{% if ledger_locked %}
+Fixed once voting has started (votes recorded or a topic open).
+{% else %}
+Can only be changed before voting starts.
+{% endif %}
+</small>
+</p>
+
+{% if ledger_error %}
+<p class="bad">{{ ledger_error }}</p>
+{% endif %}
+
+<button>Save Settings</button>
+
+</form>
+
+</div>
+""")
 
 @app.route("/admin/settings", methods=["GET", "POST"])
 def admin_settings():
@@ -3062,6 +6699,9 @@ def admin_settings():
 
     conn = get_conn()
     cur = conn.cursor()
+    set_search_path(cur, schema)
+
+    ledger_error = None
 
     if request.method == "POST":
 
@@ -3069,6 +6709,14 @@ def admin_settings():
             request.form.get("quorum_threshold", "50")
         )
 
+        ledger_mode = request.form.get("ledger_mode")
+        if ledger_mode and ledger_mode != get_ledger_mode(cur):
+            if not set_ledger_mode(cur, ledger_mode):
+                ledger_error = (
+                    "The ledger mode cannot be changed after voting "
+                    "has started."
+                )
+
         cur.execute(
             """
             UPDATE public.hoas
@@ -3078,6 +6726,9 @@ def admin_settings():
             (quorum_threshold, schema)
         )
 
+        invalidate_tenants(cur)
+        notify_live(cur, schema, LIVE_RESYNC)
+
         conn.commit()
 
     cur.execute(
@@ -3094,40 +6745,14 @@ def admin_settings():
 
     hoa = cur.fetchone()
 
-    conn.close()
-
     branding = get_hoa_branding(schema)
 
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card">
-
-<h2>System Settings</h2>
-
-<p>
-Configure the voting rules for this HOA.
-</p>
-
-<form method="post">
-
-<p>
-Quorum Threshold (%)
-<br>
-<input
-    type="number"
-    name="quorum_threshold"
-    min="1"
-    max="100"
-    value="{{ hoa.quorum_threshold or 50 }}">
-</p>
-
-<button>Save Settings</button>
-
-</form>
-
-</div>
-""" + BASE_TAIL,
+    return render_page(
+        "admin_settings",
         hoa=hoa,
+        ledger_mode=get_ledger_mode(cur),
+        ledger_locked=ledger_mode_locked(cur),
+        ledger_error=ledger_error,
         branding=branding
     )
 
@@ -3135,6 +6760,16 @@ Quorum Threshold (%)
 # RESET HOA DATA (ADMIN ONLY)
 # ======================================================
 
+register_page("admin_reset", "admin", """
+<div class="card bad">
+<h2>RESET HOA DATA</h2>
+<p>This will permanently delete all HOA voting data.</p>
+<form method="post">
+  <button>Confirm Reset</button>
+</form>
+</div>
+""")
+
 @app.route("/admin/reset", methods=["GET", "POST"])
 def admin_reset():
     if not session.get("admin_logged_in"):
@@ -3157,10 +6792,18 @@ def admin_reset():
                 developer_proxies,
                 topics,
                 options,
-                votes
+                votes,
+                effective_weights,
+                vote_topic_heads,
+                ledger_anchors,
+                ledger_checkpoints,
+                merkle_blocks,
+                topic_tallies
             RESTART IDENTITY
         """)
 
+        reset_vote_chain_head(cur)
+
         cur.execute("""
             UPDATE developer_settings
             SET is_active=FALSE,
@@ -3170,24 +6813,39 @@ def admin_reset():
             WHERE id=1
         """)
 
+        invalidate_owner_count(schema, cur)
+        notify_live(cur, schema, LIVE_RESYNC)
+
         conn.commit()
-        conn.close()
         return redirect("/admin")
 
     branding = get_hoa_branding(schema)
-    return render_template_string(
-        BASE_HEAD_ADMIN + """
-<div class="card bad">
-<h2>RESET HOA DATA</h2>
-<p>This will permanently delete all HOA voting data.</p>
-<form method="post">
-  <button>Confirm Reset</button>
-</form>
-</div>
-""" + BASE_TAIL,
+    return render_page(
+        "admin_reset",
 branding=branding
 )
 
+# ======================================================
+# RUNTIME STATS (OPERATORS)
+#
+# The figures are per worker process, not per HOA, so only
+# admins listed in STATS_OPERATORS may read them.
+# ======================================================
+
+@app.route("/admin/stats")
+def admin_stats():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin/login")
+
+    if session.get("admin_email") not in STATS_OPERATORS:
+        abort(403)
+
+    return jsonify(
+        pool=get_pool_stats(),
+        render=get_render_stats(),
+        admin_auth=get_hash_stats()
+    )
+
 # ======================================================
 # RENDER / LOCAL STARTUP
 # ======================================================
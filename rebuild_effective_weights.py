@@ -0,0 +1,61 @@
+"""
+Checks or rebuilds the effective_weights table of each HOA.
+
+Usage:
+    DATABASE_URL=... python rebuild_effective_weights.py [--check] [schema ...]
+
+Without schema names every HOA in public.hoas is processed.
+--check only reports drift and exits non-zero if any is found.
+Run it before an AGM.
+"""
+
+import sys
+
+from hoa_voting_app import (
+    app, get_conn, set_search_path,
+    check_effective_weights, rebuild_effective_weights
+)
+
+def main():
+    args = sys.argv[1:]
+    check_only = "--check" in args
+    schemas = [a for a in args if a != "--check"]
+
+    with app.app_context():
+        conn = get_conn()
+        cur = conn.cursor()
+
+        if not schemas:
+            cur.execute(
+                "SELECT schema_name FROM public.hoas ORDER BY schema_name"
+            )
+            schemas = [r["schema_name"] for r in cur.fetchall()]
+            conn.commit()
+
+        drift = 0
+
+        for schema in schemas:
+            set_search_path(cur, schema)
+
+            mismatches = check_effective_weights(cur)
+            drift += len(mismatches)
+
+            if not mismatches:
+                print(f"{schema}: OK")
+
+            else:
+                print(f"{schema}: {len(mismatches)} ERF(s) out of date")
+                for erf, stored, expected in mismatches:
+                    print(f"  {erf}: stored={stored} expected={expected}")
+
+                if not check_only:
+                    rebuild_effective_weights(cur)
+                    print(f"{schema}: rebuilt")
+
+            conn.commit()
+
+    if check_only and drift:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Scratch HOA schemas for the maintenance and benchmark scripts.
+
+Creates a throwaway schema with the same tables as a live HOA
+schema so scripts can generate estates and votes without
+touching real data. Never point these helpers at a schema that
+holds a real HOA.
+"""
+
+import random
+
+from psycopg2 import sql
+
+SCRATCH_TABLES = """
+CREATE TABLE owners (
+    erf TEXT PRIMARY KEY,
+    name TEXT,
+    id_number TEXT
+);
+
+CREATE TABLE registrations (
+    erf TEXT PRIMARY KEY,
+    proxies INTEGER DEFAULT 0,
+    otp TEXT
+);
+
+CREATE TABLE owner_proxies (
+    id SERIAL PRIMARY KEY,
+    primary_erf TEXT NOT NULL,
+    proxy_erf TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE developer_proxies (
+    id SERIAL PRIMARY KEY,
+    erf TEXT UNIQUE NOT NULL,
+    note TEXT
+);
+
+CREATE TABLE developer_settings (
+    id INTEGER PRIMARY KEY CHECK (id=1),
+    is_active BOOLEAN DEFAULT FALSE,
+    base_votes INTEGER DEFAULT 0,
+    proxy_count INTEGER DEFAULT 0,
+    comment TEXT
+);
+
+CREATE TABLE topics (
+    id SERIAL PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    is_open BOOLEAN DEFAULT FALSE,
+    vote_mode TEXT DEFAULT 'AGM'
+);
+
+CREATE TABLE options (
+    id SERIAL PRIMARY KEY,
+    topic_id INTEGER,
+    label TEXT
+);
+
+CREATE TABLE votes (
+    id SERIAL PRIMARY KEY,
+    topic_id INTEGER,
+    erf TEXT,
+    option_id INTEGER,
+    weight INTEGER,
+    prev_hash TEXT,
+    vote_hash TEXT,
+    timestamp TIMESTAMP
+);
+"""
+
+def create_scratch_schema(conn, schema):
+    """
+    (Re)creates schema with empty HOA tables and binds the
+    connection's search_path to it.
+    """
+    cur = conn.cursor()
+
+    cur.execute(
+        sql.SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(
+            sql.Identifier(schema)
+        )
+    )
+    cur.execute(
+        sql.SQL("CREATE SCHEMA {}").format(sql.Identifier(schema))
+    )
+    cur.execute(
+        sql.SQL("SET search_path TO {}, public").format(
+            sql.Identifier(schema)
+        )
+    )
+    cur.execute(SCRATCH_TABLES)
+
+    conn.commit()
+
+def drop_scratch_schema(conn, schema):
+    cur = conn.cursor()
+    cur.execute(
+        sql.SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(
+            sql.Identifier(schema)
+        )
+    )
+    conn.commit()
+
+def generate_estate(conn, rng=None, owners=300):
+    """
+    Fills the current scratch schema with a random estate:
+    owners, owner proxies, developer proxies, developer settings
+    and registrations, including combinations the admin screens
+    would normally refuse (e.g. a registered proxy ERF).
+
+    Returns the list of owner ERFs.
+    """
+    rng = rng or random.Random()
+    cur = conn.cursor()
+
+    erfs = [f"E{i}" for i in range(1, owners + 1)]
+
+    cur.executemany(
+        "INSERT INTO owners (erf, name, id_number) VALUES (%s, %s, %s)",
+        [(e, f"Owner {e}", f"ID{e}") for e in erfs]
+    )
+
+    pool = erfs[:]
+    rng.shuffle(pool)
+
+    # Owner proxies: proxy ERFs are unique, primaries may repeat
+    n_owner_proxies = rng.randint(0, owners // 4)
+    proxy_erfs = pool[:n_owner_proxies]
+    primaries = pool[n_owner_proxies:] or erfs
+
+    cur.executemany(
+        "INSERT INTO owner_proxies (primary_erf, proxy_erf) VALUES (%s, %s)",
+        [(rng.choice(primaries), p) for p in proxy_erfs]
+    )
+
+    # Developer proxies (may overlap owner proxies)
+    dev_proxies = rng.sample(erfs, rng.randint(0, owners // 10))
+
+    cur.executemany(
+        "INSERT INTO developer_proxies (erf) VALUES (%s)",
+        [(e,) for e in dev_proxies]
+    )
+
+    if rng.random() < 0.8:
+        cur.execute(
+            """
+            INSERT INTO developer_settings
+                (id, is_active, base_votes, proxy_count)
+            VALUES (1, %s, %s, %s)
+            """,
+            (
+                rng.random() < 0.6,
+                rng.randint(0, 50),
+                rng.randint(0, 10)
+            )
+        )
+
+    registered = rng.sample(erfs, rng.randint(0, owners))
+    if rng.random() < 0.5:
+        registered.append("DEVELOPER")
+
+    cur.executemany(
+        "INSERT INTO registrations (erf, proxies, otp) VALUES (%s, %s, %s)",
+        [(e, rng.randint(0, 3), "X") for e in registered]
+    )
+
+    conn.commit()
+    return erfs
@@ -0,0 +1,214 @@
+"""
+Concurrency harness for the vote ledger.
+
+Fires votes from many threads (one connection each) into a
+scratch schema through append_vote(), including duplicate
+attempts, then verifies the hash chain and reports throughput.
+--per-topic runs the ledger in per-topic mode and also checks
+the cross-topic anchors.
+
+Usage:
+    DATABASE_URL=... python stress_vote_chain.py [--per-topic] [votes] [workers] [topics]
+
+Exits non-zero if the chain is broken or a duplicate got in.
+"""
+
+import sys
+import time
+import random
+import threading
+from queue import Queue, Empty
+
+from psycopg2 import sql
+
+from hoa_voting_app import (
+    get_conn, ensure_schema_objects, append_vote, set_ledger_mode,
+    anchor_ledger, verify_vote_chain, verify_ledger_anchors
+)
+from scratch_estate import create_scratch_schema, drop_scratch_schema
+
+SCRATCH_SCHEMA = "vote_chain_scratch"
+
+# Share of attempts that repeat an (erf, topic) already queued
+DUPLICATE_RATE = 0.05
+
+def setup(conn, votes, topics, mode):
+    create_scratch_schema(conn, SCRATCH_SCHEMA)
+    cur = conn.cursor()
+
+    ensure_schema_objects(cur, SCRATCH_SCHEMA)
+    set_ledger_mode(cur, mode)
+
+    owners = -(-votes // topics)
+    cur.executemany(
+        "INSERT INTO owners (erf, name) VALUES (%s, %s)",
+        [(f"E{i}", f"Owner {i}") for i in range(1, owners + 1)]
+    )
+
+    topic_ids = []
+    for t in range(topics):
+        cur.execute(
+            "INSERT INTO topics (title, is_open) VALUES (%s, TRUE) RETURNING id",
+            (f"Topic {t + 1}",)
+        )
+        topic_id = cur.fetchone()["id"]
+        cur.execute(
+            "INSERT INTO options (topic_id, label) VALUES (%s, 'Yes'), (%s, 'No') RETURNING id",
+            (topic_id, topic_id)
+        )
+        topic_ids.append((topic_id, [r["id"] for r in cur.fetchall()]))
+
+    conn.commit()
+
+    attempts = [
+        (topic_id, f"E{i}", random.choice(option_ids))
+        for topic_id, option_ids in topic_ids
+        for i in range(1, owners + 1)
+    ][:votes]
+
+    attempts += random.sample(attempts, int(len(attempts) * DUPLICATE_RATE))
+    random.shuffle(attempts)
+
+    return attempts
+
+def worker(queue, results, errors):
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        sql.SQL("SET search_path TO {}, public").format(
+            sql.Identifier(SCRATCH_SCHEMA)
+        )
+    )
+    conn.commit()
+
+    appended = rejected = 0
+
+    try:
+        while True:
+            try:
+                topic_id, erf, option_id = queue.get_nowait()
+            except Empty:
+                break
+
+            if append_vote(cur, topic_id, erf, option_id, 1) is None:
+                rejected += 1
+                conn.rollback()
+            else:
+                appended += 1
+                conn.commit()
+
+    except Exception as e:
+        errors.append(e)
+
+    finally:
+        conn.close()
+        results.append((appended, rejected))
+
+def verify(cur, mode, topic_ids):
+    if mode == "global":
+        return verify_vote_chain(cur)
+
+    checked = 0
+    for topic_id in topic_ids:
+        n, broken_id = verify_vote_chain(cur, topic_id)
+        checked += n
+        if broken_id is not None:
+            return checked, broken_id
+
+    return checked, None
+
+def main():
+    args = sys.argv[1:]
+    mode = "topic" if "--per-topic" in args else "global"
+    args = [a for a in args if a != "--per-topic"]
+
+    votes = int(args[0]) if len(args) > 0 else 5000
+    workers = int(args[1]) if len(args) > 1 else 32
+    topics = int(args[2]) if len(args) > 2 else 4
+
+    conn = get_conn()
+
+    try:
+        attempts = setup(conn, votes, topics, mode)
+        unique = len(set((t, e) for t, e, _ in attempts))
+
+        queue = Queue()
+        for a in attempts:
+            queue.put(a)
+
+        results, errors = [], []
+        threads = [
+            threading.Thread(target=worker, args=(queue, results, errors))
+            for _ in range(workers)
+        ]
+
+        print(
+            f"Appending {len(attempts)} votes ({unique} unique) "
+            f"from {workers} workers over {topics} topics "
+            f"({mode} ledger)..."
+        )
+
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+        if errors:
+            print(f"FAILED: {len(errors)} workers raised, first: {errors[0]!r}")
+            sys.exit(1)
+
+        appended = sum(a for a, _ in results)
+        rejected = sum(r for _, r in results)
+
+        print(
+            f"Appended {appended}, rejected {rejected} duplicates "
+            f"in {elapsed:.2f}s ({appended / elapsed:.0f} votes/s)"
+        )
+
+        cur = conn.cursor()
+        cur.execute(
+            sql.SQL("SET search_path TO {}, public").format(
+                sql.Identifier(SCRATCH_SCHEMA)
+            )
+        )
+
+        started = time.perf_counter()
+        checked, broken_id = verify(
+            cur, mode, sorted(set(t for t, _, _ in attempts))
+        )
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"Verified {checked} votes in {elapsed:.2f}s "
+            f"({checked / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+
+        if broken_id is not None:
+            print(f"FAILED: chain broken at vote id {broken_id}")
+            sys.exit(1)
+
+        if mode == "topic":
+            anchor_ledger(cur)
+            anchors, anchor_broken_id = verify_ledger_anchors(cur)
+
+            print(f"Checked {anchors} cross-topic anchors")
+
+            if anchor_broken_id is not None:
+                print(f"FAILED: anchor {anchor_broken_id} does not match")
+                sys.exit(1)
+
+        if appended != unique:
+            print(f"FAILED: expected {unique} votes, got {appended}")
+            sys.exit(1)
+
+        print("Chain intact.")
+
+    finally:
+        conn.rollback()
+        drop_scratch_schema(conn, SCRATCH_SCHEMA)
+        conn.close()
+
+if __name__ == "__main__":
+    main()
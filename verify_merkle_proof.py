@@ -0,0 +1,95 @@
+"""
+Offline check of a vote receipt (Merkle inclusion proof).
+
+Download the proof from "My vote receipts" on the voting site
+(or /vote/<hoa>/proof/<vote id>) and run:
+
+    python verify_merkle_proof.py proof.json [--root <block root>]
+
+It recomputes the vote hash from the vote's fields, walks the
+proof path up to the block root and compares the result with
+the root in the proof (and with --root, if the HOA published
+one). A "pending" file means the vote's block was not sealed
+yet; download it again later. Needs only the Python standard library. The hashing
+must stay in step with compute_vote_hash(), merkle_leaf() and
+merkle_node() in hoa_voting_app.py.
+"""
+
+import sys
+import json
+import hashlib
+
+def sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def check_proof(proof, expected_root=None):
+    """
+    Returns a list of problems; empty if the proof holds.
+    """
+    problems = []
+    vote = proof["vote"]
+
+    vote_hash = sha256(
+        f"{vote['prev_hash']}|{vote['erf']}|{vote['topic_id']}|"
+        f"{vote['option_id']}|{vote['weight']}|{vote['timestamp']}"
+    )
+    if vote_hash != vote["vote_hash"]:
+        problems.append("vote fields do not match the vote hash")
+
+    node = sha256(f"L|{vote['vote_hash']}")
+    for step in proof["path"]:
+        if step["side"] == "left":
+            node = sha256(f"N|{step['hash']}|{node}")
+        else:
+            node = sha256(f"N|{node}|{step['hash']}")
+
+    root = proof["block"]["root"]
+    if node != root:
+        problems.append("proof path does not lead to the block root")
+
+    if expected_root and expected_root != root:
+        problems.append("block root differs from the published root")
+
+    return problems
+
+def main():
+    args = sys.argv[1:]
+    expected_root = None
+
+    if "--root" in args:
+        i = args.index("--root")
+        expected_root = args[i + 1]
+        del args[i:i + 2]
+
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    with open(args[0], encoding="utf-8") as f:
+        proof = json.load(f)
+
+    vote, block = proof["vote"], proof["block"]
+
+    if proof.get("status") == "pending":
+        print(
+            f"PENDING: vote {vote['id']} is in block {block['block_no']}, "
+            "which has not been sealed yet; download the proof again later"
+        )
+        sys.exit(1)
+
+    print(
+        f"Vote {vote['id']} (ERF {vote['erf']}, topic {vote['topic_id']}) "
+        f"in block {block['block_no']} of HOA {proof.get('hoa', '?')}"
+    )
+
+    problems = check_proof(proof, expected_root)
+
+    if problems:
+        for p in problems:
+            print(f"INVALID: {p}")
+        sys.exit(1)
+
+    print(f"VALID: included under root {block['root']}")
+
+if __name__ == "__main__":
+    main()